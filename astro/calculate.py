@@ -1,87 +1,419 @@
-from astro.schema import ChartSchema, SettingsSchema, ChartCollectionSchema, RelationshipCollectionSchema
-from astro.chart import create_summary, calculate_houses, calculate_relationships, \
-    calculate_condition, create_points_with_attributes, calculate_is_day_time, calculate_transits
+import hashlib
+from datetime import timedelta
+from typing import List, Tuple, Optional, Dict, Set
 
+import orjson
 
-def create_chart(settings: SettingsSchema) -> ChartCollectionSchema:
+from astro.util import HouseSystem, EventType, create_field_mask, includes_field
+from astro.schema import ChartSchema, SettingsSchema, ChartCollectionSchema, RelationshipCollectionSchema, \
+    PointSchema, EventSettingsSchema, RelationshipSchema, PointMap, ReturnSettingsSchema, ReturnCollectionSchema, \
+    ReturnSchema
+from astro.chart import create_summary, calculate_houses, calculate_house_comparison, calculate_relationships, \
+    calculate_condition, create_points_with_attributes, calculate_is_day_time, calculate_transits, \
+    compact_relationships, compact_relationship_columns, calculate_precession_correction_degrees, \
+    create_progressed_event_settings, create_solar_arc_points, find_return_julian_days, return_periods, \
+    calculate_prenatal_lunation, create_derived_event_settings, create_composite_points, are_charts_related, \
+    find_relationship_candidates
+from astro.chart.point.ephemeris import get_julian_day, get_longitude_and_velocity, get_sidereal_offset
+from astro.collection import point_traits
+
+
+def create_chart(
+        settings: SettingsSchema,
+        previous: Optional[ChartCollectionSchema] = None
+) -> ChartCollectionSchema:
     """
     Calculates the default settings for the given time.
 
+    - If a previous chart calculated with the same settings is given, bodies that have barely moved
+      and the relationships between unchanged points are reused from it.
+    - Any progressed and solar arc charts are calculated directly after the chart they progress.
+    - Any composite and Davison charts are calculated after all other charts, and only related to the pair of
+      charts each is derived from.
+
     :param settings: The current calculation settings.
+    :param previous: A previously calculated chart for slightly different times or locations.
 
     :return: Calculated points and aspects.
     """
+    settings = apply_field_mask(settings)
+    field_mask = create_field_mask(settings.field_mask)
+    events, solar_arc_natal_indices = create_progressed_event_settings(settings.events)
+    events, derived_sources = create_derived_event_settings(events, settings)
+    settings = settings.copy(update={"events": events})
     chart_count = len(settings.events)
     all_points_and_events = []
     all_charts = []
     all_relationships = []
+    all_changed_points = []
+
+    relationship_settings_hash = create_relationship_settings_hash(settings)
+
+    if previous and len(previous.charts) != chart_count:
+        previous = None
+
+    previous_relationships = create_previous_relationships(previous, relationship_settings_hash)
 
     # Store each event's calculated points, conditions, and aspects.
     for event_index in range(chart_count):
         event_settings = settings.events[event_index]
         event = event_settings.event
+        previous_chart = previous.charts[event_index] if previous else None
+
+        if event_index in solar_arc_natal_indices:
+            natal_points, natal_event_settings = all_points_and_events[solar_arc_natal_indices[event_index]]
+            points = create_solar_arc_points(
+                {point.name: point for point in natal_points},
+                natal_event_settings.event,
+                event,
+                settings
+            )
+        elif event.type == EventType.composite:
+            from_points, to_points = [
+                {point.name: point for point in all_points_and_events[source_index][0]}
+                for source_index in derived_sources[event_index]
+            ]
+            points = create_composite_points(from_points, to_points, settings)
+        else:
+            points = create_points_with_attributes(
+                event_settings,
+                settings,
+                (previous_chart.points, previous_chart.event) if previous_chart else None
+            )
 
-        points = create_points_with_attributes(event_settings, settings)
         points_array = [point for point in points.values()]
         points_and_event = (points_array, event_settings)
+        changed_points = find_changed_points(points, previous_chart.points if previous_chart else None)
 
+        # Only whole sign houses follow from harmonic, directed, or composite positions, since cusps are not moved.
+        house_event = event if event_settings.harmonic == 1 and \
+            event.type not in [EventType.solar_arc, EventType.composite] else None
         is_day_time = calculate_is_day_time(points)
         summary = create_summary(points, is_day_time)
-        houses_whole_sign, houses_secondary = calculate_houses(points, event, settings)
+        houses_whole_sign, houses_secondary = calculate_houses(points, house_event, settings)
+        houses_comparison = calculate_house_comparison(points, house_event, settings)
         calculate_condition(points, is_day_time, settings)
-        transits = calculate_transits(event_settings, points_array)
+        prenatal_lunation = calculate_prenatal_lunation(event.julian_day, settings.sidereal_ayanamsa) \
+            if settings.calculate_prenatal_lunation else None
+        transits = calculate_transits(event_settings, points_array, settings) \
+            if includes_field(field_mask, "charts.transits") else []
 
+        candidates = find_relationship_candidates([points_and_event], [(0, 0)], settings)
         relationships = calculate_relationships(
             points_and_event,
             points_and_event,
             True,
-            settings
+            settings,
+            find_previous_relationships(
+                previous_relationships, (event_index, changed_points), (event_index, changed_points)),
+            candidates[0] if candidates is not None else None
         )
 
         all_points_and_events.append(points_and_event)
+        all_changed_points.append(changed_points)
 
         all_charts.append(ChartSchema(
             event=event,
+            harmonic=event_settings.harmonic,
+            derived_from=list(derived_sources.get(event_index, [])),
             points=points,
-            secondary_house_system=settings.secondary_house_system,
+            secondary_house_system=settings.secondary_house_system
+            if house_event and settings.calculate_secondary_houses else HouseSystem.whole_sign,
             houses_whole_sign=houses_whole_sign,
             houses_secondary=houses_secondary,
+            houses_comparison=houses_comparison,
             summary=summary,
+            prenatal_lunation=prenatal_lunation,
             transits=transits
         ))
 
-        all_relationships.append(RelationshipCollectionSchema(
-            from_chart_index=event_index,
-            from_chart_type=event.type,
-            to_chart_index=event_index,
-            to_chart_type=event.type,
-            name=f"{event.name} & {event.name}",
-            relationships=relationships
+        all_relationships.append(create_relationship_collection(
+            (event_index, points_and_event),
+            (event_index, points_and_event),
+            relationships,
+            settings
         ))
 
-    # Store the aspects between all sets of distinct charts.
-    for from_index in range(chart_count - 1):
-        for to_index in range(from_index + 1, chart_count):
-            from_event = all_points_and_events[from_index][1].event
-            to_event = all_points_and_events[to_index][1].event
+    # Store the aspects between all sets of distinct charts, screening every pair of charts for aspects at once.
+    chart_pairs = [
+        (from_index, to_index)
+        for from_index in range(chart_count - 1)
+        for to_index in range(from_index + 1, chart_count)
+        if are_charts_related(from_index, to_index, derived_sources)
+    ]
+    all_candidates = find_relationship_candidates(all_points_and_events, chart_pairs, settings)
 
-            relationships = calculate_relationships(
-                all_points_and_events[from_index],
-                all_points_and_events[to_index],
-                False,
-                settings
-            )
+    for pair_index, (from_index, to_index) in enumerate(chart_pairs):
+        from_event = all_points_and_events[from_index][1].event
+        to_event = all_points_and_events[to_index][1].event
+        is_same_correction = previous is not None and \
+            calculate_precession_correction_degrees(from_event, to_event) == \
+            calculate_precession_correction_degrees(
+                previous.charts[from_index].event, previous.charts[to_index].event)
 
-            all_relationships.append(RelationshipCollectionSchema(
-                from_chart_index=from_index,
-                from_chart_type=from_event.type,
-                to_chart_index=to_index,
-                to_chart_type=to_event.type,
-                name=f"{from_event.name} & {to_event.name}",
-                relationships=relationships
-            ))
+        relationships = calculate_relationships(
+            all_points_and_events[from_index],
+            all_points_and_events[to_index],
+            False,
+            settings,
+            find_previous_relationships(
+                previous_relationships,
+                (from_index, all_changed_points[from_index]),
+                (to_index, all_changed_points[to_index])
+            ) if is_same_correction else None,
+            all_candidates[pair_index] if all_candidates is not None else None
+        )
+
+        all_relationships.append(create_relationship_collection(
+            (from_index, all_points_and_events[from_index]),
+            (to_index, all_points_and_events[to_index]),
+            relationships,
+            settings
+        ))
 
     return ChartCollectionSchema(
         charts=all_charts,
-        relationships=all_relationships
+        relationships=all_relationships,
+        relationship_settings_hash=relationship_settings_hash
     )
+
+
+def create_returns(settings: ReturnSettingsSchema) -> ReturnCollectionSchema:
+    """
+    Finds the exact times that the sun or moon returns to its natal longitude, and the chart at each return.
+
+    - Every return is solved at once, so many years of returns can be found in one call.
+    - With a sidereal ayanamsa, returns are to the natal longitude in the sidereal zodiac.
+
+    :param settings: The natal event, the type and number of returns, and the return chart settings.
+
+    :return: The time and chart of each return.
+    """
+    natal_event = settings.event.event
+    point, period = return_periods[settings.type]
+    swe_id = point_traits.points[point].swe_id
+    ayanamsa = settings.settings.sidereal_ayanamsa
+    natal_day = get_julian_day(natal_event.utc_date)
+    natal_longitude = \
+        (get_longitude_and_velocity(natal_day, swe_id)[0] - get_sidereal_offset(natal_day, ayanamsa)) % 360
+    return_days = find_return_julian_days(
+        swe_id, natal_longitude, get_julian_day(settings.start_date), period, settings.count, ayanamsa)
+    returns = []
+
+    for return_day in return_days.tolist():
+        utc_date = natal_event.utc_date + timedelta(days=return_day - natal_day)
+        chart = None
+
+        if settings.include_charts:
+            return_event = natal_event.copy(update={
+                "name": f"{natal_event.name} {settings.type}",
+                "type": EventType(settings.type),
+                "utc_date": utc_date,
+                "local_date": natal_event.local_date + (utc_date - natal_event.utc_date),
+                "latitude": natal_event.latitude if settings.latitude is None else settings.latitude,
+                "longitude": natal_event.longitude if settings.longitude is None else settings.longitude,
+            })
+            chart = create_chart(settings.settings.copy(update={"events": [settings.event.copy(update={
+                "event": return_event,
+                "transits": None,
+                "progress_to": None,
+                "solar_arc_to": None,
+            })]}))
+
+        returns.append(ReturnSchema(utc_date=utc_date, julian_day=return_day, chart=chart))
+
+    return ReturnCollectionSchema(type=settings.type, natal_longitude=natal_longitude, returns=returns)
+
+
+def find_changed_points(points: PointMap, previous_points: Optional[PointMap] = None) -> Set[str]:
+    """
+    Finds the names of the points whose positions differ from a previous chart's points.
+
+    :param points: The calculated points.
+    :param previous_points: The points of the previous chart, if any.
+
+    :return: The names of all new or moved points.
+    """
+    if previous_points is None:
+        return set(points.keys())
+
+    changed_points = set()
+
+    for name, point in points.items():
+        previous_point = previous_points.get(name)
+
+        if not previous_point \
+                or point.longitude != previous_point.longitude \
+                or point.longitude_velocity != previous_point.longitude_velocity \
+                or point.declination != previous_point.declination \
+                or point.declination_velocity != previous_point.declination_velocity:
+            changed_points.add(name)
+
+    return changed_points
+
+
+def create_relationship_settings_hash(settings: SettingsSchema) -> str:
+    """
+    Hashes the settings that relationships are calculated with, such as each event's enabled points, orbs,
+    and aspects.
+
+    - The hash is stable between processes, so a previous chart sent back by a client can be compared.
+
+    :param settings: The current calculation settings, including any progressed and derived events.
+
+    :return: The hex digest of the relationship settings.
+    """
+    relationship_settings = {
+        "enabled": [event_settings.dict()["enabled"] for event_settings in settings.events],
+        **settings.dict(include={
+            "sidereal_ayanamsa",
+            "aspect_sort",
+            "calculate_relationships",
+            "calculate_relationship_phase",
+            "calculate_relationship_movement",
+            "remove_empty_relationships",
+            "min_relationship_significance",
+        }),
+    }
+
+    return hashlib.sha256(orjson.dumps(relationship_settings, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def create_previous_relationships(
+        previous: Optional[ChartCollectionSchema] = None,
+        relationship_settings_hash: Optional[str] = None
+) -> Dict[Tuple[int, int], List[RelationshipSchema]]:
+    """
+    Maps the indices of each pair of charts to their relationships in a previous chart.
+
+    - Compacted relationships are not reused, since they no longer contain every aspect.
+    - Relationships calculated with different settings, such as other orbs or aspects, are not reused.
+
+    :param previous: A previously calculated chart, if any.
+    :param relationship_settings_hash: The hash of the current relationship settings.
+
+    :return: The previous relationships by from and to chart index.
+    """
+    if previous is None or previous.relationship_settings_hash != relationship_settings_hash:
+        return {}
+
+    return {
+        (collection.from_chart_index, collection.to_chart_index): collection.relationships
+        for collection in previous.relationships
+        if not collection.compact_relationships
+    }
+
+
+def find_previous_relationships(
+        previous_relationships: Dict[Tuple[int, int], List[RelationshipSchema]],
+        from_chart: Tuple[int, Set[str]],
+        to_chart: Tuple[int, Set[str]]
+) -> Optional[Tuple[List[RelationshipSchema], Set[str], Set[str]]]:
+    """
+    Finds the previous relationships between two charts to reuse, along with each chart's changed points.
+
+    :param previous_relationships: The previous relationships by from and to chart index.
+    :param from_chart: The index of the chart the relationships are from, and its changed points.
+    :param to_chart: The index of the chart the relationships are to, and its changed points.
+
+    :return: The previous relationships and changed points, or None if there are no previous relationships.
+    """
+    from_index, from_changed_points = from_chart
+    to_index, to_changed_points = to_chart
+    relationships = previous_relationships.get((from_index, to_index))
+
+    if relationships is None:
+        return None
+
+    return relationships, from_changed_points, to_changed_points
+
+
+def create_relationship_collection(
+        from_chart: Tuple[int, Tuple[List[PointSchema], EventSettingsSchema]],
+        to_chart: Tuple[int, Tuple[List[PointSchema], EventSettingsSchema]],
+        relationships: List[RelationshipSchema],
+        settings: SettingsSchema
+) -> RelationshipCollectionSchema:
+    """
+    Creates the collection of relationships between two charts.
+
+    - If relationships are compacted, they are stored as rows of point indices and aspects.
+
+    :param from_chart: The index of the chart the relationships are from, and its points and event.
+    :param to_chart: The index of the chart the relationships are to, and its points and event.
+    :param relationships: The calculated relationships.
+    :param settings: The current calculation settings.
+
+    :return: The collection of relationships.
+    """
+    from_index, (from_points, from_event_settings) = from_chart
+    to_index, (to_points, to_event_settings) = to_chart
+    from_event, to_event = from_event_settings.event, to_event_settings.event
+    collection = RelationshipCollectionSchema(
+        from_chart_index=from_index,
+        from_chart_type=from_event.type,
+        to_chart_index=to_index,
+        to_chart_type=to_event.type,
+        name=f"{from_event.name} & {to_event.name}",
+    )
+
+    if settings.compact_relationships:
+        collection.compact_columns = compact_relationship_columns
+        collection.compact_relationships = compact_relationships(relationships, from_points, to_points)
+    else:
+        collection.relationships = relationships
+
+    return collection
+
+
+def apply_field_mask(settings: SettingsSchema) -> SettingsSchema:
+    """
+    Disables the calculation of any fields that are not requested by the settings' field mask.
+
+    :param settings: The current calculation settings.
+
+    :return: A copy of the settings with calculations disabled for unrequested fields.
+    """
+    if not settings.field_mask:
+        return settings
+
+    field_mask = create_field_mask(settings.field_mask)
+
+    def includes(*paths: str) -> bool:
+        return any(includes_field(field_mask, path) for path in paths)
+
+    aspect_paths = [
+        f"relationships.relationships.{aspect}_aspect"
+        for aspect in ["ecliptic", "precession_corrected", "declination"]
+    ]
+    includes_compact = includes("relationships.compact_relationships")
+    includes_condition = includes("charts.points.condition", "charts.points.divisions")
+    includes_phase = includes(
+        "relationships.relationships.phase",
+        "relationships.relationships.phase_base_point",
+        "relationships.relationships.arc_ordered",
+    )
+    includes_movement = includes(
+        *[f"{path}.movement" for path in aspect_paths],
+        *[f"{path}.relative_velocity" for path in aspect_paths],
+    )
+    includes_secondary_houses = includes(
+        "charts.secondary_house_system",
+        "charts.houses_secondary",
+        "charts.points.houses_secondary",
+    )
+
+    return settings.copy(update={
+        "calculate_condition": settings.calculate_condition and includes_condition,
+        "calculate_divisions": settings.calculate_divisions and includes_condition,
+        "calculate_prenatal_lunation":
+            settings.calculate_prenatal_lunation and includes("charts.prenatal_lunation"),
+        "calculate_relationships": settings.calculate_relationships and includes("relationships"),
+        "calculate_relationship_phase":
+            settings.calculate_relationship_phase and (includes_phase or includes_compact),
+        "calculate_relationship_movement":
+            settings.calculate_relationship_movement and (includes_movement or includes_compact),
+        "calculate_secondary_houses": settings.calculate_secondary_houses and includes_secondary_houses,
+        "compare_house_systems":
+            settings.compare_house_systems if includes("charts.houses_comparison") else [],
+    })
@@ -4,3 +4,13 @@ from .houses import *
 from .condition import *
 from .relationship import *
 from .transit import *
+from .angle_series import *
+from .midpoint_tree import *
+from .harmonic_spectrum import *
+from .progression import *
+from .returns import *
+from .lunation import *
+from .fixed_stars import *
+from .astrocartography import *
+from .relocation import *
+from .composite import *
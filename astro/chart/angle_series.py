@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy as np
+
+from astro.chart.point.ephemeris import get_julian_day, get_obliquity, get_sidereal_time, \
+    get_house_cusps_from_armc, get_angle_house_cusps, angle_house_systems
+from astro.schema import AngleSeriesSettingsSchema, AngleSeriesSchema, AngleChangeSchema
+from astro.util import Point, armc_to_angles, zodiac_sign_order, wrap_degrees, to_utc_date
+
+sidereal_degrees_per_day = 360.98564736629
+"""
+The degrees the sidereal time advances per solar day.
+"""
+
+
+def calculate_angle_series(settings: AngleSeriesSettingsSchema) -> AngleSeriesSchema:
+    """
+    Calculates the angles and house cusps at each poll within a time range.
+
+    - Only the sidereal time changes between polls, so it is advanced from the start of the range
+      and the obliquity is calculated once for the whole range.
+
+    :param settings: The time range, location, and house system.
+
+    :return: The angles and house cusps at each time, and when the Ascendant and Midheaven change degree.
+    """
+    event = settings.event
+    start_date, end_date = to_utc_date(event.utc_date), to_utc_date(event.utc_end_date)
+    start_day = get_julian_day(start_date)
+    range_minutes = (end_date - start_date).total_seconds() / 60
+    poll_minutes = np.arange(int(range_minutes // settings.minutes_per_poll) + 1) * settings.minutes_per_poll
+    jul_days = start_day + poll_minutes / 60 / 24
+
+    obliquity = get_obliquity(start_day)
+    armcs = (get_sidereal_time(start_day) + event.longitude +
+             sidereal_degrees_per_day * (jul_days - start_day)) % 360
+    ascendants, midheavens, vertices = armc_to_angles(armcs, event.latitude, obliquity)
+
+    if settings.house_system in angle_house_systems:
+        cusps = [
+            get_angle_house_cusps(asc, mc, settings.house_system)
+            for asc, mc in zip(ascendants.tolist(), midheavens.tolist())
+        ]
+    else:
+        cusps = [
+            get_house_cusps_from_armc(armc, event.latitude, obliquity, settings.house_system)
+            for armc in armcs.tolist()
+        ]
+
+    changes = find_angle_changes(Point.ascendant, start_date, jul_days, ascendants) + \
+        find_angle_changes(Point.midheaven, start_date, jul_days, midheavens)
+    changes.sort(key=lambda change: change.utc_date)
+
+    return AngleSeriesSchema(
+        house_system=settings.house_system,
+        utc_dates=[start_date + timedelta(minutes=minutes) for minutes in poll_minutes.tolist()],
+        ascendant=ascendants.tolist(),
+        midheaven=midheavens.tolist(),
+        vertex=vertices.tolist(),
+        cusps=[list(house_cusps) for house_cusps in cusps],
+        changes=changes,
+    )
+
+
+def find_angle_changes(
+        angle: Point,
+        start_date: datetime,
+        jul_days: np.ndarray,
+        longitudes: np.ndarray
+) -> List[AngleChangeSchema]:
+    """
+    Finds each time an angle enters a new degree, interpolating between polls.
+
+    - The angle may move forward or backward through the zodiac. Near the poles the Ascendant can flip
+      to the opposite side of the zodiac between polls, so steps of more than 90 degrees are skipped
+      instead of interpolated.
+
+    :param angle: The angle that the longitudes are for.
+    :param start_date: The UTC date of the first poll.
+    :param jul_days: The julian day of each poll.
+    :param longitudes: The longitude of the angle at each poll.
+
+    :return: Each degree change of the angle.
+    """
+    changes = []
+    arcs = wrap_degrees(np.diff(longitudes))
+    # The whole degree boundaries crossed between each poll, from first_boundaries up to last_boundaries.
+    first_boundaries = np.floor(np.minimum(longitudes[:-1], longitudes[:-1] + arcs)) + 1
+    last_boundaries = np.floor(np.maximum(longitudes[:-1], longitudes[:-1] + arcs))
+    crossed_boundaries = np.where(np.abs(arcs) > 90, 0, last_boundaries - first_boundaries + 1)
+
+    for index in np.nonzero(crossed_boundaries)[0].tolist():
+        for boundary in range(int(first_boundaries[index]), int(last_boundaries[index]) + 1):
+            fraction = (boundary - longitudes[index]) / arcs[index]
+            jul_day = jul_days[index] + fraction * (jul_days[index + 1] - jul_days[index])
+            # Moving backward across a boundary enters the degree below it.
+            longitude = float((boundary if arcs[index] > 0 else boundary - 1) % 360)
+
+            changes.append(AngleChangeSchema(
+                name=angle,
+                utc_date=start_date + timedelta(days=jul_day - jul_days[0]),
+                longitude=longitude,
+                sign=zodiac_sign_order[int(longitude / 30)],
+                degrees_in_sign=int(longitude % 30),
+                is_sign_change=boundary % 30 == 0,
+            ))
+
+    return changes
@@ -0,0 +1,112 @@
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from astro.chart.point.ephemeris import get_julian_day, get_sidereal_time, get_right_ascension_and_declination
+from astro.collection import point_traits
+from astro.schema import AstrocartographySettingsSchema, AstrocartographyCollectionSchema, \
+    AstrocartographyLineSchema, AstrocartographyLinePropertiesSchema, GeoJsonMultiLineStringSchema
+from astro.util import Point, calculate_semi_diurnal_arcs, wrap_degrees
+
+coordinate_digits = 4
+"""
+The decimal places that line coordinates are rounded to.
+"""
+
+
+def calculate_astrocartography(settings: AstrocartographySettingsSchema) -> AstrocartographyCollectionSchema:
+    """
+    Calculates the lines on a world map where each point is on each angle at the time of an event.
+
+    - The right ascension and declination of each point are calculated once, then the longitudes of every line
+      are calculated at every latitude at once.
+
+    :param settings: The event time, the points and angles to draw, and the latitudes to draw them over.
+
+    :return: A GeoJSON feature collection of the line of each point on each angle.
+    """
+    jul_day = get_julian_day(settings.event.event.utc_date)
+    points = [point for point in settings.points if point in point_traits.points]
+    right_ascensions, declinations = np.array([
+        get_right_ascension_and_declination(jul_day, point_traits.points[point].swe_id)
+        for point in points
+    ], dtype=float).reshape(len(points), 2).T
+    latitudes = np.linspace(
+        -settings.max_latitude,
+        settings.max_latitude,
+        int(round(2 * settings.max_latitude / settings.latitude_step)) + 1
+    )
+    angle_longitudes = calculate_angle_longitudes(
+        right_ascensions, declinations, latitudes, get_sidereal_time(jul_day))
+    features = []
+
+    for index, point in enumerate(points):
+        for angle in settings.angles:
+            if angle not in angle_longitudes:
+                continue
+
+            # Meridian lines are straight, so only their ends are needed.
+            is_meridian = angle in [Point.midheaven, Point.inner_heaven]
+            line_latitudes = latitudes[[0, -1]] if is_meridian else latitudes
+            line_longitudes = angle_longitudes[angle][index][[0, -1]] if is_meridian else angle_longitudes[angle][index]
+
+            features.append(AstrocartographyLineSchema(
+                geometry=GeoJsonMultiLineStringSchema(coordinates=split_line(line_longitudes, line_latitudes)),
+                properties=AstrocartographyLinePropertiesSchema(point=point, angle=angle),
+            ))
+
+    return AstrocartographyCollectionSchema(features=features)
+
+
+def calculate_angle_longitudes(
+        right_ascensions: Iterable[float],
+        declinations: Iterable[float],
+        latitudes: Iterable[float],
+        sidereal_time: float
+) -> Dict[Point, np.ndarray]:
+    """
+    Calculates the geographic longitudes where each point is on each angle, at each latitude.
+
+    - A point culminates where the local sidereal time equals its right ascension, and rises and sets
+      a semi-diurnal arc before and after that.
+
+    :param right_ascensions: The right ascension of each point in degrees.
+    :param declinations: The declination of each point in degrees.
+    :param latitudes: The geographic latitudes to find the longitudes at.
+    :param sidereal_time: The Greenwich sidereal time in degrees.
+
+    :return: The longitudes from -180 to 180 for each angle, with a row for each point and a column for
+        each latitude. Longitudes where a point never rises or sets are NaN.
+    """
+    latitudes = np.asarray(latitudes, dtype=float)
+    meridians = np.asarray(right_ascensions, dtype=float)[:, np.newaxis] - sidereal_time
+    meridians = np.repeat(meridians, len(latitudes), axis=1)
+    arcs = calculate_semi_diurnal_arcs(declinations, latitudes)
+
+    return {
+        Point.midheaven: wrap_degrees(meridians),
+        Point.inner_heaven: wrap_degrees(meridians + 180),
+        Point.ascendant: wrap_degrees(meridians - arcs),
+        Point.descendant: wrap_degrees(meridians + arcs),
+    }
+
+
+def split_line(longitudes: np.ndarray, latitudes: np.ndarray) -> List[List[List[float]]]:
+    """
+    Splits the positions of a line into segments wherever it is undefined or crosses the antimeridian.
+
+    :param longitudes: The longitude at each latitude, or NaN where the line is undefined.
+    :param latitudes: The latitudes of the line.
+
+    :return: The longitude and latitude of each position along each segment, with at least 2 positions each.
+    """
+    is_defined = ~np.isnan(longitudes)
+    crosses_antimeridian = np.abs(np.diff(longitudes)) > 180
+    breaks = np.flatnonzero(~is_defined[1:] | ~is_defined[:-1] | crosses_antimeridian) + 1
+    coordinates = np.column_stack([longitudes, latitudes]).round(coordinate_digits)
+
+    return [
+        segment.tolist()
+        for segment in np.split(coordinates, breaks)
+        if len(segment) > 1 and not np.isnan(segment[0, 0])
+    ]
@@ -0,0 +1,162 @@
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+
+from astro.chart.point.ephemeris import get_julian_day
+from astro.chart.point.midpoint_factory import calculate_midpoint_longitudes
+from astro.chart.point.point_attributes import calculate_point_attributes
+from astro.schema import EventSchema, EventSettingsSchema, SettingsSchema, PointSchema, PointMap
+from astro.util import EventType, wrap_degrees
+
+directed_event_types = [EventType.progressed, EventType.solar_arc]
+"""
+The types of events that are derived from another event by progressing or directing it.
+"""
+
+
+def create_derived_event_settings(
+        events: List[EventSettingsSchema],
+        settings: SettingsSchema = SettingsSchema()
+) -> Tuple[List[EventSettingsSchema], Dict[int, Tuple[int, int]]]:
+    """
+    Adds a composite and Davison event after all other events for each pair of events, if enabled.
+
+    - Progressed and solar arc events are not paired.
+    - Each derived event uses the enabled points of the first event of its pair.
+
+    :param events: The events to calculate, along with any progressed and solar arc events.
+    :param settings: Settings that enable composite and Davison charts.
+
+    :return:
+        [0] The events, along with any composite and Davison events.
+        [1] The indices of the pair of events each derived event is derived from, by the derived event's index.
+    """
+    event_types = [
+        event_type for event_type, is_enabled in [
+            (EventType.composite, settings.calculate_composite_charts),
+            (EventType.davison, settings.calculate_davison_charts),
+        ]
+        if is_enabled
+    ]
+    paired_indices = [
+        index for index, event_settings in enumerate(events)
+        if event_settings.event.type not in directed_event_types
+    ]
+    all_events = list(events)
+    derived_sources = {}
+
+    for from_index, to_index in combinations(paired_indices, 2):
+        for event_type in event_types:
+            derived_sources[len(all_events)] = (from_index, to_index)
+            all_events.append(events[from_index].copy(update={
+                "event": create_derived_event(events[from_index].event, events[to_index].event, event_type),
+                "transits": None,
+                "progress_to": None,
+                "solar_arc_to": None,
+            }))
+
+    return all_events, derived_sources
+
+
+def are_charts_related(from_index: int, to_index: int, derived_sources: Dict[int, Tuple[int, int]]) -> bool:
+    """
+    Returns whether to calculate the relationships between two charts.
+
+    - Composite and Davison charts are only related to the pair of charts they are derived from,
+      so a group of events adds two relationship collections per derived chart, rather than relating
+      every derived chart to every other chart.
+
+    :param from_index: The index of the first chart.
+    :param to_index: The index of the second chart.
+    :param derived_sources: The indices of the pair of charts each derived chart is derived from.
+
+    :return: Whether the charts are related.
+    """
+    if from_index in derived_sources:
+        return to_index in derived_sources[from_index]
+    if to_index in derived_sources:
+        return from_index in derived_sources[to_index]
+
+    return True
+
+
+def create_derived_event(from_event: EventSchema, to_event: EventSchema, event_type: EventType) -> EventSchema:
+    """
+    Creates the event at the midpoint in time and space between two events.
+
+    - The midpoint location is the average latitude and the midpoint of the shorter arc between the longitudes.
+    - Composite charts are not calculated at this event, but it dates the chart for relationships with others.
+
+    :param from_event: The first event.
+    :param to_event: The second event.
+    :param event_type: Whether the event is for a composite or Davison chart.
+
+    :return: The midpoint event.
+    """
+    elapsed = to_event.utc_date.replace(tzinfo=None) - from_event.utc_date.replace(tzinfo=None)
+    utc_date = from_event.utc_date + elapsed / 2
+    longitude_arc = wrap_degrees(to_event.longitude - from_event.longitude)
+
+    return EventSchema(
+        name=f"{from_event.name} and {to_event.name} {event_type.value}",
+        type=event_type,
+        local_date=utc_date,
+        utc_date=utc_date,
+        julian_day=get_julian_day(utc_date),
+        latitude=(from_event.latitude + to_event.latitude) / 2,
+        longitude=wrap_degrees(from_event.longitude + longitude_arc / 2),
+    )
+
+
+def create_composite_points(
+        from_points: PointMap,
+        to_points: PointMap,
+        settings: SettingsSchema = SettingsSchema()
+) -> Dict[str, PointSchema]:
+    """
+    Creates the composite of two charts from the midpoint of each point that both charts have.
+
+    - The existing points are reused, so no ephemeris calls are made.
+    - Velocities and declinations are the average of both points, if both have them.
+
+    :param from_points: The calculated points of the first chart.
+    :param to_points: The calculated points of the second chart.
+    :param settings: Settings used for calculations.
+
+    :return: The composite points.
+    """
+    names = [name for name in from_points if name in to_points]
+    longitudes = calculate_midpoint_longitudes(
+        [from_points[name].longitude for name in names],
+        [to_points[name].longitude for name in names]
+    )
+    points = {}
+
+    for name, longitude in zip(names, longitudes.tolist()):
+        from_point, to_point = from_points[name], to_points[name]
+        points[name] = PointSchema(
+            name=from_point.name,
+            points=list(from_point.points),
+            longitude=longitude,
+            longitude_velocity=calculate_average(from_point.longitude_velocity, to_point.longitude_velocity),
+            declination=calculate_average(from_point.declination, to_point.declination),
+            declination_velocity=calculate_average(from_point.declination_velocity, to_point.declination_velocity),
+        )
+
+        calculate_point_attributes(points[name], settings)
+
+    return points
+
+
+def calculate_average(from_value: Optional[float], to_value: Optional[float]) -> Optional[float]:
+    """
+    Returns the average of two values, or None if either is None.
+
+    :param from_value: The first value.
+    :param to_value: The second value.
+
+    :return: The average value.
+    """
+    if from_value is None or to_value is None:
+        return None
+
+    return (from_value + to_value) / 2
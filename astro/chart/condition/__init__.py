@@ -7,6 +7,7 @@ from .primary_dignities import calculate_primary_dignities
 from .sect_placement import calculate_sect_placement
 from .sun_conjunctions import calculate_sun_conjunctions
 from .triplicity import calculate_triplicity
+from .batch_condition import calculate_batch_condition, sun_condition_order, sect_placement_order
 
 
 def calculate_condition(
@@ -0,0 +1,114 @@
+from typing import Dict, List, Iterable
+
+import numpy as np
+
+from astro.collection.division_tables import point_sign_dignities, sign_triplicity_rulers, \
+    degree_bound_rulers, degree_decan_rulers
+from astro.schema import AspectOrbsSchema
+from astro.util import Point, SunCondition, SectPlacement, wrap_degrees
+
+sun_condition_order = [SunCondition.under_the_beams, SunCondition.combust, SunCondition.cazimi]
+"""
+The order of sun conditions, whose indices are used as sun proximity codes.
+"""
+
+sect_placement_order = [
+    SectPlacement.sect_light,
+    SectPlacement.benefic_by_sect,
+    SectPlacement.benefic_contrary_sect,
+    SectPlacement.malefic_by_sect,
+    SectPlacement.malefic_contrary_sect,
+]
+"""
+The order of sect placements, whose indices are used as sect placement codes.
+"""
+
+point_sect_placements = {
+    Point.sun: (SectPlacement.sect_light, None),
+    Point.moon: (None, SectPlacement.sect_light),
+    Point.jupiter: (SectPlacement.benefic_by_sect, SectPlacement.benefic_contrary_sect),
+    Point.venus: (SectPlacement.benefic_contrary_sect, SectPlacement.benefic_by_sect),
+    Point.mars: (SectPlacement.malefic_contrary_sect, SectPlacement.malefic_by_sect),
+    Point.saturn: (SectPlacement.malefic_by_sect, SectPlacement.malefic_contrary_sect),
+}
+"""
+The sect placement of each planet during the day and night.
+"""
+
+
+def calculate_batch_condition(
+        points: List[Point],
+        longitudes: Iterable[Iterable[float]],
+        is_day_time: Iterable[bool],
+        sun_longitudes: Iterable[float],
+        orbs: AspectOrbsSchema = AspectOrbsSchema()
+) -> Dict[str, np.ndarray]:
+    """
+    Calculates the condition of the same points across many charts at once.
+
+    - Each condition is an array with a row for each chart and a column for each point.
+    - Sun proximity and sect placement are codes indexing `sun_condition_order` and
+      `sect_placement_order`, or -1 for none.
+    - Triplicity is the rank of the point among its sign's triplicity rulers from 1 to 3, or 0 for none.
+
+    :param points: The points in each column of the longitudes.
+    :param longitudes: The longitude of each point in each chart.
+    :param is_day_time: Whether each chart is during the day.
+    :param sun_longitudes: The longitude of the sun in each chart.
+    :param orbs: The orbs to use for calculations of proximity to the sun.
+
+    :return: Each condition by the name of its `PointConditionSchema` attribute.
+    """
+    longitudes = np.asarray(longitudes, dtype=float) % 360
+    is_day_time = np.asarray(is_day_time, dtype=bool)[:, np.newaxis]
+    sun_longitudes = np.asarray(sun_longitudes, dtype=float)[:, np.newaxis]
+    point_names = np.array(points, dtype=object)
+    degrees = longitudes.astype(int)
+    signs = degrees // 30
+
+    # Look up each point's dignities by sign.
+    dignities = np.array([
+        point_sign_dignities.get(point, [(False, False, False, False)] * 12)
+        for point in points
+    ], dtype=bool).reshape(len(points), 12, 4)
+    point_dignities = dignities[np.arange(len(points)), signs]
+
+    # Rank each point within its sign's triplicity rulers, swapping the first two at night.
+    triplicity_rulers = np.array(sign_triplicity_rulers, dtype=object)[signs]
+    day_ranks = np.zeros(longitudes.shape, dtype=np.int8)
+
+    for rank in range(3):
+        day_ranks[triplicity_rulers[..., rank] == point_names] = rank + 1
+
+    night_ranks = np.array([0, 2, 1, 3], dtype=np.int8)[day_ranks]
+
+    # Find each point's proximity to the sun.
+    arcs = np.abs(wrap_degrees(longitudes - sun_longitudes))
+    sun_proximity = np.select(
+        [arcs <= orbs.sun_cazimi_orb, arcs <= orbs.sun_combust_orb, arcs <= orbs.sun_under_beams_orb],
+        [2, 1, 0],
+        -1
+    ).astype(np.int8)
+    sun_proximity[:, [point == Point.sun for point in points]] = -1
+
+    # Find each planet's placement by sect.
+    day_sect, night_sect = [
+        np.array([
+            sect_placement_order.index(point_sect_placements[point][time])
+            if point in point_sect_placements and point_sect_placements[point][time] else -1
+            for point in points
+        ], dtype=np.int8)
+        for time in range(2)
+    ]
+
+    return {
+        "in_domicile": point_dignities[..., 0],
+        "in_exaltation": point_dignities[..., 1],
+        "in_detriment": point_dignities[..., 2],
+        "in_fall": point_dignities[..., 3],
+        "in_triplicity": np.where(is_day_time, day_ranks, night_ranks),
+        "in_bound": degree_bound_rulers[degrees] == point_names,
+        "in_decan": degree_decan_rulers[degrees] == point_names,
+        "sun_proximity": sun_proximity,
+        "sect_placement": np.where(is_day_time, day_sect, night_sect),
+    }
@@ -1,5 +1,6 @@
 from astro.schema import PointSchema
-from astro.collection.zodiac_sign_traits import zodiac_sign_traits
+from astro.collection.division_tables import degree_sign_rulers, degree_bound_rulers, degree_decan_rulers, \
+    degree_twelfth_part_signs, degree_degree_signs, get_zodiac_degree
 
 
 def calculate_divisions(point: PointSchema):
@@ -17,33 +18,16 @@ def calculate_divisions(point: PointSchema):
 
     :param point: The point to calculate the division rulers for.
     """
-    traits = zodiac_sign_traits.signs[point.sign]
-    point.divisions.sign_ruler = traits.domicile_traditional
+    degree = get_zodiac_degree(point)
 
-    # Calculate bound ruler.
-    for bound in traits.bounds:
-        if point.degrees_in_sign < bound.to_degree:
-            point.divisions.bound_ruler = bound.ruler
+    point.divisions.sign_ruler = degree_sign_rulers[degree]
+    point.divisions.bound_ruler = degree_bound_rulers[degree]
+    point.divisions.decan_ruler = degree_decan_rulers[degree]
+    point.divisions.twelfth_part_sign = degree_twelfth_part_signs[degree]
+    point.divisions.degree_sign = degree_degree_signs[degree]
 
-            if point.name == bound.ruler:
-                point.condition.in_bound = True
+    if point.name == point.divisions.bound_ruler:
+        point.condition.in_bound = True
 
-            break
-
-    # Calculate decan ruler.
-    decan = traits.decans[int(point.degrees_in_sign // 10)]
-
-    point.divisions.decan_ruler = decan.ruler
-
-    if point.name == decan.ruler:
+    if point.name == point.divisions.decan_ruler:
         point.condition.in_decan = True
-
-    # Calculate 12th part.
-    part = traits.twelfth_parts[int(point.degrees_in_sign // 2.5)]
-
-    point.divisions.twelfth_part_sign = part.sign
-
-    # Calculate degree sign.
-    degree = traits.degrees[point.degrees_in_sign]
-
-    point.divisions.degree_sign = degree.sign
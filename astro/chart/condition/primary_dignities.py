@@ -1,5 +1,7 @@
 from astro.schema import PointSchema
 from astro.collection.point_traits import point_traits
+from astro.collection.division_tables import point_sign_dignities
+from astro.util import zodiac_sign_index
 
 
 def calculate_primary_dignities(point: PointSchema):
@@ -22,14 +24,20 @@ def calculate_primary_dignities(point: PointSchema):
         if traits.joy and traits.joy == point.houses_whole_sign.house:
             point.condition.in_joy = True
 
-        if point.sign in traits.domicile:
+        if point.sign not in zodiac_sign_index:
+            return
+
+        in_domicile, in_exaltation, in_detriment, in_fall = \
+            point_sign_dignities[point.name][zodiac_sign_index[point.sign]]
+
+        if in_domicile:
             point.condition.in_domicile = True
 
-        if point.sign in traits.exaltation:
+        if in_exaltation:
             point.condition.in_exaltation = True
 
-        if point.sign in traits.detriment:
+        if in_detriment:
             point.condition.in_detriment = True
 
-        if point.sign in traits.fall:
+        if in_fall:
             point.condition.in_fall = True
@@ -1,5 +1,6 @@
 from astro.schema import PointSchema
-from astro.collection.zodiac_sign_traits import zodiac_sign_traits
+from astro.collection.division_tables import sign_triplicity_rulers
+from astro.util import zodiac_sign_index
 
 
 def calculate_triplicity(point: PointSchema, is_day_time: bool):
@@ -13,11 +14,11 @@ def calculate_triplicity(point: PointSchema, is_day_time: bool):
     :param point: The point to calculate the triplicity rulers for.
     :param is_day_time: Whether the point is found during the day.
     """
-    traits = zodiac_sign_traits.signs[point.sign]
+    triplicity = sign_triplicity_rulers[zodiac_sign_index[point.sign]]
 
-    point.condition.in_triplicity = point.name in traits.triplicity
+    point.condition.in_triplicity = point.name in triplicity
 
     if is_day_time:
-        point.divisions.triplicity_ruler = traits.triplicity
+        point.divisions.triplicity_ruler = triplicity
     else:
-        point.divisions.triplicity_ruler = (traits.triplicity[1], traits.triplicity[0], traits.triplicity[2])
+        point.divisions.triplicity_ruler = (triplicity[1], triplicity[0], triplicity[2])
@@ -0,0 +1,336 @@
+import os
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from astro.chart.point import create_points_with_attributes
+from astro.chart.point.ephemeris import ephemeris_path, get_nutation, j2000_julian_day, get_longitude_and_velocity
+from astro.collection import point_traits
+from astro.schema import PointSchema, FixedStarSettingsSchema, FixedStarCollectionSchema, FixedStarSchema, \
+    FixedStarContactSchema
+from astro.util import AspectType, Point
+
+fixed_star_catalog_path = os.path.join(ephemeris_path, "sefstars.txt")
+"""
+The swiss ephemeris fixed star catalog.
+"""
+
+fixed_star_catalog_dtype = np.dtype([
+    ("name", "U40"),
+    ("nomenclature", "U16"),
+    ("right_ascension", float),
+    ("declination", float),
+    ("right_ascension_motion", float),
+    ("declination_motion", float),
+    ("magnitude", float),
+])
+"""
+The J2000 right ascension and declination of a star in degrees, its proper motion in degrees per year,
+and its visual magnitude.
+"""
+
+fixed_star_position_dtype = np.dtype([
+    ("name", "U40"),
+    ("nomenclature", "U16"),
+    ("magnitude", float),
+    ("longitude", float),
+    ("latitude", float),
+    ("right_ascension", float),
+    ("declination", float),
+])
+"""
+The ecliptic and equatorial position of a star in degrees at a time.
+"""
+
+FixedStarIndex = Tuple[np.ndarray, np.ndarray]
+"""
+The positions of the stars at a time, sorted by longitude and sorted by declination.
+"""
+
+milliarcseconds_per_degree = 3600 * 1000
+
+aberration_constant = np.radians(20.49552 / 3600)
+"""
+The largest offset in radians of a star's apparent position caused by the earth's motion around the sun.
+"""
+
+
+def parse_fixed_star_catalog(lines: Iterable[str]) -> np.ndarray:
+    """
+    Parses the lines of a swiss ephemeris fixed star catalog.
+
+    - Each line is: name, nomenclature, equinox, right ascension hours, minutes, seconds,
+      declination degrees, minutes, seconds, proper motion in right ascension and declination
+      in milliarcseconds per year, radial velocity, parallax, and visual magnitude.
+    - Only stars with ICRS or J2000 coordinates are included.
+    - Proper motion in right ascension is assumed to include the cosine of the declination, as in Hipparcos.
+
+    :param lines: The lines of the catalog, including any comments.
+
+    :return: The catalog of stars.
+    """
+    stars = []
+
+    for line in lines:
+        fields = [field.strip() for field in line.split(",")]
+
+        if line.startswith("#") or len(fields) < 14 or fields[2] not in ["ICRS", "2000"]:
+            continue
+
+        name, nomenclature = fields[0] or fields[1], fields[1]
+        hours, minutes, seconds = [float(field) for field in fields[3:6]]
+        degrees, arc_minutes, arc_seconds = [abs(float(field)) for field in fields[6:9]]
+        declination_sign = -1 if fields[6].startswith("-") else 1
+        declination = declination_sign * (degrees + arc_minutes / 60 + arc_seconds / 3600)
+        declination_motion = float(fields[10]) / milliarcseconds_per_degree
+        right_ascension_motion = float(fields[9]) / milliarcseconds_per_degree / np.cos(np.radians(declination))
+
+        stars.append((
+            name,
+            nomenclature,
+            (hours + minutes / 60 + seconds / 3600) * 15,
+            declination,
+            right_ascension_motion,
+            declination_motion,
+            float(fields[13]),
+        ))
+
+    return np.array(stars, dtype=fixed_star_catalog_dtype)
+
+
+@lru_cache(maxsize=4)
+def load_fixed_star_catalog(path: str = fixed_star_catalog_path) -> np.ndarray:
+    """
+    Loads a fixed star catalog once, keeping the parsed catalog in memory.
+
+    :param path: The path to the catalog file.
+
+    :return: The catalog of stars.
+    """
+    with open(path) as catalog_file:
+        return parse_fixed_star_catalog(catalog_file)
+
+
+def calculate_fixed_star_positions(catalog: np.ndarray, jul_day: float) -> np.ndarray:
+    """
+    Calculates the positions of every star in a catalog at a time at once.
+
+    - Proper motion is applied from J2000, then positions are precessed with the IAU 1976 precession angles,
+      rotated onto the ecliptic of date, and shifted by the annual aberration and the nutation in longitude.
+
+    :param catalog: The catalog of stars.
+    :param jul_day: The julian day time to find the positions at.
+
+    :return: The positions of each star.
+    """
+    years = (jul_day - j2000_julian_day) / 365.25
+    right_ascensions = np.radians(catalog["right_ascension"] + catalog["right_ascension_motion"] * years)
+    declinations = np.radians(catalog["declination"] + catalog["declination_motion"] * years)
+    vectors = np.stack([
+        np.cos(declinations) * np.cos(right_ascensions),
+        np.cos(declinations) * np.sin(right_ascensions),
+        np.sin(declinations),
+    ])
+
+    # Precess the equatorial coordinates from J2000 to the mean equator of date.
+    centuries = years / 100
+    zeta, z, theta = np.radians(np.array([
+        2306.2181 * centuries + 0.30188 * centuries ** 2 + 0.017998 * centuries ** 3,
+        2306.2181 * centuries + 1.09468 * centuries ** 2 + 0.018203 * centuries ** 3,
+        2004.3109 * centuries - 0.42665 * centuries ** 2 - 0.041833 * centuries ** 3,
+    ]) / 3600)
+    cos_zeta, sin_zeta, cos_z, sin_z = np.cos(zeta), np.sin(zeta), np.cos(z), np.sin(z)
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+    precession = np.array([
+        [cos_z * cos_theta * cos_zeta - sin_z * sin_zeta, -cos_z * cos_theta * sin_zeta - sin_z * cos_zeta,
+         -cos_z * sin_theta],
+        [sin_z * cos_theta * cos_zeta + cos_z * sin_zeta, -sin_z * cos_theta * sin_zeta + cos_z * cos_zeta,
+         -sin_z * sin_theta],
+        [sin_theta * cos_zeta, -sin_theta * sin_zeta, cos_theta],
+    ])
+    x, y, z = precession @ vectors
+
+    # Rotate onto the mean ecliptic of date.
+    true_obliquity, mean_obliquity, nutation_longitude = get_nutation(jul_day)
+    mean_obliquity = np.radians(mean_obliquity)
+    longitudes = np.arctan2(y * np.cos(mean_obliquity) + z * np.sin(mean_obliquity), x)
+    latitudes = np.arcsin(np.clip(z * np.cos(mean_obliquity) - y * np.sin(mean_obliquity), -1, 1))
+
+    # Shift by the annual aberration towards the direction of the earth's motion, and add the nutation in longitude.
+    sun_longitude = np.radians(get_longitude_and_velocity(jul_day, point_traits.points[Point.sun].swe_id)[0])
+    longitudes, latitudes = (
+        longitudes - aberration_constant * np.cos(sun_longitude - longitudes) / np.cos(latitudes),
+        latitudes - aberration_constant * np.sin(sun_longitude - longitudes) * np.sin(latitudes),
+    )
+    longitudes = (np.degrees(longitudes) + nutation_longitude) % 360
+
+    # Find the equatorial coordinates of the true equator of date.
+    true_obliquity, longitude_radians = np.radians(true_obliquity), np.radians(longitudes)
+    true_declinations = np.arcsin(np.clip(
+        np.sin(latitudes) * np.cos(true_obliquity)
+        + np.cos(latitudes) * np.sin(true_obliquity) * np.sin(longitude_radians),
+        -1, 1
+    ))
+    true_right_ascensions = np.arctan2(
+        np.sin(longitude_radians) * np.cos(true_obliquity) - np.tan(latitudes) * np.sin(true_obliquity),
+        np.cos(longitude_radians)
+    )
+
+    positions = np.empty(len(catalog), dtype=fixed_star_position_dtype)
+    positions["name"] = catalog["name"]
+    positions["nomenclature"] = catalog["nomenclature"]
+    positions["magnitude"] = catalog["magnitude"]
+    positions["longitude"] = longitudes
+    positions["latitude"] = np.degrees(latitudes)
+    positions["right_ascension"] = np.degrees(true_right_ascensions) % 360
+    positions["declination"] = np.degrees(true_declinations)
+
+    return positions
+
+
+def create_fixed_star_index(positions: np.ndarray) -> FixedStarIndex:
+    """
+    Sorts the positions of the stars by longitude and by declination, for binary searches.
+
+    :param positions: The positions of the stars at a time.
+
+    :return: The positions sorted by longitude, and the positions sorted by declination.
+    """
+    return (
+        positions[np.argsort(positions["longitude"], kind="stable")],
+        positions[np.argsort(positions["declination"], kind="stable")],
+    )
+
+
+@lru_cache(maxsize=64)
+def get_fixed_star_index(
+        jul_day: float,
+        max_magnitude: float,
+        catalog_path: str = fixed_star_catalog_path
+) -> FixedStarIndex:
+    """
+    Indexes the positions of the stars in a fixed star catalog at a time.
+
+    :param jul_day: The julian day time to find the positions at.
+    :param max_magnitude: The dimmest visual magnitude of the stars to include.
+    :param catalog_path: The path to the catalog file.
+
+    :return: The positions sorted by longitude, and the positions sorted by declination.
+    """
+    catalog = load_fixed_star_catalog(catalog_path)
+
+    return create_fixed_star_index(
+        calculate_fixed_star_positions(catalog[catalog["magnitude"] <= max_magnitude], jul_day))
+
+
+def calculate_fixed_stars(
+        settings: FixedStarSettingsSchema,
+        catalog_path: str = fixed_star_catalog_path
+) -> FixedStarCollectionSchema:
+    """
+    Calculates the positions of the fixed stars at an event, and the stars conjunct or parallel to its points.
+
+    :param settings: The event, the stars to include, and the orbs of conjunctions and parallels.
+    :param catalog_path: The path to the catalog file.
+
+    :return: The positions of the stars, and their contacts with the event's points.
+    """
+    points = list(create_points_with_attributes(settings.event).values())
+    by_longitude, by_declination = get_fixed_star_index(
+        settings.event.event.julian_day, settings.max_magnitude, catalog_path)
+
+    if settings.stars:
+        by_longitude = by_longitude[np.isin(by_longitude["name"], settings.stars)]
+        by_declination = by_declination[np.isin(by_declination["name"], settings.stars)]
+
+    contacts = [
+        *find_star_conjunctions(by_longitude, points, settings.conjunction_orb),
+        *find_star_parallels(by_declination, points, settings.parallel_orb),
+    ]
+    contacts.sort(key=lambda contact: abs(contact.orb))
+
+    return FixedStarCollectionSchema(
+        stars=[
+            FixedStarSchema(
+                name=star["name"],
+                nomenclature=star["nomenclature"],
+                magnitude=star["magnitude"],
+                longitude=star["longitude"],
+                latitude=star["latitude"],
+                declination=star["declination"],
+            )
+            for star in by_longitude
+        ],
+        contacts=contacts,
+    )
+
+
+def find_star_conjunctions(
+        by_longitude: np.ndarray,
+        points: List[PointSchema],
+        orb: float
+) -> List[FixedStarContactSchema]:
+    """
+    Finds the stars within orb of the longitude of each point with a binary search.
+
+    :param by_longitude: The positions of the stars sorted by longitude.
+    :param points: The points to find conjunctions with.
+    :param orb: The degrees of longitude within which a star is conjunct a point.
+
+    :return: The stars conjunct each point.
+    """
+    longitudes = by_longitude["longitude"]
+    point_longitudes = np.array([point.longitude for point in points], dtype=float)
+    contacts = []
+
+    # Search the range around each point, shifted a full circle either way to include ranges wrapping past 0.
+    for shift in [-360, 0, 360]:
+        starts = np.searchsorted(longitudes, point_longitudes - orb + shift, side="left")
+        ends = np.searchsorted(longitudes, point_longitudes + orb + shift, side="right")
+
+        for point, start, end in zip(points, starts.tolist(), ends.tolist()):
+            for star in by_longitude[start:end]:
+                contacts.append(FixedStarContactSchema(
+                    star=star["name"],
+                    point=point.name,
+                    type=AspectType.conjunction,
+                    orb=float(star["longitude"]) - shift - point.longitude,
+                ))
+
+    return contacts
+
+
+def find_star_parallels(
+        by_declination: np.ndarray,
+        points: List[PointSchema],
+        orb: float
+) -> List[FixedStarContactSchema]:
+    """
+    Finds the stars within orb of the declination of each point, or its reflection, with a binary search.
+
+    :param by_declination: The positions of the stars sorted by declination.
+    :param points: The points to find parallels and contraparallels with.
+    :param orb: The degrees of declination within which a star is parallel or contraparallel to a point.
+
+    :return: The stars parallel or contraparallel to each point.
+    """
+    declinations = by_declination["declination"]
+    points = [point for point in points if point.declination is not None]
+    point_declinations = np.array([point.declination for point in points], dtype=float)
+    contacts = []
+
+    for aspect_type, sign in [(AspectType.parallel, 1), (AspectType.contraparallel, -1)]:
+        starts = np.searchsorted(declinations, sign * point_declinations - orb, side="left")
+        ends = np.searchsorted(declinations, sign * point_declinations + orb, side="right")
+
+        for point, start, end in zip(points, starts.tolist(), ends.tolist()):
+            for star in by_declination[start:end]:
+                contacts.append(FixedStarContactSchema(
+                    star=star["name"],
+                    point=point.name,
+                    type=aspect_type,
+                    orb=float(star["declination"]) - sign * point.declination,
+                ))
+
+    return contacts
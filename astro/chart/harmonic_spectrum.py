@@ -0,0 +1,118 @@
+from typing import List, Iterable, Tuple
+
+import numpy as np
+
+from astro.chart.point import create_points_with_attributes
+from astro.chart.point.harmonic_factory import calculate_harmonic_longitudes
+from astro.collection import aspect_traits
+from astro.schema import HarmonicSpectrumSettingsSchema, HarmonicSpectrumSchema, HarmonicSchema, \
+    HarmonicAspectSchema
+from astro.util import do_points_form_axis, wrap_degrees
+
+HarmonicAspects = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+"""
+The harmonic index, pair index, aspect index, and orb of each aspect found.
+"""
+
+
+def calculate_harmonic_spectrum(settings: HarmonicSpectrumSettingsSchema) -> HarmonicSpectrumSchema:
+    """
+    Calculates the aspects between points within each harmonic chart of an event.
+
+    - Points are calculated once, and every harmonic is derived from them.
+    - Midpoints are skipped, along with any pair of points forming an axis.
+
+    :param settings: The event, the range of harmonics, and the aspects to find.
+
+    :return: The aspects and strength of each harmonic.
+    """
+    event_settings = settings.event.copy(update={"harmonic": 1})
+    points = {
+        name: point for name, point in create_points_with_attributes(event_settings).items()
+        if not point.is_midpoint() and (not settings.points or name in settings.points)
+    }
+    names = list(points.keys())
+    harmonics = list(range(settings.from_harmonic, settings.to_harmonic + 1))
+    pairs = [
+        (from_index, to_index)
+        for from_index in range(len(names))
+        for to_index in range(from_index + 1, len(names))
+        if not do_points_form_axis(names[from_index], names[to_index])
+    ]
+    aspect_to_orb = settings.orbs.aspect_to_orb()
+    aspects = [aspect for aspect in settings.aspects if aspect_to_orb.get(aspect)]
+
+    harmonic_indices, pair_indices, aspect_indices, orbs = find_harmonic_aspects(
+        [point.longitude for point in points.values()],
+        harmonics,
+        pairs,
+        [aspect_traits.aspects[aspect].degrees for aspect in aspects],
+        [aspect_to_orb[aspect] for aspect in aspects],
+    )
+
+    # Sum the significance of every aspect in each harmonic.
+    max_orbs = np.array([aspect_to_orb[aspect] for aspect in aspects], dtype=float)
+    significance = 1 - np.abs(orbs) / max_orbs[aspect_indices]
+    strengths = np.bincount(harmonic_indices, weights=significance, minlength=len(harmonics))
+
+    spectrum = [
+        HarmonicSchema(harmonic=harmonic, strength=strength)
+        for harmonic, strength in zip(harmonics, strengths.tolist())
+    ]
+
+    for harmonic_index, pair_index, aspect_index, orb in zip(
+            harmonic_indices.tolist(), pair_indices.tolist(), aspect_indices.tolist(), orbs.tolist()):
+        from_index, to_index = pairs[pair_index]
+
+        spectrum[harmonic_index].aspects.append(HarmonicAspectSchema(
+            from_point=names[from_index],
+            to_point=names[to_index],
+            type=aspects[aspect_index],
+            orb=orb,
+        ))
+
+    for harmonic in spectrum:
+        harmonic.aspects.sort(key=lambda aspect: abs(aspect.orb))
+
+    return HarmonicSpectrumSchema(harmonics=spectrum)
+
+
+def find_harmonic_aspects(
+        longitudes: Iterable[float],
+        harmonics: List[int],
+        pairs: List[Tuple[int, int]],
+        aspect_degrees: List[float],
+        aspect_orbs: List[float]
+) -> HarmonicAspects:
+    """
+    Finds the aspects between pairs of points within every harmonic chart at once.
+
+    - When a pair is within orb of multiple aspects, only the closest aspect is kept.
+
+    :param longitudes: The longitude of each point in the base chart.
+    :param harmonics: The harmonics to search.
+    :param pairs: The indices of each pair of points to find aspects between.
+    :param aspect_degrees: The degrees of each aspect, from 0 to 180.
+    :param aspect_orbs: The orb of each aspect.
+
+    :return: The harmonic index, pair index, aspect index, and orb of each aspect found.
+    """
+    if not pairs or not aspect_degrees:
+        empty = np.array([], dtype=int)
+
+        return empty, empty, empty, np.array([], dtype=float)
+
+    from_indices, to_indices = np.array(pairs, dtype=int).T
+    harmonic_longitudes = calculate_harmonic_longitudes(longitudes, harmonics)
+
+    # The arc between each pair in each harmonic, from 0 to 180.
+    arcs = np.abs(wrap_degrees(harmonic_longitudes[:, to_indices] - harmonic_longitudes[:, from_indices]))
+    orbs = arcs[..., np.newaxis] - np.asarray(aspect_degrees, dtype=float)
+    within_orb = np.abs(orbs) <= np.asarray(aspect_orbs, dtype=float)
+
+    # Keep the closest aspect within orb for each pair in each harmonic.
+    closest = np.argmin(np.where(within_orb, np.abs(orbs), np.inf), axis=-1)
+    harmonic_indices, pair_indices = np.nonzero(within_orb.any(axis=-1))
+    aspect_indices = closest[harmonic_indices, pair_indices]
+
+    return harmonic_indices, pair_indices, aspect_indices, orbs[harmonic_indices, pair_indices, aspect_indices]
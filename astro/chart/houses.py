@@ -1,8 +1,11 @@
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Iterable
 
-from astro.chart.point.ephemeris import get_house_cusps
+import numpy as np
+
+from astro.chart.point.ephemeris import get_house_cusps_for_systems, get_sidereal_offset
 from astro.schema import PointSchema, HouseSchema, EventSchema, SettingsSchema
-from astro.util import zodiac_sign_order, Point, ZodiacSign, HouseSystem, RulershipType
+from astro.util import zodiac_sign_order, zodiac_sign_index, Point, ZodiacSign, HouseSystem, RulershipType, Ayanamsa
 from astro.collection.zodiac_sign_traits import zodiac_sign_traits
 
 degrees_per_sign = 30
@@ -29,7 +32,8 @@ def calculate_houses(
     """
     houses_whole_sign = calculate_whole_sign_houses(points)
 
-    if event is None or settings.secondary_house_system is HouseSystem.whole_sign:
+    if event is None or settings.secondary_house_system == HouseSystem.whole_sign \
+            or not settings.calculate_secondary_houses:
         # Return just whole signs if a secondary house system cannot be calculated.
 
         return houses_whole_sign, houses_whole_sign
@@ -55,9 +59,17 @@ def calculate_whole_sign_houses(points: Dict[Point, PointSchema]) -> List[HouseS
         return []
 
     houses_whole_sign, house_signs = calculate_whole_sign_house_cusps(points[Point.ascendant])
+    house_indices = find_houses_of_longitudes(
+        [point.longitude for point in points.values()],
+        [house.from_longitude for house in houses_whole_sign]
+    )
+
+    for point, house_index in zip(points.values(), house_indices.tolist()):
+        house = houses_whole_sign[house_index]
+        point.houses_whole_sign.house = house.number
+        point.houses_secondary.house = house.number
 
-    for point in points.values():
-        calculate_whole_sign_house_of_point(point, houses_whole_sign)
+        house.points.append(point.name)
 
     calculate_house_rulers(points, houses_whole_sign, True)
 
@@ -74,7 +86,7 @@ def calculate_whole_sign_house_cusps(asc: PointSchema) -> Tuple[List[HouseSchema
         [0] A 12 item a list of house objects for each whole sign house.
         [1] A 12 item a list of the zodiac signs for each whole sign house.
     """
-    zodiac_index_of_ascendant = zodiac_sign_order.index(asc.sign)
+    zodiac_index_of_ascendant = zodiac_sign_index[asc.sign]
     houses = []
     house_signs = []
 
@@ -107,14 +119,11 @@ def calculate_whole_sign_house_of_point(
     :param point: The point to find the house of.
     :param houses: The order of houses.
     """
-    for house in houses:
-        if house.sign == point.sign:
-            point.houses_whole_sign.house = house.number
-            point.houses_secondary.house = house.number
+    house = houses[(zodiac_sign_index[point.sign] - zodiac_sign_index[houses[0].sign]) % number_of_signs]
+    point.houses_whole_sign.house = house.number
+    point.houses_secondary.house = house.number
 
-            house.points.append(point.name)
-
-            return
+    house.points.append(point.name)
 
 
 def calculate_secondary_houses(
@@ -133,12 +142,19 @@ def calculate_secondary_houses(
 
     :return: A 12 item a list of house objects for each secondary house.
     """
-    houses_secondary = calculate_secondary_house_cusps(event, settings.secondary_house_system)
-
-    for point in points.values():
+    houses_secondary = calculate_secondary_house_cusps(
+        event, settings.secondary_house_system, settings.sidereal_ayanamsa)
+    house_indices = find_houses_of_longitudes(
+        [point.longitude for point in points.values()],
+        [house.from_longitude for house in houses_secondary]
+    )
+
+    for point, house_index in zip(points.values(), house_indices.tolist()):
+        house = houses_secondary[house_index]
         point.houses_secondary.house_system = settings.secondary_house_system
+        point.houses_secondary.house = house.number
 
-        calculate_secondary_house_of_point(point, houses_secondary)
+        house.points.append(point.name)
 
     calculate_house_rulers(points, houses_secondary, False, settings)
 
@@ -147,17 +163,33 @@ def calculate_secondary_houses(
 
 def calculate_secondary_house_cusps(
         event: EventSchema,
-        secondary_house_system: HouseSystem
+        secondary_house_system: HouseSystem,
+        sidereal_ayanamsa: Optional[Ayanamsa] = None
 ) -> List[HouseSchema]:
     """
     Calculates 12 items list of house objects for each house.
 
     :param event: The event time and location.
     :param secondary_house_system: The secondary house system to use.
+    :param sidereal_ayanamsa: The ayanamsa of the sidereal zodiac, or None for the tropical zodiac.
 
     :return: A 12 item a list of house objects for each secondary house.
     """
-    cusps = get_house_cusps(event.julian_day, event.latitude, event.longitude, secondary_house_system)
+    cusps = get_house_cusps_for_systems(
+        event.julian_day, event.latitude, event.longitude, [secondary_house_system], secondary_house_system,
+        get_sidereal_offset(event.julian_day, sidereal_ayanamsa))[secondary_house_system]
+
+    return create_houses_from_cusps(cusps)
+
+
+def create_houses_from_cusps(cusps: Tuple[float, ...]) -> List[HouseSchema]:
+    """
+    Creates 12 items list of house objects from the longitude of each house cusp.
+
+    :param cusps: The longitude of the 12 house cusps.
+
+    :return: A 12 item a list of house objects for each house.
+    """
     houses = []
 
     for house_number in range(number_of_signs):
@@ -184,17 +216,69 @@ def calculate_secondary_house_of_point(
     :param point: The point to find the house of.
     :param houses: The order of houses.
     """
-    for house in houses:
-        normalized_point_longitude = (point.longitude - house.from_longitude) % 360
-        normalized_max_longitude = (house.to_longitude - house.from_longitude) % 360
+    house_index = find_houses_of_longitudes([point.longitude], [house.from_longitude for house in houses])[0]
+    house = houses[house_index]
+    point.houses_secondary.house = house.number
+
+    house.points.append(point.name)
+
+
+def find_houses_of_longitudes(
+        longitudes: Iterable[float],
+        cusps: Iterable[float]
+) -> np.ndarray:
+    """
+    Finds the index of the house containing each longitude.
+
+    - The cusps are normalized once to their distance from the first cusp, so that each longitude's
+      house can be found with a binary search, for any number of longitudes.
+
+    :param longitudes: The longitudes to find the houses of.
+    :param cusps: The longitude of the 12 house cusps, starting from the 1st house.
+
+    :return: The index of the house containing each longitude, where 0 is the 1st house.
+    """
+    cusps = np.asarray(cusps, dtype=float)
+    normalized_cusps = (cusps - cusps[0]) % 360
+    normalized_longitudes = (np.asarray(longitudes, dtype=float) - cusps[0]) % 360
+
+    return np.searchsorted(normalized_cusps, normalized_longitudes, side="right") - 1
+
 
-        if normalized_point_longitude < normalized_max_longitude:
-            # If this point is within the arc of this house, track this house for the point.
-            point.houses_secondary.house = house.number
+def calculate_house_comparison(
+        points: Dict[Point, PointSchema],
+        event: Optional[EventSchema] = None,
+        settings: SettingsSchema = SettingsSchema()
+) -> Dict[HouseSystem, List[HouseSchema]]:
+    """
+    Calculates the houses of each house system being compared, and the points within them.
+
+    - Unlike the secondary houses, this does not set any attributes on the points.
+
+    :param points: A collection of points at a certain time and location.
+    :param event: The event time and location.
+    :param settings: The current calculation settings.
+
+    :return: A 12 item a list of house objects for each compared house system.
+    """
+    if event is None or not settings.compare_house_systems:
+        return {}
+
+    system_cusps = get_house_cusps_for_systems(
+        event.julian_day, event.latitude, event.longitude, settings.compare_house_systems,
+        settings.secondary_house_system, get_sidereal_offset(event.julian_day, settings.sidereal_ayanamsa))
+    system_houses = {}
 
-            house.points.append(point.name)
+    for house_system, cusps in system_cusps.items():
+        houses = create_houses_from_cusps(cusps)
+        house_indices = find_houses_of_longitudes([point.longitude for point in points.values()], cusps)
 
-            return
+        for point, house_index in zip(points.values(), house_indices.tolist()):
+            houses[house_index].points.append(point.name)
+
+        system_houses[house_system] = houses
+
+    return system_houses
 
 
 def calculate_house_rulers(
@@ -206,32 +290,45 @@ def calculate_house_rulers(
     """
     Calculates the houses that the traditional planets rule.
 
-    - Sets the `houses_whole_sign.ruled_houses` attribute within `points` items.
+    - The houses of each ruler are collected in one pass over the houses, using the rulers of each sign
+      for the rulership system, and then assigned to each ruler at once.
+    - Sets the `houses_whole_sign.ruled_houses` or `houses_secondary.ruled_houses` attribute within `points` items.
+    - Sets the `rulers` attribute within `houses` items.
 
     :param points: A collection of points at a certain time and location.
     :param houses: The calculated house cusps.
     :param set_primary_houses: Whether to set primary or secondary house rulers.
     :param settings: The current calculation settings.
     """
-    house_number = 0
+    rulers_by_sign = get_rulers_by_sign(tuple(settings.rulership_system))
+    ruled_houses: Dict[Point, List[int]] = {}
 
     for house in houses:
-        house_number += 1
-        sign_rulers = get_sign_rulers(house.sign, settings)
-
-        for sign_ruler in sign_rulers:
-            if sign_ruler in points:
-                ruler = points[sign_ruler]
-                whole_sign_houses = ruler.houses_whole_sign.ruled_houses
-                secondary_houses = ruler.houses_secondary.ruled_houses
-
-                if sign_ruler not in house.rulers:
-                    house.rulers.append(sign_ruler)
-
-                if set_primary_houses and house_number not in whole_sign_houses:
-                    whole_sign_houses.append(house_number)
-                elif house_number not in secondary_houses:
-                    secondary_houses.append(house_number)
+        house.rulers = [ruler for ruler in rulers_by_sign[house.sign] if ruler in points]
+
+        for ruler in house.rulers:
+            ruled_houses.setdefault(ruler, []).append(house.number)
+
+    for ruler, house_numbers in ruled_houses.items():
+        ruler_houses = points[ruler].houses_whole_sign if set_primary_houses else points[ruler].houses_secondary
+        ruler_houses.ruled_houses = house_numbers
+
+
+@lru_cache(maxsize=None)
+def get_rulers_by_sign(rulership_system: Tuple[RulershipType, ...]) -> Dict[ZodiacSign, List[Point]]:
+    """
+    Determines the points that rule each sign in a rulership system, once per rulership system.
+
+    :param rulership_system: The types of rulership to include.
+
+    :return: The distinct rulers of each sign.
+    """
+    settings = SettingsSchema(rulership_system=list(rulership_system))
+
+    return {
+        sign: list(dict.fromkeys(ruler for ruler in get_sign_rulers(sign, settings) if ruler))
+        for sign in zodiac_sign_order
+    }
 
 
 def get_sign_rulers(
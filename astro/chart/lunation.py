@@ -0,0 +1,243 @@
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import swisseph as swe
+
+from astro.chart.point.ephemeris import get_julian_day, get_utc_date, get_longitude_and_velocity, get_sidereal_offset
+from astro.collection import point_traits
+from astro.schema import LunationSettingsSchema, LunationPageSchema, LunationSchema
+from astro.util import Point, PhaseType, EclipseType, Ayanamsa, zodiac_sign_order, wrap_degrees
+
+synodic_month_days = 29.530589
+"""
+The mean days between new moons.
+"""
+
+phase_angles = {
+    PhaseType.new: 0,
+    PhaseType.first_quarter: 90,
+    PhaseType.full: 180,
+    PhaseType.last_quarter: 270,
+}
+"""
+The angle from the sun to the moon at each lunation.
+"""
+
+eclipse_flags = [
+    (swe.ECL_ANNULAR_TOTAL, EclipseType.hybrid),
+    (swe.ECL_TOTAL, EclipseType.total),
+    (swe.ECL_ANNULAR, EclipseType.annular),
+    (swe.ECL_PARTIAL, EclipseType.partial),
+    (swe.ECL_PENUMBRAL, EclipseType.penumbral),
+]
+"""
+The swiss ephemeris flag of each type of eclipse, in order of precedence.
+"""
+
+max_eclipse_offset_days = 1
+"""
+The most days between the maximum of an eclipse and its new or full moon.
+"""
+
+max_lunation_iterations = 20
+"""
+The most Newton iterations used to find the exact time of a lunation.
+"""
+
+lunation_precision_degrees = 1e-7
+"""
+The orb at which a lunation is considered exact.
+"""
+
+Eclipse = Tuple[float, EclipseType]
+"""
+The julian day of the maximum of an eclipse, and its type.
+"""
+
+
+def calculate_lunations(settings: LunationSettingsSchema) -> LunationPageSchema:
+    """
+    Finds a page of the lunations and eclipses after a date.
+
+    - Lunations are generated one at a time, so only the lunations in the page are calculated.
+
+    :param settings: The start date, page size, and phases to find.
+
+    :return: The page of lunations, and the start date of the next page.
+    """
+    start_day = get_julian_day(settings.start_date)
+    lunations = iterate_lunations(start_day, settings.phases, settings.sidereal_ayanamsa)
+
+    if settings.eclipses_only:
+        lunations = (lunation for lunation in lunations if lunation.eclipse)
+
+    page = list(islice(lunations, settings.page_size))
+    next_start_date = get_utc_date(page[-1].julian_day + 1 / 24) if page else settings.start_date
+
+    return LunationPageSchema(lunations=page, next_start_date=next_start_date)
+
+
+def iterate_lunations(
+        start_day: float,
+        phases: List[PhaseType],
+        ayanamsa: Optional[Ayanamsa] = None
+) -> Iterator[LunationSchema]:
+    """
+    Lazily generates the lunations after a julian day, in order.
+
+    - Each lunation is estimated from the angle left to travel at the mean synodic speed, then solved exactly.
+    - The next solar and lunar eclipses are searched for once, and only searched again after they pass.
+
+    :param start_day: The julian day to find lunations after.
+    :param phases: The phases to find.
+    :param ayanamsa: The ayanamsa of the sidereal zodiac, or None for the tropical zodiac.
+
+    :return: Each lunation, along with the type of any eclipse it has.
+    """
+    angles = sorted({phase_angles[phase]: phase for phase in phases}.items())
+
+    if not angles:
+        return
+
+    day = start_day
+    elongation = get_elongation(day)[0]
+    next_eclipses: Dict[PhaseType, Eclipse] = {}
+
+    while True:
+        # Find the next phase angle that the moon will reach.
+        angle, phase = min(angles, key=lambda item: (item[0] - elongation) % 360 or 360)
+        estimate = day + ((angle - elongation) % 360 or 360) / 360 * synodic_month_days
+        lunation_day = find_phase_angle(angle, estimate)
+        day, elongation = lunation_day, angle
+
+        if lunation_day < start_day:
+            continue
+
+        eclipse = None
+
+        if phase in (PhaseType.new, PhaseType.full):
+            if phase not in next_eclipses or next_eclipses[phase][0] < lunation_day - max_eclipse_offset_days:
+                next_eclipses[phase] = find_next_eclipse(phase, lunation_day - max_eclipse_offset_days)
+
+            eclipse_day, eclipse_type = next_eclipses[phase]
+
+            if abs(eclipse_day - lunation_day) <= max_eclipse_offset_days:
+                eclipse = eclipse_type
+
+        yield create_lunation(phase, lunation_day, eclipse, ayanamsa)
+
+
+def calculate_prenatal_lunation(julian_day: float, ayanamsa: Optional[Ayanamsa] = None) -> LunationSchema:
+    """
+    Finds the last new or full moon before a chart.
+
+    - The lunation is estimated from the angle between the sun and moon at the event itself, rather than from
+      the chart's points, since harmonic, directed, and composite points are not where the sun and moon are.
+
+    :param julian_day: The julian day of the chart.
+    :param ayanamsa: The ayanamsa of the chart's sidereal zodiac, or None for the tropical zodiac.
+
+    :return: The prenatal lunation.
+    """
+    elongation, elongation_velocity = get_elongation(julian_day)
+    phase = PhaseType.new if elongation < 180 else PhaseType.full
+    estimate = julian_day - (elongation % 180) / elongation_velocity
+    lunation_day = find_phase_angle(phase_angles[phase], estimate)
+
+    # A poor estimate near the lunation may converge on the next lunation instead.
+    if lunation_day > julian_day:
+        lunation_day = find_phase_angle(phase_angles[phase], lunation_day - synodic_month_days)
+
+    eclipse_day, eclipse_type = find_next_eclipse(phase, lunation_day - max_eclipse_offset_days)
+    is_eclipse = abs(eclipse_day - lunation_day) <= max_eclipse_offset_days
+
+    return create_lunation(phase, lunation_day, eclipse_type if is_eclipse else None, ayanamsa)
+
+
+def get_elongation(julian_day: float) -> Tuple[float, float]:
+    """
+    Calculates the angle from the sun to the moon, and how fast it changes.
+
+    :param julian_day: The julian day to calculate the angle at.
+
+    :return:
+        [0] The angle from the sun to the moon, from 0 to 360.
+        [1] The velocity of the angle in degrees per day.
+    """
+    sun_longitude, sun_velocity = get_longitude_and_velocity(julian_day, point_traits.points[Point.sun].swe_id)
+    moon_longitude, moon_velocity = get_longitude_and_velocity(julian_day, point_traits.points[Point.moon].swe_id)
+
+    return (moon_longitude - sun_longitude) % 360, moon_velocity - sun_velocity
+
+
+def find_phase_angle(angle: float, estimate: float) -> float:
+    """
+    Finds the time the moon is an exact angle from the sun with Newton's method.
+
+    :param angle: The angle from the sun to the moon.
+    :param estimate: The estimated julian day of the angle, within a few days.
+
+    :return: The exact julian day of the angle.
+    """
+    day = estimate
+
+    for _ in range(max_lunation_iterations):
+        elongation, velocity = get_elongation(day)
+        orb = wrap_degrees(elongation - angle)
+
+        if abs(orb) < lunation_precision_degrees:
+            break
+
+        day -= orb / velocity
+
+    return day
+
+
+def find_next_eclipse(phase: PhaseType, julian_day: float) -> Eclipse:
+    """
+    Finds the next solar eclipse for a new moon, or the next lunar eclipse for a full moon.
+
+    :param phase: The new or full moon phase.
+    :param julian_day: The julian day to search after.
+
+    :return: The julian day of the maximum of the eclipse, and its type.
+    """
+    if phase == PhaseType.new:
+        flags, times = swe.sol_eclipse_when_glob(julian_day, swe.FLG_SWIEPH, 0, False)
+    else:
+        flags, times = swe.lun_eclipse_when(julian_day, swe.FLG_SWIEPH, 0, False)
+
+    eclipse_type = next(eclipse for flag, eclipse in eclipse_flags if flags & flag)
+
+    return times[0], eclipse_type
+
+
+def create_lunation(
+        phase: PhaseType,
+        julian_day: float,
+        eclipse: Optional[EclipseType] = None,
+        ayanamsa: Optional[Ayanamsa] = None
+) -> LunationSchema:
+    """
+    Creates a lunation at an exact julian day.
+
+    - The phase angle is the same in either zodiac, so only the moon's longitude is shifted by the ayanamsa.
+
+    :param phase: The phase of the moon to the sun.
+    :param julian_day: The julian day the phase is exact.
+    :param eclipse: The type of eclipse at the lunation, if any.
+    :param ayanamsa: The ayanamsa of the sidereal zodiac, or None for the tropical zodiac.
+
+    :return: The created lunation.
+    """
+    longitude = get_longitude_and_velocity(julian_day, point_traits.points[Point.moon].swe_id)[0]
+    longitude = (longitude - get_sidereal_offset(julian_day, ayanamsa)) % 360
+
+    return LunationSchema(
+        phase=phase,
+        utc_date=get_utc_date(julian_day),
+        julian_day=julian_day,
+        longitude=longitude,
+        sign=zodiac_sign_order[int(longitude // 30) % 12],
+        eclipse=eclipse,
+    )
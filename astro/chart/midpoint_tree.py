@@ -0,0 +1,130 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Tuple, Union
+
+from astro.chart.point import create_points_with_attributes
+from astro.chart.point.midpoint_factory import calculate_midpoint_longitude
+from astro.schema import PointSchema, MidpointTreeSettingsSchema, MidpointTreeCollectionSchema, \
+    MidpointTreeSchema, MidpointTreeEntrySchema, MidpointSchema
+from astro.util import Point
+
+DialIndex = Tuple[List[float], List[Tuple[str, List[Union[Point, str]]]]]
+"""
+The sorted dial longitudes of each point and midpoint, and the name and points at each position.
+"""
+
+
+def calculate_midpoint_trees(settings: MidpointTreeSettingsSchema) -> MidpointTreeCollectionSchema:
+    """
+    Calculates the tree of points and midpoints within orb of each point on a dial.
+
+    :param settings: The event, dial size, orb, and points to create trees for.
+
+    :return: The midpoint tree of each point.
+    """
+    # Skip any enabled midpoints, since the midpoints between all points are sorted on the dial.
+    points = {
+        name: point for name, point in create_points_with_attributes(settings.event).items()
+        if not point.is_midpoint()
+    }
+    dial_index = create_dial_index(points, settings.dial_degrees)
+    tree_points = [point for point in settings.points or points.keys() if point in points]
+    trees = []
+
+    for tree_point in tree_points:
+        dial_longitude = points[tree_point].longitude % settings.dial_degrees
+        entries = [
+            entry for entry in find_within_orb(dial_index, dial_longitude, settings.orb, settings.dial_degrees)
+            if tree_point not in entry.points
+        ]
+
+        trees.append(MidpointTreeSchema(
+            name=tree_point,
+            dial_longitude=dial_longitude,
+            entries=entries,
+        ))
+
+    return MidpointTreeCollectionSchema(
+        dial_degrees=settings.dial_degrees,
+        orb=settings.orb,
+        trees=trees,
+    )
+
+
+def create_dial_index(points: Dict[Point, PointSchema], dial_degrees: float) -> DialIndex:
+    """
+    Sorts every point, and the midpoint between every pair of points, by their position on a dial.
+
+    - Midpoints are not created as points, only their longitudes are calculated.
+
+    :param points: The points to sort, along with their midpoints.
+    :param dial_degrees: The size of the dial.
+
+    :return: The sorted dial longitudes, and the name and points at each position.
+    """
+    positions = []
+    point_list = list(points.values())
+
+    for from_index, from_point in enumerate(point_list):
+        positions.append((from_point.longitude % dial_degrees, from_point.name, [from_point.name]))
+
+        for to_point in point_list[from_index + 1:]:
+            midpoint = MidpointSchema(from_point=from_point.name, to_point=to_point.name)
+            longitude = calculate_midpoint_longitude(from_point, to_point)
+
+            positions.append((longitude % dial_degrees, str(midpoint), [from_point.name, to_point.name]))
+
+    positions.sort(key=lambda position: position[0])
+
+    return (
+        [position[0] for position in positions],
+        [(position[1], position[2]) for position in positions],
+    )
+
+
+def find_within_orb(
+        dial_index: DialIndex,
+        dial_longitude: float,
+        orb: float,
+        dial_degrees: float
+) -> List[MidpointTreeEntrySchema]:
+    """
+    Finds the points and midpoints within orb of a position on the dial with a binary search.
+
+    :param dial_index: The sorted dial positions of each point and midpoint.
+    :param dial_longitude: The position on the dial to search around.
+    :param orb: The orb on the dial to search within.
+    :param dial_degrees: The size of the dial.
+
+    :return: The points and midpoints within orb, ordered by the closest orb.
+    """
+    longitudes, names = dial_index
+    start, end = dial_longitude - orb, dial_longitude + orb
+    ranges = [(max(start, 0), min(end, dial_degrees))]
+
+    # Include the ranges that wrap around either end of the dial.
+    if start < 0:
+        ranges.append((start + dial_degrees, dial_degrees))
+    if end > dial_degrees:
+        ranges.append((0, end - dial_degrees))
+
+    indices = set()
+
+    for range_start, range_end in ranges:
+        indices.update(range(bisect_left(longitudes, range_start), bisect_right(longitudes, range_end)))
+
+    entries = []
+
+    for index in indices:
+        name, points = names[index]
+        entry_orb = (longitudes[index] - dial_longitude + dial_degrees / 2) % dial_degrees - dial_degrees / 2
+
+        entries.append(MidpointTreeEntrySchema(
+            name=name,
+            points=points,
+            dial_longitude=longitudes[index],
+            orb=entry_orb,
+        ))
+
+    entries.sort(key=lambda entry: abs(entry.orb))
+
+    return entries
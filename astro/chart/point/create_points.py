@@ -1,27 +1,34 @@
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 from astro.util import Point
-from astro.schema import PointSchema, SettingsSchema, EventSettingsSchema
+from astro.schema import PointSchema, SettingsSchema, EventSettingsSchema, PointMap, EventSchema
 from .ephemeris import get_julian_day
 from .point_attributes import calculate_point_attributes
 from .point_factory import create_points
+from .harmonic_factory import create_harmonic_points
 
 
 def create_points_with_attributes(
         event_settings: EventSettingsSchema,
-        settings: SettingsSchema = SettingsSchema()
+        settings: SettingsSchema = SettingsSchema(),
+        previous: Optional[Tuple[PointMap, EventSchema]] = None
 ) -> Dict[Point, PointSchema]:
     """
     Creates a mapping from all point names to that point's attributes at the given time and location.
 
+    - If the event has a harmonic, the attributes are calculated for the harmonic positions of each point.
+
     :param event_settings: The current time, location, and enabled points.
     :param settings: Settings used for calculations.
+    :param previous: The points and event of a previously calculated chart to reuse points from.
 
     :return: The calculated points.
     """
     # Set the julian day for the event.
     event_settings.event.julian_day = get_julian_day(event_settings.event.utc_date)
-    points = create_points(event_settings)
+    # Reused points would already be multiplied by the harmonic, so harmonic charts are always recalculated.
+    points = create_points(event_settings, settings, previous if event_settings.harmonic == 1 else None)
+    points = create_harmonic_points(points, event_settings.harmonic)
 
     # Calculate the derived attributes for each point.
     for point in points.values():
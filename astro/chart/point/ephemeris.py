@@ -1,11 +1,68 @@
-from datetime import datetime
-from typing import Tuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Tuple, List, Dict, Optional
 
 import swisseph as swe
 
-from astro.util import HouseSystem
-
-swe.set_ephe_path("/home/tim/Astro/Astro-BE/ephemeris")
+from astro.util import HouseSystem, Ayanamsa, CoordinateMode, ecliptic_to_equatorial, to_sidereal
+
+ephemeris_path = "/home/tim/Astro/Astro-BE/ephemeris"
+"""
+The directory of the swiss ephemeris files and the fixed star catalog.
+"""
+
+swe.set_ephe_path(ephemeris_path)
+
+house_system_to_id = {
+    HouseSystem.whole_sign: b'W',
+    HouseSystem.placidus: b'P',
+    HouseSystem.equal: b'E',
+    HouseSystem.porphyry: b'O',
+    HouseSystem.regiomontanus: b'R',
+    HouseSystem.campanus: b'C',
+}
+"""
+Maps each house system to its swiss ephemeris ID.
+"""
+
+j2000_julian_day = 2451545.0
+j2000_utc_date = datetime(2000, 1, 1, 12, tzinfo=timezone.utc)
+"""
+The julian day and UTC time of the J2000 epoch, used to convert julian days to dates.
+"""
+
+ayanamsa_to_id = {
+    Ayanamsa.fagan_bradley: swe.SIDM_FAGAN_BRADLEY,
+    Ayanamsa.lahiri: swe.SIDM_LAHIRI,
+    Ayanamsa.raman: swe.SIDM_RAMAN,
+    Ayanamsa.krishnamurti: swe.SIDM_KRISHNAMURTI,
+    Ayanamsa.yukteshwar: swe.SIDM_YUKTESHWAR,
+    Ayanamsa.true_citra: swe.SIDM_TRUE_CITRA,
+    Ayanamsa.galactic_center: swe.SIDM_GALCENT_0SAG,
+    Ayanamsa.hipparchos: swe.SIDM_HIPPARCHOS,
+}
+"""
+Maps each ayanamsa to its swiss ephemeris sidereal mode ID.
+"""
+
+coordinate_mode_to_flag = {
+    CoordinateMode.geocentric: 0,
+    CoordinateMode.topocentric: swe.FLG_TOPOCTR,
+    CoordinateMode.heliocentric: swe.FLG_HELCTR,
+}
+"""
+Maps each coordinate mode to its swiss ephemeris flag.
+"""
+
+observer_location_digits = 3
+"""
+The decimal places that observer locations are rounded to for topocentric positions, which is about 100 meters.
+"""
+
+angle_house_systems = [HouseSystem.whole_sign, HouseSystem.equal, HouseSystem.porphyry]
+"""
+The house systems whose cusps are derived from the angles, without their own swiss ephemeris call.
+"""
 
 
 def get_julian_day(timestamp: datetime) -> float:
@@ -16,17 +73,36 @@ def get_julian_day(timestamp: datetime) -> float:
 
     :return: The julian day for that time.
     """
-    hours = timestamp.hour + (timestamp.minute / 60)
+    hours = timestamp.hour + (timestamp.minute / 60) + (timestamp.second / 60 / 60) + \
+        (timestamp.microsecond / 60 / 60 / 1e6)
 
     return swe.julday(timestamp.year, timestamp.month, timestamp.day, hours)
 
 
-def get_point_properties(jul_day: float, swe_id: int) -> Tuple[float, float, float, float]:
+def get_utc_date(jul_day: float) -> datetime:
+    """
+    Returns the UTC time associated with the given julian day, the inverse of `get_julian_day`.
+
+    :param jul_day: The julian day to use.
+
+    :return: The UTC time for that julian day.
+    """
+    return j2000_utc_date + timedelta(days=jul_day - j2000_julian_day)
+
+
+def get_point_properties(
+        jul_day: float,
+        swe_id: int,
+        coordinate_mode: CoordinateMode = CoordinateMode.geocentric,
+        location: Tuple[float, float] = (0, 0)
+) -> Tuple[float, float, float, float]:
     """
     Calculates the degrees from aries, declination, and speed of a point at a given time.
 
     :param jul_day: The julian day time to find the point at.
     :param swe_id: The swiss ephemeris ID of the point.
+    :param coordinate_mode: Where the point is observed from.
+    :param location: The latitude and longitude of the observer, used for topocentric positions.
 
     :returns:
         [0] The longitude of this point in degrees.
@@ -34,18 +110,44 @@ def get_point_properties(jul_day: float, swe_id: int) -> Tuple[float, float, flo
         [2] The declination of this point in degrees.
         [3] The declination velocity per day of this point in degrees.
     """
-    longitude, longitude_velocity = get_longitude_and_velocity(jul_day, swe_id)
-    declination, declination_velocity = get_declination_and_velocity(jul_day, swe_id)
+    observer = get_observer_location(coordinate_mode, location)
+    longitude, longitude_velocity = get_longitude_and_velocity(jul_day, swe_id, coordinate_mode, observer)
+    declination, declination_velocity = get_declination_and_velocity(jul_day, swe_id, coordinate_mode, observer)
 
     return longitude, longitude_velocity, declination, declination_velocity
 
 
-def get_longitude_and_velocity(jul_day: float, swe_id: int) -> Tuple[float, float]:
+def get_observer_location(
+        coordinate_mode: CoordinateMode,
+        location: Tuple[float, float]
+) -> Optional[Tuple[float, float]]:
+    """
+    Returns the rounded location of the observer for topocentric positions, so nearby locations share a cache.
+
+    :param coordinate_mode: Where positions are observed from.
+    :param location: The latitude and longitude of the observer.
+
+    :return: The rounded latitude and longitude, or None if the positions are not topocentric.
+    """
+    if coordinate_mode != CoordinateMode.topocentric:
+        return None
+
+    return round(location[0], observer_location_digits), round(location[1], observer_location_digits)
+
+
+def get_longitude_and_velocity(
+        jul_day: float,
+        swe_id: int,
+        coordinate_mode: CoordinateMode = CoordinateMode.geocentric,
+        observer: Optional[Tuple[float, float]] = None
+) -> Tuple[float, float]:
     """
     Calculates the ecliptic longitude and longitude velocity of a point at a given time.
 
     :param jul_day: The julian day time to find the point at.
     :param swe_id: The swiss ephemeris ID of the point.
+    :param coordinate_mode: Where the point is observed from.
+    :param observer: The rounded latitude and longitude of the observer, for topocentric positions.
 
     :return:
         [0] The ecliptic longitude of this point in degrees.
@@ -56,17 +158,25 @@ def get_longitude_and_velocity(jul_day: float, swe_id: int) -> Tuple[float, floa
     # [2] ???
     # [3] ecliptic longitude degrees per day.
     # [4] ecliptic latitude degrees per day.
-    ecliptic_calculations = swe.calc_ut(jul_day, swe_id,  swe.FLG_SPEED)[0]
+    ecliptic_calculations = get_position(
+        jul_day, swe_id, swe.FLG_SPEED | coordinate_mode_to_flag[coordinate_mode], observer)
 
     return ecliptic_calculations[0], ecliptic_calculations[3]
 
 
-def get_declination_and_velocity(jul_day: float, swe_id: int) -> Tuple[float, float]:
+def get_declination_and_velocity(
+        jul_day: float,
+        swe_id: int,
+        coordinate_mode: CoordinateMode = CoordinateMode.geocentric,
+        observer: Optional[Tuple[float, float]] = None
+) -> Tuple[float, float]:
     """
     Calculates the equatorial declination and declination velocity of a point at a given time.
 
     :param jul_day: The julian day time to find the point at.
     :param swe_id: The swiss ephemeris ID of the point.
+    :param coordinate_mode: Where the point is observed from.
+    :param observer: The rounded latitude and longitude of the observer, for topocentric positions.
 
     :return:
         [0] The equatorial declination of this point in degrees.
@@ -77,18 +187,99 @@ def get_declination_and_velocity(jul_day: float, swe_id: int) -> Tuple[float, fl
     # [2] ???
     # [3] equatorial right ascension degrees per day.
     # [4] equatorial declination degrees per day.
-    equatorial_calculations = swe.calc_ut(
+    equatorial_calculations = get_position(
         jul_day, swe_id,
-        swe.FLG_SWIEPH + swe.FLG_SPEED + swe.FLG_EQUATORIAL
-    )[0]
+        swe.FLG_SWIEPH + swe.FLG_SPEED + swe.FLG_EQUATORIAL | coordinate_mode_to_flag[coordinate_mode],
+        observer
+    )
 
     return equatorial_calculations[1], equatorial_calculations[4]
 
 
+def get_right_ascension_and_declination(jul_day: float, swe_id: int) -> Tuple[float, float]:
+    """
+    Calculates the equatorial right ascension and declination of a point at a given time.
+
+    :param jul_day: The julian day time to find the point at.
+    :param swe_id: The swiss ephemeris ID of the point.
+
+    :return:
+        [0] The right ascension of this point in degrees.
+        [1] The declination of this point in degrees.
+    """
+    equatorial_calculations = get_position(jul_day, swe_id, swe.FLG_SWIEPH + swe.FLG_SPEED + swe.FLG_EQUATORIAL)
+
+    return equatorial_calculations[0], equatorial_calculations[1]
+
+
+@lru_cache(maxsize=4096)
+def get_position(
+        jul_day: float,
+        swe_id: int,
+        flags: int,
+        observer: Optional[Tuple[float, float]] = None
+) -> Tuple[float, ...]:
+    """
+    Calculates the position of a point, cached by its time, flags, and observer location.
+
+    - The flags include the coordinate mode, so geocentric, topocentric, and heliocentric positions
+      are cached separately.
+
+    :param jul_day: The julian day time to find the point at.
+    :param swe_id: The swiss ephemeris ID of the point.
+    :param flags: The swiss ephemeris calculation flags.
+    :param observer: The rounded latitude and longitude of the observer, for topocentric positions.
+
+    :return: The 6 coordinates and speeds calculated by the swiss ephemeris.
+    """
+    if observer is not None:
+        latitude, longitude = observer
+        swe.set_topo(longitude, latitude, 0)
+
+    return swe.calc_ut(jul_day, swe_id, flags)[0]
+
+
+@lru_cache(maxsize=256)
+def get_houses(
+        jul_day: float,
+        lat: float,
+        long: float,
+        house_system: HouseSystem = HouseSystem.whole_sign
+) -> Tuple[
+    Tuple[float, ...],
+    Tuple[float, ...],
+    Tuple[float, ...],
+    Tuple[float, ...],
+]:
+    """
+    Calculates the house cusps, angles, and their speeds for a house system.
+
+    - Results are cached, so that the angles and secondary house cusps of a chart share one calculation.
+    - Within the polar circles, where house systems such as Placidus and Koch are undefined,
+      the cusps fall back to Porphyry, as the swiss ephemeris does.
+
+    :param jul_day: The time to find the houses at.
+    :param lat: The degrees of latitude of the event.
+    :param long: The degrees of longitude of the event.
+    :param house_system: The house system to use.
+
+    :return:
+        [0] Cusps: tuple of 12 float for cusps.
+        [1] Asc MC: tuple of 8 float for additional points.
+        [2] Cusps Speed: tuple of 12 float for cusps speeds.
+        [3] Asc MC Speed: tuple of 8 float for speeds of additional points.
+    """
+    try:
+        return swe.houses_ex2(jul_day, lat, long, house_system_to_id[house_system])
+    except swe.Error:
+        return swe.houses_ex2(jul_day, lat, long, house_system_to_id[HouseSystem.porphyry])
+
+
 def get_angles(
         jul_day: float,
         lat: float,
-        long: float
+        long: float,
+        house_system: HouseSystem = HouseSystem.whole_sign
 ) -> Tuple[
     Tuple[float, float, float],
     Tuple[float, float, float],
@@ -103,6 +294,7 @@ def get_angles(
     :param jul_day: The time to find the point at.
     :param lat: The degrees of latitude of the event.
     :param long: The degrees of longitude of the event.
+    :param house_system: The house system to calculate alongside the angles, to reuse for house cusps.
 
     :return:
         [0] The ecliptic longitude, velocity, and equatorial declination of the Ascendant.
@@ -111,11 +303,7 @@ def get_angles(
         [3] The ecliptic longitude, velocity, and equatorial declination of the IC.
         [4] The ecliptic longitude, velocity, and equatorial declination of the Vertex.
     """
-    # [0] Cusps: tuple of 12 float for cusps.
-    # [1] Asc MC: tuple of 8 float for additional points.
-    # [2] Cusps Speed: tuple of 12 float for cusps speeds.
-    # [3] Asc MC Speed: tuple of 8 float for speeds of additional points.
-    cusps_and_speeds = swe.houses_ex2(jul_day, lat, long, b'A')
+    cusps_and_speeds = get_houses(jul_day, lat, long, house_system)
     angles = cusps_and_speeds[1]
     speeds = cusps_and_speeds[3]
     asc, asc_velocity = angles[0], speeds[0]
@@ -124,18 +312,9 @@ def get_angles(
     desc = (asc + 180) % 360
     ic = (mc + 180) % 360
 
-    # [0] True obliquity of the ecliptic.
-    # [1] Mean obliquity of the ecliptic.
-    # [2] Nutation in longitude.
-    # [2] Nutation in obliquity.
-    obliquity_and_nutation = swe.calc_ut(jul_day, swe.ECL_NUT)[0]
-    obliquity = obliquity_and_nutation[0]
-
-    asc_declination = swe.cotrans((asc, 0, 1), -obliquity)[1]
-    mc_declination = swe.cotrans((mc, 0, 1), -obliquity)[1]
-    desc_declination = swe.cotrans((desc, 0, 1), -obliquity)[1]
-    ic_declination = swe.cotrans((ic, 0, 1), -obliquity)[1]
-    vertex_declination = swe.cotrans((vertex, 0, 1), -obliquity)[1]
+    declinations = ecliptic_to_equatorial([asc, mc, desc, ic, vertex], get_obliquity(jul_day))[1]
+    asc_declination, mc_declination, desc_declination, ic_declination, vertex_declination = \
+        declinations.tolist()
 
     return (
         (asc, asc_velocity, asc_declination),
@@ -146,6 +325,94 @@ def get_angles(
     )
 
 
+@lru_cache(maxsize=256)
+def get_obliquity(jul_day: float) -> float:
+    """
+    Calculates the true obliquity of the ecliptic at a given time.
+
+    :param jul_day: The julian day time to find the obliquity at.
+
+    :return: The true obliquity of the ecliptic in degrees.
+    """
+    # [0] True obliquity of the ecliptic.
+    # [1] Mean obliquity of the ecliptic.
+    # [2] Nutation in longitude.
+    # [3] Nutation in obliquity.
+    return swe.calc_ut(jul_day, swe.ECL_NUT)[0][0]
+
+
+@lru_cache(maxsize=256)
+def get_nutation(jul_day: float) -> Tuple[float, float, float]:
+    """
+    Calculates the obliquity of the ecliptic and the nutation in longitude at a given time.
+
+    :param jul_day: The julian day time to find the nutation at.
+
+    :return:
+        [0] The true obliquity of the ecliptic in degrees.
+        [1] The mean obliquity of the ecliptic in degrees.
+        [2] The nutation in longitude in degrees.
+    """
+    true_obliquity, mean_obliquity, nutation_longitude, _, _, _ = swe.calc_ut(jul_day, swe.ECL_NUT)[0]
+
+    return true_obliquity, mean_obliquity, nutation_longitude
+
+
+@lru_cache(maxsize=4096)
+def get_ayanamsa(jul_day: float, sidereal_mode: int = swe.SIDM_FAGAN_BRADLEY) -> float:
+    """
+    Calculates the ayanamsa, the distance from the sidereal zodiac to the tropical zodiac, at a given time.
+
+    - The change in the ayanamsa between two times is the precession of the equinoxes between them.
+
+    :param jul_day: The julian day time to find the ayanamsa at.
+    :param sidereal_mode: The swiss ephemeris ID of the sidereal zodiac.
+
+    :return: The ayanamsa in degrees, without nutation.
+    """
+    swe.set_sid_mode(sidereal_mode)
+
+    return swe.get_ayanamsa_ut(jul_day)
+
+
+@lru_cache(maxsize=4096)
+def get_true_ayanamsa(jul_day: float, sidereal_mode: int) -> float:
+    """
+    Calculates the true ayanamsa, including nutation, at a given time.
+
+    - Tropical longitudes are apparent positions that include nutation, so subtracting the true ayanamsa
+      matches the positions swiss ephemeris calculates in the sidereal zodiac.
+
+    :param jul_day: The julian day time to find the ayanamsa at.
+    :param sidereal_mode: The swiss ephemeris ID of the sidereal zodiac.
+
+    :return: The ayanamsa in degrees, with nutation.
+    """
+    swe.set_sid_mode(sidereal_mode)
+
+    # [0] The calculation flags used.
+    # [1] The ayanamsa with nutation.
+    return swe.get_ayanamsa_ex_ut(jul_day, 0)[1]
+
+
+def get_sidereal_offset(jul_day: float, ayanamsa: Optional[Ayanamsa] = None) -> float:
+    """
+    Returns the degrees to subtract from tropical longitudes for the sidereal zodiac of an ayanamsa.
+
+    - The true ayanamsa is cached per julian day and sidereal zodiac, so it is shared by every point,
+      house cusp, and chart at that time.
+
+    :param jul_day: The julian day time to find the offset at.
+    :param ayanamsa: The ayanamsa of the sidereal zodiac, or None for the tropical zodiac.
+
+    :return: The ayanamsa in degrees, or 0 for the tropical zodiac.
+    """
+    if ayanamsa is None:
+        return 0
+
+    return get_true_ayanamsa(jul_day, ayanamsa_to_id[ayanamsa])
+
+
 def get_house_cusps(
         jul_day: float,
         lat: float,
@@ -162,20 +429,128 @@ def get_house_cusps(
 
     :return: The longitude of the 12 house cusps.
     """
-    house_system_to_id = {
-        HouseSystem.whole_sign: b'W',
-        HouseSystem.placidus: b'P',
-        HouseSystem.equal: b'E',
-        HouseSystem.porphyry: b'O',
-        HouseSystem.regiomontanus: b'R',
-        HouseSystem.campanus: b'C',
-    }
+    return get_houses(jul_day, lat, long, house_system)[0]
+
+
+def get_house_cusps_from_armc(
+        armc: float,
+        lat: float,
+        obliquity: float,
+        house_system: HouseSystem
+) -> Tuple[float, ...]:
+    """
+    Calculates the house cusps for a house system from the right ascension of the Midheaven (ARMC).
+
+    - Within the polar circles, where house systems such as Placidus and Koch are undefined,
+      the cusps fall back to Porphyry, as the swiss ephemeris does.
+
+    :param armc: The right ascension of the Midheaven in degrees.
+    :param lat: The degrees of latitude of the event.
+    :param obliquity: The obliquity of the ecliptic in degrees.
+    :param house_system: The house system to use.
 
+    :return: The longitude of the 12 house cusps.
+    """
     # [0] Cusps: tuple of 12 float for cusps.
     # [1] Asc MC: tuple of 8 float for additional points.
-    cusps = swe.houses(jul_day, lat, long, house_system_to_id[house_system])
+    try:
+        return swe.houses_armc(armc, lat, obliquity, house_system_to_id[house_system])[0]
+    except swe.Error:
+        return swe.houses_armc(armc, lat, obliquity, house_system_to_id[HouseSystem.porphyry])[0]
+
+
+def get_sidereal_time(jul_day: float) -> float:
+    """
+    Calculates the Greenwich sidereal time at a given time.
+
+    :param jul_day: The julian day time to find the sidereal time at.
+
+    :return: The sidereal time in degrees.
+    """
+    return swe.sidtime(jul_day) * 15
+
+
+def get_house_cusps_for_systems(
+        jul_day: float,
+        lat: float,
+        long: float,
+        house_systems: List[HouseSystem],
+        secondary_house_system: HouseSystem = HouseSystem.whole_sign,
+        sidereal_offset: float = 0
+) -> Dict[HouseSystem, Tuple[float, ...]]:
+    """
+    Calculates the house cusps for multiple house systems at once.
+
+    - Whole sign, equal, and porphyry cusps are derived from the angles of the cached house calculation
+      of the secondary house system, which the chart's angles were already calculated with.
+    - Other house systems each need their own calculation, and are shifted into the sidereal zodiac.
+
+    :param jul_day: The time to find the houses at.
+    :param lat: The degrees of latitude of the event.
+    :param long: The degrees of longitude of the event.
+    :param house_systems: The house systems to calculate.
+    :param secondary_house_system: The house system that the angles were calculated alongside.
+    :param sidereal_offset: The ayanamsa to subtract from each cusp, or 0 for the tropical zodiac.
+
+    :return: The longitude of the 12 house cusps for each house system.
+    """
+    system_cusps = {}
+    angles = None
+
+    for house_system in house_systems:
+        if house_system in angle_house_systems:
+            if angles is None:
+                # [1] Asc MC: tuple of 8 float for additional points.
+                angles = get_houses(jul_day, lat, long, secondary_house_system)[1]
+
+            system_cusps[house_system] = get_angle_house_cusps(angles[0], angles[1], house_system, sidereal_offset)
+        else:
+            cusps = get_house_cusps(jul_day, lat, long, house_system)
+            system_cusps[house_system] = tuple(to_sidereal(cusps, sidereal_offset).tolist())
+
+    return system_cusps
+
+
+def get_angle_house_cusps(
+        asc: float,
+        mc: float,
+        house_system: HouseSystem,
+        sidereal_offset: float = 0
+) -> Tuple[float, ...]:
+    """
+    Calculates the house cusps of a house system that is derived only from the Ascendant and Midheaven.
+
+    - In the sidereal zodiac, the angles are shifted before deriving the cusps, so that whole sign cusps
+      fall on the boundaries of the sidereal signs.
+
+    :param asc: The tropical longitude of the Ascendant.
+    :param mc: The tropical longitude of the Midheaven.
+    :param house_system: The house system to use, either whole sign, equal, or porphyry.
+    :param sidereal_offset: The ayanamsa to subtract from the angles, or 0 for the tropical zodiac.
+
+    :return: The longitude of the 12 house cusps.
+    """
+    asc, mc = (asc - sidereal_offset) % 360, (mc - sidereal_offset) % 360
+
+    if house_system == HouseSystem.whole_sign:
+        first_cusp = asc - asc % 30
+
+        return tuple((first_cusp + 30 * house) % 360 for house in range(12))
+
+    if house_system == HouseSystem.equal:
+        return tuple((asc + 30 * house) % 360 for house in range(12))
+
+    # Porphyry trisects each quadrant between the angles.
+    angles = [asc, (mc + 180) % 360, (asc + 180) % 360, mc]
+    cusps = []
+
+    for quadrant in range(4):
+        start = angles[quadrant]
+        arc = (angles[(quadrant + 1) % 4] - start) % 360
+
+        cusps.extend((start + arc * third / 3) % 360 for third in range(3))
 
-    return cusps[0]
+    return tuple(cusps)
 
 
 def get_sunrise_time(
@@ -0,0 +1,46 @@
+from typing import Dict, Iterable
+
+import numpy as np
+
+from astro.schema import PointSchema
+from astro.util import Point
+
+
+def calculate_harmonic_longitudes(longitudes: Iterable[float], harmonics: Iterable[int]) -> np.ndarray:
+    """
+    Calculates the longitudes of points in each harmonic chart, by multiplying their longitudes by each harmonic.
+
+    :param longitudes: The longitude of each point.
+    :param harmonics: The harmonics to calculate.
+
+    :return: The longitude of each point in each harmonic, with a row for each harmonic.
+    """
+    return np.outer(np.asarray(harmonics, dtype=float), np.asarray(longitudes, dtype=float)) % 360
+
+
+def create_harmonic_points(points: Dict[Point, PointSchema], harmonic: int) -> Dict[Point, PointSchema]:
+    """
+    Creates the points of a harmonic chart from already calculated points, without any new ephemeris calls.
+
+    - Longitudes and longitude velocities are multiplied by the harmonic.
+    - Declinations are cleared, since harmonics are only defined along the ecliptic.
+
+    :param points: The calculated points.
+    :param harmonic: The harmonic to multiply positions by.
+
+    :return: The harmonic points.
+    """
+    if harmonic == 1:
+        return points
+
+    longitudes = calculate_harmonic_longitudes([point.longitude for point in points.values()], [harmonic])[0]
+
+    return {
+        name: point.copy(update={
+            "longitude": longitude,
+            "longitude_velocity": None if point.longitude_velocity is None else point.longitude_velocity * harmonic,
+            "declination": None,
+            "declination_velocity": None,
+        })
+        for (name, point), longitude in zip(points.items(), longitudes.tolist())
+    }
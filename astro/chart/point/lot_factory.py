@@ -1,8 +1,34 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple, Iterable
+
+import numpy as np
 
 from astro.collection.lot_traits import lot_traits
-from astro.schema import PointSchema
-from astro.util import Point, lot_points
+from astro.schema import PointSchema, LotFormulaSchema
+from astro.util import Point, lot_points, ecliptic_to_equatorial, ecliptic_to_declination_velocity, LotTerm, \
+    parse_lot_formula, order_lot_formulas
+
+CompiledLot = Tuple[str, List[LotTerm], bool]
+"""
+The name of a lot, the terms of its formula, and whether it reverses at night.
+"""
+
+LotPositions = Dict[str, Tuple[np.ndarray, np.ndarray]]
+"""
+The longitudes and longitude velocities of each point, lot, or house cusp by name.
+"""
+
+preset_lot_formulas = {
+    # Constructed without validation, since custom lots cannot use the names of preset lots.
+    lot: LotFormulaSchema.construct(
+        name=lot,
+        formula=f"{Point.ascendant.value} + {traits.add_point} - {traits.sub_point}",
+        reverse_at_night=traits.reverse_at_night,
+    )
+    for lot, traits in lot_traits.lots.items()
+}
+"""
+The formula of each preset lot: Asc. + A - B
+"""
 
 
 def create_lot(
@@ -22,32 +48,151 @@ def create_lot(
 
     :return: The created lot point.
     """
-    if lot not in lot_points or lot not in lot_traits.lots:
+    if lot not in lot_points or lot not in preset_lot_formulas:
         return
 
-    traits = lot_traits.lots[lot]
+    lots = create_lots(points, [preset_lot_formulas[lot]], is_day_time)
 
-    if Point.ascendant not in points or \
-            traits.add_point not in points or \
-            traits.sub_point not in points:
-        return
+    return lots[0] if lots else None
 
-    asc = points[Point.ascendant]
-    add_point = points[traits.add_point]
-    sub_point = points[traits.sub_point]
 
-    if not is_day_time and traits.reverse_at_night:
-        longitude = (asc.longitude + sub_point.longitude - add_point.longitude) % 360
-        longitude_velocity = \
-            asc.longitude_velocity + sub_point.longitude_velocity - add_point.longitude_velocity
-    else:
-        longitude = (asc.longitude + add_point.longitude - sub_point.longitude) % 360
-        longitude_velocity = \
-            asc.longitude_velocity + add_point.longitude_velocity - sub_point.longitude_velocity
+def create_lots(
+        points: Dict[Point, PointSchema],
+        formulas: List[LotFormulaSchema],
+        is_day_time: bool,
+        obliquity: Optional[float] = None,
+        cusps: Optional[Tuple[Iterable[float], Iterable[float]]] = None,
+        sidereal_offset: float = 0
+) -> List[PointSchema]:
+    """
+    Creates every lot whose formula's points, lots, and house cusps exist.
 
-    return PointSchema(
-        name=lot,
-        points=[Point.ascendant, traits.add_point, traits.sub_point],
-        longitude=longitude,
-        longitude_velocity=longitude_velocity,
+    - Lots are evaluated in the zodiac of the given points and cusps, since a formula whose coefficients
+      do not sum to 1 is not preserved by shifting the result between zodiacs.
+
+    :param points: The current calculated points.
+    :param formulas: The formulas of the lots to create.
+    :param is_day_time: Whether it is day time.
+    :param obliquity: The obliquity of the ecliptic, to calculate lot declinations with.
+    :param cusps: The longitudes and longitude velocities of the 12 house cusps.
+    :param sidereal_offset: The ayanamsa that the points and cusps were shifted by, or 0 for the tropical zodiac.
+
+    :return: The created lots.
+    """
+    positions = {
+        name: (np.array([point.longitude]), np.array([np.nan if point.longitude_velocity is None
+                                                     else point.longitude_velocity]))
+        for name, point in points.items()
+    }
+
+    if cusps:
+        for number, (longitude, velocity) in enumerate(zip(*cusps)):
+            positions[f"Cusp {number + 1}"] = (np.array([longitude]), np.array([velocity]))
+
+    compiled_lots = compile_lots(formulas)
+    lot_positions = evaluate_lots(compiled_lots, positions, [is_day_time])
+    point_names = {point.value for point in Point}
+    lots = []
+
+    for name, terms, _ in compiled_lots:
+        if name not in lot_positions:
+            continue
+
+        longitude, longitude_velocity = lot_positions[name]
+        lots.append(PointSchema(
+            name=name,
+            points=[operand for _, operand in terms if operand in point_names],
+            longitude=float(longitude[0]),
+            longitude_velocity=None if np.isnan(longitude_velocity[0]) else float(longitude_velocity[0]),
+        ))
+
+    if obliquity is not None:
+        calculate_lot_declinations(lots, obliquity, sidereal_offset)
+
+    return lots
+
+
+def compile_lots(formulas: List[LotFormulaSchema]) -> List[CompiledLot]:
+    """
+    Compiles lot formulas into a graph of terms, ordered so that each lot comes after the lots it uses.
+
+    :param formulas: The lot formulas to compile.
+
+    :return: The compiled lots in the order to evaluate them.
+
+    :raises ValueError: If a lot's formula depends on itself.
+    """
+    formulas_by_name = {formula.name: formula for formula in formulas}
+    terms_by_name = {formula.name: parse_lot_formula(formula.formula) for formula in formulas}
+    ordered_names = order_lot_formulas(terms_by_name)
+
+    return [
+        (name, terms_by_name[name], formulas_by_name[name].reverse_at_night)
+        for name in ordered_names
+    ]
+
+
+def evaluate_lots(
+        compiled_lots: List[CompiledLot],
+        positions: LotPositions,
+        is_day_time: Iterable[bool]
+) -> LotPositions:
+    """
+    Evaluates compiled lots at every time in a series at once.
+
+    - Lots whose terms do not all exist are skipped, along with any lots using them.
+
+    :param compiled_lots: The compiled lots, ordered so that each lot comes after the lots it uses.
+    :param positions: The longitudes and velocities of each point and house cusp at each time.
+    :param is_day_time: Whether it is day time at each time.
+
+    :return: The longitudes and velocities of each lot at each time.
+    """
+    is_day_time = np.asarray(is_day_time, dtype=bool)
+    positions = dict(positions)
+    lot_positions = {}
+
+    for name, terms, reverse_at_night in compiled_lots:
+        if any(operand not in positions for _, operand in terms):
+            continue
+
+        longitude, longitude_velocity = 0, 0
+
+        for index, (sign, operand) in enumerate(terms):
+            if reverse_at_night and index > 0:
+                sign = np.where(is_day_time, sign, -sign)
+
+            longitude = longitude + sign * positions[operand][0]
+            longitude_velocity = longitude_velocity + sign * positions[operand][1]
+
+        lot_positions[name] = positions[name] = (np.mod(longitude, 360), longitude_velocity)
+
+    return lot_positions
+
+
+def calculate_lot_declinations(lots: List[PointSchema], obliquity: float, sidereal_offset: float = 0):
+    """
+    Calculates the declination of each lot by projecting its tropical longitude from the ecliptic.
+
+    - Sets the `declination` and `declination_velocity` attributes within `lots` items.
+
+    :param lots: The created lots.
+    :param obliquity: The obliquity of the ecliptic in degrees.
+    :param sidereal_offset: The ayanamsa to add back to sidereal lot longitudes, or 0 for the tropical zodiac.
+    """
+    if not lots:
+        return
+
+    longitudes = [lot.longitude + sidereal_offset for lot in lots]
+    declinations = ecliptic_to_equatorial(longitudes, obliquity)[1]
+    declination_velocities = ecliptic_to_declination_velocity(
+        longitudes,
+        [lot.longitude_velocity or 0 for lot in lots],
+        obliquity
     )
+
+    for lot, declination, declination_velocity in zip(lots, declinations.tolist(), declination_velocities.tolist()):
+        lot.declination = declination
+
+        if lot.longitude_velocity is not None:
+            lot.declination_velocity = declination_velocity
@@ -1,7 +1,10 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, List, Iterable
 
-from astro.schema import PointSchema, MidpointSchema
-from astro.util import Point
+import numpy as np
+
+from astro.collection import aspect_traits
+from astro.schema import PointSchema, MidpointSchema, EnabledPointsSchema
+from astro.util import Point, AspectType, wrap_degrees
 
 
 def create_midpoint(
@@ -102,3 +105,118 @@ def calculate_average_declination_velocity(
     if from_point.declination_velocity is not None \
             and to_point.declination_velocity is not None:
         return (to_point.declination_velocity + from_point.declination_velocity) / 2
+
+
+def find_aspecting_midpoints(
+        points: Dict[Point, PointSchema],
+        midpoints: List[MidpointSchema],
+        enabled: List[EnabledPointsSchema]
+) -> List[MidpointSchema]:
+    """
+    Finds the midpoints that form an aspect to any of the given points, without creating each midpoint.
+
+    - Midpoint longitudes and declinations are calculated together as arrays, then checked against the
+      widest orb of each aspect that any of the enabled points allow.
+
+    :param points: A collection of already created points, not including midpoints.
+    :param midpoints: The midpoints to check.
+    :param enabled: The enabled points, aspects, and orbs of the event.
+
+    :return: The midpoints within orb of an aspect to at least one point.
+    """
+    midpoints = [
+        midpoint for midpoint in midpoints
+        if midpoint.from_point in points and midpoint.to_point in points
+    ]
+
+    if not midpoints or not points:
+        return []
+
+    aspect_orbs = {}
+
+    for enabled_points in enabled:
+        for aspect, orb in enabled_points.orbs.aspect_to_orb().items():
+            if aspect in enabled_points.aspects:
+                aspect_orbs[aspect] = max(orb, aspect_orbs.get(aspect, 0))
+
+    from_points = [points[midpoint.from_point] for midpoint in midpoints]
+    to_points = [points[midpoint.to_point] for midpoint in midpoints]
+    midpoint_longitudes = calculate_midpoint_longitudes(
+        [point.longitude for point in from_points],
+        [point.longitude for point in to_points]
+    )
+    point_longitudes = np.array([point.longitude for point in points.values()])
+
+    # The separation between each midpoint and point, from 0 to 180 degrees.
+    separations = np.abs(wrap_degrees(midpoint_longitudes[:, np.newaxis] - point_longitudes))
+    is_aspecting = np.zeros(len(midpoints), dtype=bool)
+
+    for aspect, traits in aspect_traits.aspects.items():
+        if aspect in aspect_orbs:
+            orbs = np.minimum(np.abs(separations - traits.degrees), np.abs(360 - separations - traits.degrees))
+            is_aspecting |= np.any(orbs <= aspect_orbs[aspect], axis=1)
+
+    if AspectType.parallel in aspect_orbs or AspectType.contraparallel in aspect_orbs:
+        is_aspecting |= find_declination_aspecting(from_points, to_points, points.values(), aspect_orbs)
+
+    return [midpoint for midpoint, is_included in zip(midpoints, is_aspecting.tolist()) if is_included]
+
+
+def find_declination_aspecting(
+        from_points: List[PointSchema],
+        to_points: List[PointSchema],
+        points: Iterable[PointSchema],
+        aspect_orbs: Dict[AspectType, float]
+) -> np.ndarray:
+    """
+    Finds whether each midpoint forms a parallel or contraparallel to any of the given points.
+
+    :param from_points: The first point of each midpoint.
+    :param to_points: The second point of each midpoint.
+    :param points: The points to check for aspects to.
+    :param aspect_orbs: The widest enabled orb of each aspect.
+
+    :return: Whether each midpoint is within orb of a declination aspect.
+    """
+    midpoint_declinations = np.array([
+        calculate_midpoint_declination(from_point, to_point)
+        for from_point, to_point in zip(from_points, to_points)
+    ], dtype=float)
+    point_declinations = np.array([point.declination for point in points], dtype=float)
+    is_aspecting = np.zeros(len(midpoint_declinations), dtype=bool)
+
+    # Missing declinations are NaN, which never fall within orb.
+    with np.errstate(invalid="ignore"):
+        if AspectType.parallel in aspect_orbs:
+            parallel_orbs = np.abs(midpoint_declinations[:, np.newaxis] - point_declinations)
+            is_aspecting |= np.any(parallel_orbs <= aspect_orbs[AspectType.parallel], axis=1)
+
+        if AspectType.contraparallel in aspect_orbs:
+            contraparallel_orbs = np.abs(midpoint_declinations[:, np.newaxis] + point_declinations)
+            is_aspecting |= np.any(contraparallel_orbs <= aspect_orbs[AspectType.contraparallel], axis=1)
+
+    return is_aspecting
+
+
+def calculate_midpoint_longitudes(
+        from_longitudes: Iterable[float],
+        to_longitudes: Iterable[float]
+) -> np.ndarray:
+    """
+    Calculates the longitudes of many midpoints at once.
+
+    :param from_longitudes: The longitude of the first point of each midpoint.
+    :param to_longitudes: The longitude of the second point of each midpoint.
+
+    :return: The midpoint longitudes.
+    """
+    from_longitudes = np.asarray(from_longitudes, dtype=float)
+    to_longitudes = np.asarray(to_longitudes, dtype=float)
+    midpoint_longitudes = (to_longitudes + from_longitudes) / 2
+
+    # Ensure that the closer midpoint is the one used.
+    return np.where(
+        np.abs(to_longitudes - midpoint_longitudes) > 90,
+        (midpoint_longitudes + 180) % 360,
+        midpoint_longitudes
+    )
@@ -1,47 +1,93 @@
-from typing import Tuple, Dict
-
-from .ephemeris import get_point_properties, get_angles
-from astro.schema import EventSchema, PointSchema, EventSettingsSchema
-from astro.util import Point
-from .lot_factory import create_lot
-from .midpoint_factory import create_midpoint
+from typing import Tuple, Dict, Optional, List
+
+from .ephemeris import get_point_properties, get_angles, get_obliquity, get_houses, get_sidereal_offset, \
+    get_house_cusps_for_systems
+from astro.schema import EventSchema, PointSchema, EventSettingsSchema, SettingsSchema, PointMap, \
+    PointHousesSchema, DivisionsSchema, PointConditionSchema
+from astro.util import Point, HouseSystem, CoordinateMode, to_sidereal
+from .lot_factory import create_lots, preset_lot_formulas
+from .midpoint_factory import create_midpoint, find_aspecting_midpoints
 from .is_day_time import calculate_is_day_time
 from ...collection import point_traits
 from ...collection.lot_traits import lot_traits
 
+heliocentric_undefined_points = [Point.sun, Point.north_mode, Point.south_node]
+"""
+The points that have no position when observed from the center of the sun.
+"""
+
 
 def create_points(
         event_settings: EventSettingsSchema,
+        settings: SettingsSchema = SettingsSchema(),
+        previous: Optional[Tuple[PointMap, EventSchema]] = None
 ) -> Dict[Point, PointSchema]:
     """
     Creates a list of all calculated points.
 
     - Assumes the julian day has been calculated and set on the event.
+    - If a previous chart is given, bodies that have moved less than the incremental tolerance
+      since they were calculated are reused, and the angles are reused if the time and location are unchanged.
+    - If a sidereal ayanamsa is set, every point is derived in the tropical zodiac and then shifted
+      into the sidereal zodiac by a single offset, and lots are then evaluated from the sidereal points and cusps.
+    - Topocentric bodies are only reused if the location is unchanged, and heliocentric charts
+      skip the points that are undefined from the sun.
 
     :param event_settings: The current time, location, and enabled points.
+    :param settings: Settings used for calculations.
+    :param previous: The points and event of a previously calculated chart to reuse points from.
 
     :return: The calculated points.
     """
     points = {}
+    event = event_settings.event
 
     enabled_points = event_settings.get_all_enabled_points()
     enabled_midpoints = event_settings.get_all_enabled_midpoints()
 
+    previous_points, previous_event = previous or ({}, event)
+    days_elapsed = event.julian_day - previous_event.julian_day
+    is_same_place = event.latitude == previous_event.latitude and event.longitude == previous_event.longitude
+    is_same_time_and_place = days_elapsed == 0 and is_same_place
+    can_reuse_bodies = is_same_place or settings.coordinate_mode != CoordinateMode.topocentric
+
+    reused_points = []
+
     # Add the points for the angles.
-    for point_in_time in create_angles(event_settings.event):
+    for point_in_time in create_angles(event, settings.secondary_house_system):
         if point_in_time.name in enabled_points:
+            if is_same_time_and_place and point_in_time.name in previous_points:
+                point_in_time = reuse_point(previous_points[point_in_time.name])
+                reused_points.append(point_in_time)
+
             points[point_in_time.name] = point_in_time
 
     # Add each of the points with swiss ephemeris data.
     for point in point_traits.points:
+        if settings.coordinate_mode == CoordinateMode.heliocentric and point in heliocentric_undefined_points:
+            continue
+
         if point in enabled_points:
-            points[point] = create_swe_point(event_settings.event, point)
+            if can_reuse_bodies and point in previous_points and is_within_tolerance(
+                    previous_points[point], event.julian_day, previous_event.julian_day,
+                    settings.incremental_tolerance):
+                points[point] = reuse_point(previous_points[point])
+                reused_points.append(points[point])
+            else:
+                points[point] = create_swe_point(event, point, settings.coordinate_mode)
+
+    # Shift reused sidereal points back to the tropical zodiac, so every point is derived tropically.
+    if settings.sidereal_ayanamsa and reused_points:
+        shift_to_sidereal(reused_points, -get_sidereal_offset(previous_event.julian_day, settings.sidereal_ayanamsa))
 
     # Add the south node by reflecting the north node.
-    if Point.north_mode in enabled_points and Point.south_node in enabled_points:
+    if Point.north_mode in points and Point.south_node in enabled_points:
         points[Point.south_node] = create_south_node(points[Point.north_mode])
 
-    # Add each midpoint that is enabled.
+    # Add each midpoint that is enabled, or only those forming aspects when midpoints are lazy.
+    if settings.lazy_midpoints:
+        enabled_midpoints = find_aspecting_midpoints(points, enabled_midpoints, event_settings.enabled)
+
     for midpoint in enabled_midpoints:
         point = create_midpoint(points, midpoint)
 
@@ -50,24 +96,50 @@ def create_points(
 
     is_day_time = calculate_is_day_time(points)
 
-    # Add all lots.
-    for lot in lot_traits.lots:
-        if lot in enabled_points:
-            point = create_lot(points, lot, is_day_time)
+    # Add all enabled lots, calculating any preset lots that they depend on.
+    custom_lots = event_settings.get_all_enabled_lots()
+    enabled_lots = {*[lot for lot in lot_traits.lots if lot in enabled_points], *[lot.name for lot in custom_lots]}
+
+    # Shift every point into the sidereal zodiac at once, before the lots are evaluated from them.
+    sidereal_offset = get_sidereal_offset(event.julian_day, settings.sidereal_ayanamsa)
+
+    if settings.sidereal_ayanamsa:
+        shift_to_sidereal(list(points.values()), sidereal_offset)
+
+    if enabled_lots:
+        house_system = settings.secondary_house_system
+        cusps = get_house_cusps_for_systems(
+            event.julian_day, event.latitude, event.longitude, [house_system], house_system, sidereal_offset
+        )[house_system]
+        # [2] Cusps Speed: tuple of 12 float for cusps speeds.
+        cusp_speeds = get_houses(event.julian_day, event.latitude, event.longitude, house_system)[2]
+        lots = create_lots(
+            points,
+            [*preset_lot_formulas.values(), *custom_lots],
+            is_day_time,
+            get_obliquity(event.julian_day),
+            (cusps, cusp_speeds),
+            sidereal_offset
+        )
 
-            if point:
-                points[lot] = point
+        for lot in lots:
+            if lot.name in enabled_lots:
+                points[lot.name] = lot
 
     return points
 
 
-def create_angles(event: EventSchema) -> Tuple[PointSchema, PointSchema, PointSchema, PointSchema, PointSchema]:
+def create_angles(
+        event: EventSchema,
+        house_system: HouseSystem = HouseSystem.whole_sign
+) -> Tuple[PointSchema, PointSchema, PointSchema, PointSchema, PointSchema]:
     """
     Creates points for the Ascendant, MC, Descendant, IC, and Vertex at the given time and location.
 
     - Assumes the julian day has been calculated and set on the event.
 
     :param event: The current date, time, and location.
+    :param house_system: The secondary house system, whose cusps are calculated alongside the angles.
 
     :return:
         [0] The Ascendant point for the given event.
@@ -76,7 +148,7 @@ def create_angles(event: EventSchema) -> Tuple[PointSchema, PointSchema, PointSc
         [3] The IC point for the given event.
         [4] The Vertex point for the given event.
     """
-    asc, mc, desc, ic, vertex = get_angles(event.julian_day, event.latitude, event.longitude)
+    asc, mc, desc, ic, vertex = get_angles(event.julian_day, event.latitude, event.longitude, house_system)
 
     return (
         PointSchema(
@@ -117,7 +189,11 @@ def create_angles(event: EventSchema) -> Tuple[PointSchema, PointSchema, PointSc
     )
 
 
-def create_swe_point(event: EventSchema, point: Point) -> PointSchema:
+def create_swe_point(
+        event: EventSchema,
+        point: Point,
+        coordinate_mode: CoordinateMode = CoordinateMode.geocentric
+) -> PointSchema:
     """
     Creates a point object for a point name at the given time and location.
 
@@ -125,6 +201,7 @@ def create_swe_point(event: EventSchema, point: Point) -> PointSchema:
 
     :param event: The current time and location.
     :param point: The name of the point to create.
+    :param coordinate_mode: Where the point is observed from.
 
     :return: The calculated point object with calculated degrees from aries, declination, and speed.
     """
@@ -133,7 +210,7 @@ def create_swe_point(event: EventSchema, point: Point) -> PointSchema:
 
     traits = point_traits.points[point]
     longitude, longitude_velocity, declination, declination_velocity = \
-        get_point_properties(event.julian_day, traits.swe_id)
+        get_point_properties(event.julian_day, traits.swe_id, coordinate_mode, (event.latitude, event.longitude))
 
     return PointSchema(
         name=traits.name,
@@ -142,6 +219,7 @@ def create_swe_point(event: EventSchema, point: Point) -> PointSchema:
         longitude_velocity=longitude_velocity,
         declination=declination,
         declination_velocity=declination_velocity,
+        calculated_julian_day=event.julian_day,
     )
 
 
@@ -164,4 +242,63 @@ def create_south_node(north_node: PointSchema) -> PointSchema:
         longitude_velocity=north_node.longitude_velocity,
         declination=declination,
         declination_velocity=declination_velocity,
+        calculated_julian_day=north_node.calculated_julian_day,
     )
+
+
+def shift_to_sidereal(points: List[PointSchema], sidereal_offset: float):
+    """
+    Shifts the longitudes of points from the tropical to the sidereal zodiac with a single vector offset.
+
+    - Sets the `longitude` attribute of each point.
+
+    :param points: The points with tropical longitudes.
+    :param sidereal_offset: The ayanamsa to subtract from each longitude.
+    """
+    longitudes = to_sidereal([point.longitude for point in points], sidereal_offset)
+
+    for point, longitude in zip(points, longitudes.tolist()):
+        point.longitude = longitude
+
+
+def is_within_tolerance(point: PointSchema, julian_day: float, previous_julian_day: float, tolerance: float) -> bool:
+    """
+    Returns whether a point has moved less than the tolerance since it was calculated, based on its velocity.
+
+    - The elapsed time is measured from when the point's position was calculated, so a position reused
+      across a chain of updates is recalculated once its total movement exceeds the tolerance.
+
+    :param point: The previously calculated point.
+    :param julian_day: The julian day of the new chart.
+    :param previous_julian_day: The julian day of the previous chart, used if the point has no calculated day.
+    :param tolerance: The degrees of movement under which a point can be reused.
+
+    :return: Whether the point can be reused.
+    """
+    calculated_julian_day = previous_julian_day if point.calculated_julian_day is None \
+        else point.calculated_julian_day
+    days_elapsed = julian_day - calculated_julian_day
+
+    if point.longitude_velocity is None:
+        return days_elapsed == 0
+
+    longitude_movement = abs(point.longitude_velocity * days_elapsed)
+    declination_movement = abs((point.declination_velocity or 0) * days_elapsed)
+
+    return longitude_movement <= tolerance and declination_movement <= tolerance
+
+
+def reuse_point(point: PointSchema) -> PointSchema:
+    """
+    Copies a previously calculated point's position, clearing any houses, divisions, or condition.
+
+    :param point: The previously calculated point.
+
+    :return: The copied point.
+    """
+    return point.copy(update={
+        "houses_whole_sign": PointHousesSchema(),
+        "houses_secondary": PointHousesSchema(),
+        "divisions": DivisionsSchema(),
+        "condition": PointConditionSchema(),
+    })
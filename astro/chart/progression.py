@@ -0,0 +1,251 @@
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from astro.chart.point import create_points_with_attributes
+from astro.chart.point.point_attributes import calculate_point_attributes
+from astro.chart.point.ephemeris import get_julian_day, get_longitude_and_velocity, get_sidereal_offset
+from astro.collection import point_traits, aspect_traits
+from astro.schema import EventSchema, EventSettingsSchema, SettingsSchema, PointSchema, PointMap, \
+    ProgressionTimelineSettingsSchema, ProgressionTimelineSchema, ProgressedAspectSchema
+from astro.util import Point, EventType, wrap_degrees
+
+tropical_year_days = 365.24219
+"""
+The days in a tropical year, each of which is progressed by one day.
+"""
+
+progressed_days_per_poll = 0.5
+"""
+How many progressed days apart to sample positions when searching for aspects.
+This keeps the progressed moon within 8 degrees between samples.
+"""
+
+max_root_iterations = 50
+"""
+The most iterations used to find the exact time of a progressed aspect.
+"""
+
+root_precision_degrees = 1e-6
+"""
+The orb at which a progressed aspect is considered exact.
+"""
+
+
+def get_progressed_julian_day(natal_julian_day: float, target_julian_day: float) -> float:
+    """
+    Maps a target date to its day for a year progressed julian day.
+
+    :param natal_julian_day: The julian day of the natal event.
+    :param target_julian_day: The julian day to progress the natal event to.
+
+    :return: The progressed julian day.
+    """
+    return natal_julian_day + (target_julian_day - natal_julian_day) / tropical_year_days
+
+
+def create_progressed_event(natal_event: EventSchema, target_event: EventSchema, event_type: EventType) -> EventSchema:
+    """
+    Creates the day for a year progressed event of a natal event at a target date and location.
+
+    :param natal_event: The natal date, time, and location.
+    :param target_event: The date and location to progress to.
+    :param event_type: Whether the event is progressed or solar arc directed.
+
+    :return: The progressed event, at the target's location.
+    """
+    elapsed = target_event.utc_date.replace(tzinfo=None) - natal_event.utc_date.replace(tzinfo=None)
+    progressed_elapsed = elapsed / tropical_year_days
+    utc_date = natal_event.utc_date + progressed_elapsed
+
+    return target_event.copy(update={
+        "name": f"{natal_event.name} {event_type.value}",
+        "type": event_type,
+        "utc_date": utc_date,
+        "local_date": natal_event.local_date + progressed_elapsed,
+        "julian_day": get_julian_day(utc_date),
+    })
+
+
+def create_progressed_event_settings(
+        events: List[EventSettingsSchema]
+) -> Tuple[List[EventSettingsSchema], Dict[int, int]]:
+    """
+    Adds a progressed and solar arc event after each event that progresses or directs to another date.
+
+    :param events: The events to calculate.
+
+    :return:
+        [0] The events, along with any progressed and solar arc events.
+        [1] The index of the natal event of each solar arc event, by the solar arc event's index.
+    """
+    all_events = []
+    solar_arc_natal_indices = {}
+
+    for event_settings in events:
+        natal_index = len(all_events)
+        all_events.append(event_settings)
+
+        for target_event, event_type in [
+            (event_settings.progress_to, EventType.progressed),
+            (event_settings.solar_arc_to, EventType.solar_arc),
+        ]:
+            if target_event is None:
+                continue
+
+            if event_type == EventType.solar_arc:
+                solar_arc_natal_indices[len(all_events)] = natal_index
+
+            all_events.append(event_settings.copy(update={
+                "event": create_progressed_event(event_settings.event, target_event, event_type),
+                "transits": None,
+                "progress_to": None,
+                "solar_arc_to": None,
+            }))
+
+    return all_events, solar_arc_natal_indices
+
+
+def create_solar_arc_points(
+        natal_points: PointMap,
+        natal_event: EventSchema,
+        solar_arc_event: EventSchema,
+        settings: SettingsSchema = SettingsSchema()
+) -> Dict[Point, PointSchema]:
+    """
+    Directs every natal point by the solar arc, the distance the progressed sun has moved since birth.
+
+    - The natal points are reused, so directing every point is a single addition.
+    - Each directed point moves at the speed of the progressed sun.
+    - Declinations are cleared, since only the longitude is directed.
+    - In the sidereal zodiac, the progressed sun is shifted by the ayanamsa at its own time,
+      so the arc is measured in the same zodiac as the natal points.
+
+    :param natal_points: The calculated natal points.
+    :param natal_event: The natal date, time, and location.
+    :param solar_arc_event: The progressed date to direct the points to.
+    :param settings: Settings used for calculations.
+
+    :return: The directed points.
+    """
+    sun_id = point_traits.points[Point.sun].swe_id
+    natal_sun = natal_points[Point.sun].longitude if Point.sun in natal_points \
+        else get_longitude_and_velocity(natal_event.julian_day, sun_id)[0] - \
+        get_sidereal_offset(natal_event.julian_day, settings.sidereal_ayanamsa)
+    progressed_sun, progressed_sun_velocity = get_longitude_and_velocity(solar_arc_event.julian_day, sun_id)
+    progressed_sun -= get_sidereal_offset(solar_arc_event.julian_day, settings.sidereal_ayanamsa)
+    longitudes = (np.array([point.longitude for point in natal_points.values()]) + progressed_sun - natal_sun) % 360
+    points = {}
+
+    for point, longitude in zip(natal_points.values(), longitudes.tolist()):
+        points[point.name] = PointSchema(
+            name=point.name,
+            points=list(point.points),
+            longitude=longitude,
+            longitude_velocity=progressed_sun_velocity,
+        )
+
+        calculate_point_attributes(points[point.name], settings)
+
+    return points
+
+
+def calculate_progression_timeline(settings: ProgressionTimelineSettingsSchema) -> ProgressionTimelineSchema:
+    """
+    Finds the dates that progressed planets form exact aspects to natal points within a range of dates.
+
+    - Progressed positions are sampled every half progressed day, which is about 6 months of life,
+      and each aspect crossed between samples is solved with Newton's method on the ephemeris velocity.
+    - An aspect that a retrograde planet touches and leaves between two samples may be missed.
+
+    :param settings: The natal event, the range of dates, and the progressed points and aspects.
+
+    :return: The exact progressed aspects, ordered by date.
+    """
+    natal_points = create_points_with_attributes(settings.event)
+    natal_event = settings.event.event
+    natal_names = list(natal_points.keys())
+    natal_longitudes = np.array([point.longitude for point in natal_points.values()])
+    progressed_names = [point for point in settings.points if point in point_traits.points]
+
+    # Each aspect is crossed on either side of the natal point, except for conjunctions and oppositions.
+    aspect_offsets = [
+        (aspect, side * aspect_traits.aspects[aspect].degrees)
+        for aspect in settings.aspects
+        for side in ([1] if aspect_traits.aspects[aspect].degrees in (0, 180) else [1, -1])
+    ]
+    offsets = np.array([offset for _, offset in aspect_offsets], dtype=float)
+
+    start_day = get_progressed_julian_day(natal_event.julian_day, get_julian_day(settings.start_date))
+    end_day = get_progressed_julian_day(natal_event.julian_day, get_julian_day(settings.end_date))
+    sample_days = np.append(np.arange(start_day, end_day, progressed_days_per_poll), end_day)
+    aspects = []
+
+    for progressed_name in progressed_names:
+        swe_id = point_traits.points[progressed_name].swe_id
+        longitudes = np.array([get_longitude_and_velocity(day, swe_id)[0] for day in sample_days.tolist()])
+
+        # The orb to every aspect of every natal point at each sample, from -180 to 180.
+        targets = (natal_longitudes[:, np.newaxis] + offsets) % 360
+        orbs = wrap_degrees(longitudes[:, np.newaxis, np.newaxis] - targets)
+        is_crossing = (np.sign(orbs[:-1]) != np.sign(orbs[1:])) & (np.abs(orbs[:-1] - orbs[1:]) < 180)
+
+        for sample_index, natal_index, offset_index in zip(*np.nonzero(is_crossing)):
+            natal_name = natal_names[natal_index]
+
+            if natal_name == progressed_name and offsets[offset_index] == 0:
+                continue
+
+            target = float(targets[natal_index, offset_index])
+            progressed_day = find_exact_longitude(
+                swe_id, target, float(sample_days[sample_index]), float(sample_days[sample_index + 1]))
+
+            aspects.append(ProgressedAspectSchema(
+                progressed_point=progressed_name,
+                natal_point=natal_name,
+                type=aspect_offsets[offset_index][0],
+                utc_date=natal_event.utc_date + timedelta(
+                    days=(progressed_day - natal_event.julian_day) * tropical_year_days),
+                progressed_longitude=get_longitude_and_velocity(progressed_day, swe_id)[0],
+            ))
+
+    aspects.sort(key=lambda aspect: aspect.utc_date)
+
+    return ProgressionTimelineSchema(aspects=aspects)
+
+
+def find_exact_longitude(swe_id: int, target: float, start_day: float, end_day: float) -> float:
+    """
+    Finds when a point reaches a longitude within a range of julian days that it crosses it within.
+
+    - Newton's method is used with the ephemeris velocity, falling back to bisection whenever a step
+      would leave the range still known to contain the crossing.
+
+    :param swe_id: The swiss ephemeris ID of the point.
+    :param target: The longitude to find the point at.
+    :param start_day: The julian day before the crossing.
+    :param end_day: The julian day after the crossing.
+
+    :return: The julian day the point reaches the longitude.
+    """
+    low_orb = wrap_degrees(get_longitude_and_velocity(start_day, swe_id)[0] - target)
+    day = (start_day + end_day) / 2
+
+    for _ in range(max_root_iterations):
+        longitude, velocity = get_longitude_and_velocity(day, swe_id)
+        orb = wrap_degrees(longitude - target)
+
+        if abs(orb) < root_precision_degrees:
+            break
+
+        if np.sign(orb) == np.sign(low_orb):
+            start_day, low_orb = day, orb
+        else:
+            end_day = day
+
+        next_day = day - orb / velocity if velocity else start_day
+
+        day = next_day if start_day < next_day < end_day else (start_day + end_day) / 2
+
+    return day
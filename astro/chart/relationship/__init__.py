@@ -1 +1,2 @@
 from .calculate_relationships import *
+from .compact_relationships import *
@@ -3,6 +3,11 @@ from typing import Tuple, Optional
 from astro.schema import RelationshipSchema, PointSchema, AspectSchema, EventSchema
 from astro.util import EventType, AspectMovementType, AspectType
 
+moving_event_types = [EventType.transit, EventType.progressed, EventType.solar_arc]
+"""
+The types of events whose points move against the points of a base chart.
+"""
+
 
 def calculate_aspect_movement(
         relationship: RelationshipSchema,
@@ -134,11 +139,11 @@ def calculate_degree_types_direction(
     from_velocity, from_event = from_item
     to_velocity, to_event = to_item
 
-    # If aspects are between a transit chart and a base chart,
+    # If aspects are between a transit, progressed, or directed chart and a base chart,
     # set the base speed to 0 and assert that the bodies are moving in the same direction.
-    if from_event.type == EventType.transit and to_event.type != EventType.transit:
+    if from_event.type in moving_event_types and to_event.type not in moving_event_types:
         return from_velocity, 0, True
-    elif to_event.type == EventType.transit and from_event.type != EventType.transit:
+    elif to_event.type in moving_event_types and from_event.type not in moving_event_types:
         return 0, to_velocity, True
     elif not from_velocity or not to_velocity:
         return from_velocity, to_velocity, True
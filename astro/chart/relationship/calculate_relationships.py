@@ -1,6 +1,11 @@
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Tuple, Optional, Dict, Set
 
-from astro.util import AspectSortType, do_points_form_axis
+import numpy as np
+
+from astro.chart.point.ephemeris import get_julian_day, get_ayanamsa
+from astro.collection import aspect_traits
+from astro.util import AspectSortType, AspectType, do_points_form_axis
 from astro.schema import PointSchema, RelationshipSchema, SettingsSchema, EventSettingsSchema, EventSchema, \
     EnabledPointsSchema
 from .declination_aspect import calculate_declination_aspect
@@ -9,23 +14,36 @@ from .aspect_movement import calculate_aspect_movement
 from .phase import calculate_aspect_phase
 from .sign_aspect import calculate_sign_aspect
 
+candidate_orb_margin = 1e-9
+"""
+The degrees added to each orb when finding candidate relationships, so rounding never excludes an aspect.
+"""
+
 
 def calculate_relationships(
         from_items: Tuple[List[PointSchema], EventSettingsSchema],
         to_items: Tuple[List[PointSchema], EventSettingsSchema],
         is_one_chart: bool = False,
-        settings: SettingsSchema = SettingsSchema()
+        settings: SettingsSchema = SettingsSchema(),
+        previous: Optional[Tuple[List[RelationshipSchema], Set[str], Set[str]]] = None,
+        candidates: Optional[np.ndarray] = None
 ) -> List[RelationshipSchema]:
     """
     Calculates the relationships between each set of 2 points.
 
     - By default, orbs and allowed aspects are decided by the event with
       the highest priority (enabled point index) of enabled aspects.
+    - If previous relationships are given, the relationships between points that have not changed
+      are reused. Relationships that were previously removed for having no aspects stay removed.
 
     :param from_items: The points to calculate aspects from, and the event.
     :param to_items: The points to calculate aspects to, and the event.
     :param is_one_chart: If true, aspects will not be bi-directionally duplicated.
     :param settings: The settings to use for calculations.
+    :param previous: The relationships previously calculated with the same settings, and the names of
+                     the points in the from and to charts that have changed since then.
+    :param candidates: Whether each from point may form an aspect with each to point, from
+                       `find_relationship_candidates`. Relationships for other pairs are not created.
 
     :return: All calculated relationships.
     """
@@ -34,16 +52,41 @@ def calculate_relationships(
 
     from_points, from_event = from_items
     to_points, to_event = to_items
-    precession_correction = calculate_precession_correction_degrees(
+    # Sidereal positions are already fixed to the stars, so they need no precession correction.
+    precession_correction = 0 if settings.sidereal_ayanamsa else calculate_precession_correction_degrees(
         from_event.event, to_event.event)
     relationships = []
+    previous_relationships: Dict[Tuple[str, str], RelationshipSchema] = {}
+    changed_from_points, changed_to_points = set(), set()
+
+    if previous is not None:
+        previous_list, changed_from_points, changed_to_points = previous
+        previous_relationships = {
+            (relationship.from_point, relationship.to_point): relationship
+            for relationship in previous_list
+        }
 
-    for from_point in from_points:
+    for from_index, from_point in enumerate(from_points):
         if is_one_chart:
             # Skip the points that have been calculated already to avoid duplicates.
             to_points = to_points[1:]
 
-        for to_point in to_points:
+        for to_index, to_point in enumerate(to_points, from_index + 1 if is_one_chart else 0):
+            if previous is not None \
+                    and from_point.name not in changed_from_points \
+                    and to_point.name not in changed_to_points:
+                # Reuse the relationship between unchanged points, if it was not removed.
+                previous_relationship = previous_relationships.get((from_point.name, to_point.name))
+
+                if previous_relationship:
+                    relationships.append(previous_relationship)
+
+                continue
+
+            if candidates is not None and not candidates[from_index, to_index]:
+                # Skip the points that cannot form an aspect, whose relationship would be removed.
+                continue
+
             to_enabled, to_priority = to_event.get_enabled_for_point(to_point)
             from_enabled, from_priority = from_event.get_enabled_for_point(from_point)
 
@@ -52,24 +95,185 @@ def calculate_relationships(
             else:
                 enabled_settings = from_enabled
 
-            relationships.append(create_relationship(
+            relationship = create_relationship(
                 (from_point, from_event),
                 (to_point, to_event),
                 is_one_chart,
                 precession_correction,
                 enabled_settings,
                 settings
-            ))
+            )
+
+            if is_relationship_included(relationship, enabled_settings, settings):
+                relationships.append(relationship)
 
     sort_relationships(relationships, settings.aspect_sort)
 
-    if settings.remove_empty_relationships:
-        filter(
-            lambda rel: rel.ecliptic_aspect.type or rel.declination_aspect.type,
-            relationships,
+    return relationships
+
+
+def find_relationship_candidates(
+        all_points_and_events: List[Tuple[List[PointSchema], EventSettingsSchema]],
+        chart_pairs: List[Tuple[int, int]],
+        settings: SettingsSchema = SettingsSchema()
+) -> Optional[List[np.ndarray]]:
+    """
+    Finds which pairs of points may form an aspect, for many pairs of charts at once.
+
+    - The longitudes and declinations of every chart are stacked, so the points of every pair of charts
+      are compared in one array calculation, rather than creating a relationship for each pair of points.
+    - Each pair of charts uses the widest orb of each aspect enabled in either chart, so every pair of points
+      with an aspect is a candidate. The exact aspect is found when the relationship is created.
+    - Candidates are only found when relationships without aspects are removed, since otherwise every
+      relationship is kept.
+
+    :param all_points_and_events: The points and event of each chart.
+    :param chart_pairs: The indices of the from and to chart of each pair of charts to compare.
+    :param settings: The settings to use for calculations.
+
+    :return: For each pair of charts, whether each from point may form an aspect with each to point,
+             or None if every relationship is kept.
+    """
+    if not settings.calculate_relationships or \
+            not settings.remove_empty_relationships and settings.min_relationship_significance <= 0:
+        return None
+
+    if not chart_pairs:
+        return []
+
+    chart_sizes = [len(points) for points, _ in all_points_and_events]
+    chart_starts = np.cumsum([0, *chart_sizes])
+    longitudes = np.array([point.longitude for points, _ in all_points_and_events for point in points])
+    declinations = np.array([
+        np.nan if point.declination is None else point.declination
+        for points, _ in all_points_and_events for point in points
+    ])
+    chart_orbs = np.array([find_widest_orbs(event_settings) for _, event_settings in all_points_and_events])
+    corrections = np.array([
+        0 if settings.sidereal_ayanamsa else calculate_precession_correction_degrees(
+            all_points_and_events[from_chart][1].event, all_points_and_events[to_chart][1].event)
+        for from_chart, to_chart in chart_pairs
+    ])
+
+    # The index of the from point, to point, and pair of charts of every pair of points.
+    from_indices, to_indices, pair_indices = [], [], []
+
+    for pair_index, (from_chart, to_chart) in enumerate(chart_pairs):
+        from_grid, to_grid = np.meshgrid(
+            np.arange(chart_starts[from_chart], chart_starts[from_chart + 1]),
+            np.arange(chart_starts[to_chart], chart_starts[to_chart + 1]),
+            indexing="ij"
         )
+        from_indices.append(from_grid.ravel())
+        to_indices.append(to_grid.ravel())
+        pair_indices.append(np.full(from_grid.size, pair_index))
+
+    from_indices, to_indices, pair_indices = [
+        np.concatenate(indices) for indices in [from_indices, to_indices, pair_indices]
+    ]
+    pair_orbs = np.maximum(
+        chart_orbs[[from_chart for from_chart, _ in chart_pairs]],
+        chart_orbs[[to_chart for _, to_chart in chart_pairs]]
+    )[pair_indices]
+    ecliptic_orbs, parallel_orbs, contraparallel_orbs = pair_orbs[:, :-2], pair_orbs[:, -2], pair_orbs[:, -1]
+    aspect_degrees = np.array([aspect.degrees for aspect in aspect_traits.aspects.values()])
+
+    arcs = (longitudes[from_indices] - longitudes[to_indices]) % 360
+    is_candidate = np.zeros(len(arcs), dtype=bool)
+
+    # Matches the orbs of `calculate_aspect_orbs`, with and without the precession correction.
+    for arc in [arcs, arcs + corrections[pair_indices]]:
+        for orbs in [360 - aspect_degrees - arc[:, np.newaxis], aspect_degrees - arc[:, np.newaxis]]:
+            is_candidate |= np.any(np.abs(orbs) <= ecliptic_orbs + candidate_orb_margin, axis=1)
+
+    with np.errstate(invalid="ignore"):
+        is_candidate |= np.abs(declinations[to_indices] - declinations[from_indices]) <= \
+            parallel_orbs + candidate_orb_margin
+        is_candidate |= np.abs(declinations[from_indices] + declinations[to_indices]) <= \
+            contraparallel_orbs + candidate_orb_margin
+
+    pair_sizes = [chart_sizes[from_chart] * chart_sizes[to_chart] for from_chart, to_chart in chart_pairs]
+
+    return [
+        candidates.reshape(chart_sizes[from_chart], chart_sizes[to_chart])
+        for candidates, (from_chart, to_chart) in zip(np.split(is_candidate, np.cumsum(pair_sizes)[:-1]), chart_pairs)
+    ]
+
+
+def find_widest_orbs(event_settings: EventSettingsSchema) -> List[float]:
+    """
+    Finds the widest orb of each aspect across the enabled points of an event.
 
-    return relationships
+    :param event_settings: The event and its enabled points.
+
+    :return: The widest orb of each ecliptic aspect in the order of the aspect traits, followed by the
+             parallel and contraparallel orbs. Aspects that are never enabled have an orb of -1.
+    """
+    aspects = [*aspect_traits.aspects.keys(), AspectType.parallel, AspectType.contraparallel]
+    widest_orbs = [-1.0] * len(aspects)
+
+    for enabled_points in event_settings.enabled:
+        aspect_to_orb = enabled_points.orbs.aspect_to_orb()
+
+        for index, aspect in enumerate(aspects):
+            if aspect in enabled_points.aspects:
+                widest_orbs[index] = max(widest_orbs[index], aspect_to_orb[aspect])
+
+    return widest_orbs
+
+
+def is_relationship_included(
+        relationship: RelationshipSchema,
+        enabled_settings: EnabledPointsSchema = EnabledPointsSchema(),
+        settings: SettingsSchema = SettingsSchema()
+) -> bool:
+    """
+    Returns whether a relationship should be kept, based on the settings to remove empty
+    and insignificant relationships.
+
+    :param relationship: The relationship to check.
+    :param enabled_settings: The settings the relationship's aspects were calculated with.
+    :param settings: The settings to use for calculations.
+
+    :return: Whether to keep the relationship.
+    """
+    if settings.remove_empty_relationships \
+            and not relationship.ecliptic_aspect.type \
+            and not relationship.declination_aspect.type:
+        return False
+
+    if settings.min_relationship_significance > 0:
+        significance = calculate_relationship_significance(relationship, enabled_settings)
+
+        return significance >= settings.min_relationship_significance
+
+    return True
+
+
+def calculate_relationship_significance(
+        relationship: RelationshipSchema,
+        enabled_settings: EnabledPointsSchema = EnabledPointsSchema()
+) -> float:
+    """
+    Calculates the significance of the closest aspect in a relationship.
+
+    - Significance runs from 0 at the edge of an aspect's orb to 1 when the aspect is exact.
+
+    :param relationship: The relationship to find the significance of.
+    :param enabled_settings: The settings containing the orbs of each aspect.
+
+    :return: The significance of the closest aspect, or 0 if there are no aspects.
+    """
+    aspect_to_orb = enabled_settings.orbs.aspect_to_orb()
+    significance = 0
+
+    for aspect in relationship.get_aspects():
+        if not aspect.type or aspect.orb is None or not aspect_to_orb.get(aspect.type):
+            continue
+
+        significance = max(significance, 1 - abs(aspect.orb) / aspect_to_orb[aspect.type])
+
+    return significance
 
 
 def sort_relationships(relationships: List[RelationshipSchema], aspect_sort: AspectSortType):
@@ -158,10 +362,26 @@ def calculate_precession_correction_degrees(from_event: EventSchema, to_event: E
     :return: The degrees to add to all locations in the starting event to more accurately compare them
              to the ending event.
     """
-    date_difference = to_event.utc_date.replace(tzinfo=None) - \
-        from_event.utc_date.replace(tzinfo=None)
-    date_difference_in_years = date_difference.days / 365
-    precession_correction_degrees_per_year = 50.25 / 60 / 60
-    precession_correction_degrees = date_difference_in_years * precession_correction_degrees_per_year
+    return get_precession_between_days(
+        from_event.julian_day or get_julian_day(from_event.utc_date),
+        to_event.julian_day or get_julian_day(to_event.utc_date)
+    )
+
+
+@lru_cache(maxsize=4096)
+def get_precession_between_days(from_julian_day: float, to_julian_day: float) -> float:
+    """
+    Calculates the precession of the equinoxes between two julian days, from the change in the ayanamsa.
+
+    - The ayanamsa of each day is cached too, so a transit scan against a base chart only calculates
+      the ayanamsa of each new transit time.
+
+    :param from_julian_day: The starting julian day.
+    :param to_julian_day: The ending julian day.
+
+    :return: The degrees the equinox has precessed between the days, negative if the ending day is earlier.
+    """
+    if from_julian_day == to_julian_day:
+        return 0
 
-    return precession_correction_degrees
+    return get_ayanamsa(to_julian_day) - get_ayanamsa(from_julian_day)
@@ -0,0 +1,84 @@
+from typing import List, Dict, Union
+
+from astro.schema import PointSchema, RelationshipSchema, AspectSchema
+from astro.util import Point
+
+compact_relationship_columns = [
+    "fromPoint",
+    "toPoint",
+    "signAspect",
+    "phase",
+    "eclipticType",
+    "eclipticOrb",
+    "eclipticMovement",
+    "precessionCorrectedType",
+    "precessionCorrectedOrb",
+    "precessionCorrectedMovement",
+    "declinationType",
+    "declinationOrb",
+    "declinationMovement",
+]
+"""
+Defines the columns of each compact relationship row.
+"""
+
+
+def compact_relationships(
+        relationships: List[RelationshipSchema],
+        from_points: List[PointSchema],
+        to_points: List[PointSchema],
+) -> List[list]:
+    """
+    Converts relationships into compact rows, in the order of `compact_relationship_columns`.
+
+    - Points are replaced by their index within the list of points of their chart.
+    - Precession corrected aspects are left empty when they duplicate the ecliptic aspect.
+
+    :param relationships: The relationships to compact.
+    :param from_points: The points of the chart the relationships are from.
+    :param to_points: The points of the chart the relationships are to.
+
+    :return: The compact relationship rows.
+    """
+    from_indices = create_point_indices(from_points)
+    to_indices = from_indices if from_points is to_points else create_point_indices(to_points)
+    rows = []
+
+    for relationship in relationships:
+        ecliptic = relationship.ecliptic_aspect
+        corrected = relationship.precession_corrected_aspect
+        declination = relationship.declination_aspect
+
+        if relationship.precession_correction == 0 or (
+                corrected.type == ecliptic.type and corrected.orb == ecliptic.orb
+        ):
+            corrected = AspectSchema()
+
+        rows.append([
+            from_indices[relationship.from_point],
+            to_indices[relationship.to_point],
+            relationship.sign_aspect,
+            relationship.phase,
+            ecliptic.type,
+            ecliptic.orb,
+            ecliptic.movement,
+            corrected.type,
+            corrected.orb,
+            corrected.movement,
+            declination.type,
+            declination.orb,
+            declination.movement,
+        ])
+
+    return rows
+
+
+def create_point_indices(points: List[PointSchema]) -> Dict[Union[Point, str], int]:
+    """
+    Maps each point's name to its index.
+
+    :param points: The points of a chart, in order.
+
+    :return: The index of each point by name.
+    """
+    return {point.name: index for index, point in enumerate(points)}
@@ -0,0 +1,254 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from astro.chart.astrocartography import calculate_angle_longitudes
+from astro.chart.fixed_stars import get_fixed_star_index, fixed_star_catalog_path
+from astro.chart.point import create_points_with_attributes
+from astro.chart.point.ephemeris import get_obliquity, get_sidereal_time, get_house_cusps_from_armc, \
+    get_right_ascension_and_declination
+from astro.collection import point_traits
+from astro.schema import PointSchema, RelocationSettingsSchema, RelocationCollectionSchema, AngularPointSchema, \
+    ParanSchema
+from astro.util import Point, HouseSystem, armc_to_angles, wrap_degrees
+
+relocated_angles = [Point.ascendant, Point.midheaven, Point.descendant, Point.inner_heaven]
+"""
+The angles that points can be on, in the order of their longitudes in relocated charts.
+"""
+
+paran_latitude_step = 0.25
+"""
+The degrees of latitude between each sample when searching for parans.
+"""
+
+
+def calculate_relocations(
+        settings: RelocationSettingsSchema,
+        catalog_path: str = fixed_star_catalog_path
+) -> RelocationCollectionSchema:
+    """
+    Calculates the angles, houses, and angular points of an event at many locations at once,
+    and the latitudes where its points form parans.
+
+    - The points are calculated once at the event's location, since only the angles and houses depend on location.
+
+    :param settings: The event, the locations to relocate it to, and the points and stars to find parans between.
+    :param catalog_path: The path to the fixed star catalog, used if any paran stars are given.
+
+    :return: The relocated angles, houses, and angular points at each location, and the parans.
+    """
+    points = [
+        point for point in create_points_with_attributes(settings.event).values()
+        if point.name in point_traits.points
+    ]
+    jul_day = settings.event.event.julian_day
+    latitudes = np.array(settings.latitudes, dtype=float)
+    obliquity = get_obliquity(jul_day)
+    armcs = (get_sidereal_time(jul_day) + np.array(settings.longitudes, dtype=float)) % 360
+    ascendants, midheavens, vertices = armc_to_angles(armcs, latitudes, obliquity)
+    cusps = calculate_relocated_house_cusps(armcs, latitudes, ascendants, midheavens, obliquity, settings.house_system)
+    angles = np.stack([ascendants, midheavens, (ascendants + 180) % 360, (midheavens + 180) % 360], axis=1)
+    paran_bodies = find_paran_bodies(points, jul_day, settings.paran_stars, catalog_path)
+
+    return RelocationCollectionSchema(
+        house_system=settings.house_system,
+        ascendant=ascendants.tolist(),
+        midheaven=midheavens.tolist(),
+        vertex=vertices.tolist(),
+        cusps=cusps.tolist(),
+        point_houses=dict(zip(
+            [point.name for point in points],
+            find_point_houses(points, cusps).T.tolist()
+        )),
+        angular_points=find_angular_points(points, angles, settings.angular_orb),
+        parans=find_parans(*paran_bodies, settings.max_paran_latitude) if settings.calculate_parans else [],
+    )
+
+
+def calculate_relocated_house_cusps(
+        armcs: np.ndarray,
+        latitudes: np.ndarray,
+        ascendants: np.ndarray,
+        midheavens: np.ndarray,
+        obliquity: float,
+        house_system: HouseSystem
+) -> np.ndarray:
+    """
+    Calculates the house cusps at each location.
+
+    - Whole sign, equal, and porphyry cusps are derived from the angles of every location at once.
+      Other house systems are calculated from the ARMC of each location, without any ephemeris lookups,
+      and fall back to Porphyry at locations within the polar circles.
+
+    :param armcs: The right ascension of the Midheaven at each location.
+    :param latitudes: The latitude of each location.
+    :param ascendants: The longitude of the Ascendant at each location.
+    :param midheavens: The longitude of the Midheaven at each location.
+    :param obliquity: The obliquity of the ecliptic in degrees.
+    :param house_system: The house system to use.
+
+    :return: The longitude of the 12 house cusps, with a row for each location.
+    """
+    houses = np.arange(12)
+
+    if house_system == HouseSystem.whole_sign:
+        return ((ascendants - ascendants % 30)[:, np.newaxis] + 30 * houses) % 360
+
+    if house_system == HouseSystem.equal:
+        return (ascendants[:, np.newaxis] + 30 * houses) % 360
+
+    if house_system == HouseSystem.porphyry:
+        # Trisect each quadrant between the angles.
+        angles = np.stack([ascendants, (midheavens + 180) % 360, (ascendants + 180) % 360, midheavens], axis=1)
+        arcs = (np.roll(angles, -1, axis=1) - angles) % 360
+
+        return ((angles[..., np.newaxis] + arcs[..., np.newaxis] * np.arange(3) / 3) % 360).reshape(-1, 12)
+
+    return np.array([
+        get_house_cusps_from_armc(armc, latitude, obliquity, house_system)
+        for armc, latitude in zip(armcs.tolist(), latitudes.tolist())
+    ], dtype=float).reshape(-1, 12)
+
+
+def find_point_houses(points: List[PointSchema], cusps: np.ndarray) -> np.ndarray:
+    """
+    Finds the house of each point at each location.
+
+    :param points: The points to find the houses of.
+    :param cusps: The longitude of the 12 house cusps at each location.
+
+    :return: The house from 1 to 12, with a row for each location and a column for each point.
+    """
+    longitudes = np.array([point.longitude for point in points], dtype=float)
+    spans = (np.roll(cusps, -1, axis=1) - cusps) % 360
+    arcs = (longitudes[np.newaxis, :, np.newaxis] - cusps[:, np.newaxis, :]) % 360
+
+    return np.argmax(arcs < spans[:, np.newaxis, :], axis=2) + 1
+
+
+def find_angular_points(
+        points: List[PointSchema],
+        angles: np.ndarray,
+        orb: float
+) -> List[List[AngularPointSchema]]:
+    """
+    Finds the points within orb of each angle at each location.
+
+    :param points: The points to compare to the angles.
+    :param angles: The longitude of the Ascendant, Midheaven, Descendant, and IC at each location.
+    :param orb: The degrees of longitude within which a point is on an angle.
+
+    :return: The points on angles at each location, ordered by the closest orb.
+    """
+    longitudes = np.array([point.longitude for point in points], dtype=float)
+    orbs = wrap_degrees(longitudes[np.newaxis, np.newaxis, :] - angles[..., np.newaxis])
+    angular_points = [[] for _ in range(len(angles))]
+
+    for location, angle, point in zip(*[index.tolist() for index in np.nonzero(np.abs(orbs) <= orb)]):
+        angular_points[location].append(AngularPointSchema(
+            point=points[point].name,
+            angle=relocated_angles[angle],
+            orb=float(orbs[location, angle, point]),
+        ))
+
+    for location_points in angular_points:
+        location_points.sort(key=lambda angular_point: abs(angular_point.orb))
+
+    return angular_points
+
+
+def find_paran_bodies(
+        points: List[PointSchema],
+        jul_day: float,
+        stars: List[str],
+        catalog_path: str = fixed_star_catalog_path
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Finds the right ascension and declination of each point and fixed star to find parans between.
+
+    :param points: The points to find parans between.
+    :param jul_day: The julian day time to find the positions at.
+    :param stars: The names of the fixed stars to include.
+    :param catalog_path: The path to the fixed star catalog.
+
+    :return:
+        [0] The name of each point and star.
+        [1] The right ascension of each point and star in degrees.
+        [2] The declination of each point and star in degrees.
+    """
+    names = [point.name for point in points]
+    positions = [
+        get_right_ascension_and_declination(jul_day, point_traits.points[point.name].swe_id)
+        for point in points
+    ]
+
+    if stars:
+        by_longitude = get_fixed_star_index(jul_day, np.inf, catalog_path)[0]
+        star_positions = by_longitude[np.isin(by_longitude["name"], stars)]
+        names.extend(star_positions["name"].tolist())
+        positions.extend(zip(star_positions["right_ascension"].tolist(), star_positions["declination"].tolist()))
+
+    right_ascensions, declinations = np.array(positions, dtype=float).reshape(len(names), 2).T
+
+    return names, right_ascensions, declinations
+
+
+def find_parans(
+        names: List[str],
+        right_ascensions: np.ndarray,
+        declinations: np.ndarray,
+        max_latitude: float
+) -> List[ParanSchema]:
+    """
+    Finds the latitudes where two bodies are on angles at the same time.
+
+    - Two bodies are on their angles at the same time where the geographic longitudes of their
+      astrocartography lines are equal, which happens at the same latitude for every longitude.
+    - The difference between the lines of every pair of bodies and angles is sampled over latitude at once,
+      and each crossing is interpolated between samples.
+    - Pairs of Midheaven and IC lines never cross, since they are the same at every latitude.
+
+    :param names: The name of each body.
+    :param right_ascensions: The right ascension of each body in degrees.
+    :param declinations: The declination of each body in degrees.
+    :param max_latitude: The furthest latitude north and south to find parans within.
+
+    :return: The parans between each pair of bodies, ordered by latitude.
+    """
+    latitudes = np.arange(-max_latitude, max_latitude + paran_latitude_step / 2, paran_latitude_step)
+    angle_longitudes = calculate_angle_longitudes(right_ascensions, declinations, latitudes, 0)
+    # The line of each body and angle, with a row for each body and angle.
+    lines = np.concatenate([angle_longitudes[angle] for angle in relocated_angles])
+    line_bodies = np.tile(np.arange(len(names)), len(relocated_angles))
+    line_angles = np.repeat(np.arange(len(relocated_angles)), len(names))
+    is_meridian = np.isin(line_angles, [1, 3])
+
+    from_lines, to_lines = np.nonzero(
+        (line_bodies[:, np.newaxis] < line_bodies[np.newaxis, :]) &
+        ~(is_meridian[:, np.newaxis] & is_meridian[np.newaxis, :])
+    )
+    differences = wrap_degrees(lines[from_lines] - lines[to_lines])
+    before, after = differences[:, :-1], differences[:, 1:]
+    # Crossings change sign without wrapping around the opposite side of the earth.
+    pairs, samples = np.nonzero(
+        ((before < 0) != (after < 0)) & (np.abs(before) < 90) & (np.abs(after) < 90)
+    )
+    crossing_latitudes = latitudes[samples] + paran_latitude_step * before[pairs, samples] / \
+        (before[pairs, samples] - after[pairs, samples])
+
+    parans = [
+        ParanSchema(
+            from_point=names[line_bodies[from_line]],
+            from_angle=relocated_angles[line_angles[from_line]],
+            to_point=names[line_bodies[to_line]],
+            to_angle=relocated_angles[line_angles[to_line]],
+            latitude=latitude,
+        )
+        for from_line, to_line, latitude in zip(
+            from_lines[pairs].tolist(), to_lines[pairs].tolist(), crossing_latitudes.tolist()
+        )
+    ]
+    parans.sort(key=lambda paran: paran.latitude)
+
+    return parans
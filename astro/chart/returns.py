@@ -0,0 +1,108 @@
+import numpy as np
+
+from typing import Optional
+
+from astro.chart.point.ephemeris import get_longitude_and_velocity, get_sidereal_offset
+from astro.util import Point, ReturnType, Ayanamsa, wrap_degrees
+
+return_periods = {
+    ReturnType.solar_return: (Point.sun, 365.242189),
+    ReturnType.lunar_return: (Point.moon, 27.321582),
+}
+"""
+The returning planet of each type of return, and the mean days between its returns to the same longitude.
+"""
+
+max_return_iterations = 20
+"""
+The most Newton iterations used to find the exact times of returns.
+"""
+
+return_precision_degrees = 1e-7
+"""
+The orb at which a return is considered exact.
+"""
+
+
+def find_return_julian_days(
+        swe_id: int,
+        longitude: float,
+        start_day: float,
+        period: float,
+        count: int,
+        ayanamsa: Optional[Ayanamsa] = None
+) -> np.ndarray:
+    """
+    Finds the julian days that a planet returns to a longitude, starting after a given day.
+
+    - Each return is first estimated by the mean period between returns, then every return is refined
+      together with Newton's method on the ephemeris longitude and velocity.
+    - Only planets that never move retrograde, such as the sun and moon, have a single return each period.
+
+    :param swe_id: The swiss ephemeris ID of the returning planet.
+    :param longitude: The longitude the planet returns to.
+    :param start_day: The julian day to find the first return after.
+    :param period: The mean days between returns.
+    :param count: How many consecutive returns to find.
+    :param ayanamsa: The ayanamsa of the sidereal zodiac that the longitude is in, or None for the tropical zodiac.
+
+    :return: The julian day of each return.
+    """
+    start_longitude = get_return_positions(swe_id, np.array([start_day]), ayanamsa)[0, 0]
+    first_day = start_day + (longitude - start_longitude) % 360 / 360 * period
+    days = solve_return_julian_days(swe_id, longitude, first_day + np.arange(count) * period, ayanamsa)
+
+    # An estimate just after the start may converge on the return just before it.
+    if days[0] < start_day:
+        days = solve_return_julian_days(swe_id, longitude, days + period, ayanamsa)
+
+    return days
+
+
+def solve_return_julian_days(
+        swe_id: int,
+        longitude: float,
+        days: np.ndarray,
+        ayanamsa: Optional[Ayanamsa] = None
+) -> np.ndarray:
+    """
+    Refines estimates of the julian days that a planet returns to a longitude with Newton's method.
+
+    :param swe_id: The swiss ephemeris ID of the returning planet.
+    :param longitude: The longitude the planet returns to.
+    :param days: The estimated julian day of each return.
+    :param ayanamsa: The ayanamsa of the sidereal zodiac that the longitude is in, or None for the tropical zodiac.
+
+    :return: The exact julian day of each return.
+    """
+    for _ in range(max_return_iterations):
+        positions = get_return_positions(swe_id, days, ayanamsa)
+        orbs = wrap_degrees(positions[:, 0] - longitude)
+
+        if np.all(np.abs(orbs) < return_precision_degrees):
+            break
+
+        days = days - orbs / positions[:, 1]
+
+    return days
+
+
+def get_return_positions(swe_id: int, days: np.ndarray, ayanamsa: Optional[Ayanamsa] = None) -> np.ndarray:
+    """
+    Finds the longitude and longitude velocity of a planet at each day.
+
+    - In the sidereal zodiac, each day's longitude is shifted by that day's own ayanamsa, so that the
+      precession between the natal date and each return is accounted for.
+
+    :param swe_id: The swiss ephemeris ID of the planet.
+    :param days: The julian days to find the planet at.
+    :param ayanamsa: The ayanamsa of the sidereal zodiac, or None for the tropical zodiac.
+
+    :return: The longitude and longitude velocity at each day, as rows.
+    """
+    positions = np.array([get_longitude_and_velocity(day, swe_id) for day in days.tolist()])
+
+    if ayanamsa is not None:
+        positions[:, 0] -= [get_sidereal_offset(day, ayanamsa) for day in days.tolist()]
+
+    return positions
@@ -10,13 +10,15 @@ from .time_transits import calculate_transit_timing
 
 def calculate_transits(
         event_settings: EventSettingsSchema,
-        points: List[PointSchema]
+        points: List[PointSchema],
+        settings: SettingsSchema = SettingsSchema()
 ) -> List[TransitGroupSchema]:
     """
     Calculates the timing of transits for an event.
 
     :param event_settings: The current event settings.
     :param points: The calculated points for this event.
+    :param settings: The settings the event was calculated with, whose zodiac is used for transits too.
 
     :return: All calculated transits.
     """
@@ -40,7 +42,8 @@ def calculate_transits(
     while current_settings.event.utc_date < transit_event.utc_end_date:
         calculated_increments.append(create_increment(
             (points, event_settings),
-            current_settings
+            current_settings,
+            settings
         ))
 
         delta_increment = timedelta(hours=transit_settings.hours_per_poll)
@@ -61,20 +64,25 @@ def calculate_transits(
 
 def create_increment(
         base_items: Tuple[List[PointSchema], EventSettingsSchema],
-        event_settings: EventSettingsSchema
+        event_settings: EventSettingsSchema,
+        base_settings: SettingsSchema = SettingsSchema()
 ) -> TransitIncrement:
     """
     Generates the relationships for an increment of time.
 
     :param base_items: The base charts points and event.
     :param event_settings: The current event settings to calculate transits for.
+    :param base_settings: The settings the base chart was calculated with.
 
     :return: The calculated event and relationships at the current time.
     """
     relationship_map = {}
     is_one_chart = base_items[1].transits.is_one_chart()
     settings = SettingsSchema(
+        sidereal_ayanamsa=base_settings.sidereal_ayanamsa,
+        coordinate_mode=base_settings.coordinate_mode,
         calculate_relationship_phase=False,
+        remove_empty_relationships=False,
     )
     current_points = create_points_with_attributes(event_settings, settings)
     current_items = ([point for point in current_points.values()], event_settings)
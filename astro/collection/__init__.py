@@ -1,3 +1,4 @@
 from .zodiac_sign_traits import *
 from .point_traits import *
 from .aspect_traits import *
+from .division_tables import *
@@ -0,0 +1,83 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from astro.schema import PointSchema
+from astro.util import Point, zodiac_sign_order, zodiac_sign_index
+from .zodiac_sign_traits import zodiac_sign_traits
+from .point_traits import point_traits
+
+
+def create_degree_table(find_value) -> np.ndarray:
+    """
+    Creates a table of values for each integer degree of the zodiac.
+
+    - Tables are object arrays, so they can be indexed by a single degree or an array of degrees.
+
+    :param find_value: Finds the value for the traits of a sign and a degree within that sign.
+
+    :return: The value at each degree from 0 to 359.
+    """
+    table = np.empty(360, dtype=object)
+
+    for degree in range(360):
+        table[degree] = find_value(zodiac_sign_traits.signs[zodiac_sign_order[degree // 30]], degree % 30)
+
+    return table
+
+
+degree_sign_rulers = create_degree_table(lambda traits, degree: traits.domicile_traditional)
+"""
+The traditional sign ruler at each degree.
+"""
+
+degree_bound_rulers = create_degree_table(
+    lambda traits, degree: next(bound.ruler for bound in traits.bounds if degree < bound.to_degree))
+"""
+The bound ruler at each degree.
+"""
+
+degree_decan_rulers = create_degree_table(lambda traits, degree: traits.decans[degree // 10].ruler)
+"""
+The decan ruler at each degree.
+"""
+
+degree_twelfth_part_signs = create_degree_table(lambda traits, degree: traits.twelfth_parts[int(degree // 2.5)].sign)
+"""
+The twelfth part sign at each degree.
+"""
+
+degree_degree_signs = create_degree_table(lambda traits, degree: traits.degrees[degree].sign)
+"""
+The degree sign at each degree.
+"""
+
+sign_triplicity_rulers: List[Tuple[Point, Point, Point]] = [
+    tuple(zodiac_sign_traits.signs[sign].triplicity) for sign in zodiac_sign_order
+]
+"""
+The day time triplicity rulers of each sign, in the traditional order of signs.
+"""
+
+point_sign_dignities: Dict[Point, List[Tuple[bool, bool, bool, bool]]] = {
+    point: [
+        (sign in traits.domicile, sign in traits.exaltation, sign in traits.detriment, sign in traits.fall)
+        for sign in zodiac_sign_order
+    ]
+    for point, traits in point_traits.points.items()
+}
+"""
+Whether each planet is in its domicile, exaltation, detriment, or fall in each sign,
+in the traditional order of signs.
+"""
+
+
+def get_zodiac_degree(point: PointSchema) -> int:
+    """
+    Returns the integer degree of the zodiac that a point is in, for indexing division tables.
+
+    :param point: The point to find the degree of.
+
+    :return: The degree from 0 to 359.
+    """
+    return zodiac_sign_index[point.sign] * 30 + point.degrees_in_sign
@@ -5,9 +5,18 @@ from .aspect import *
 from .enabled_points import *
 from .relationship import *
 from .transit import *
+from .angle_series import *
 from .house import *
 from .sign import *
 from .traits import *
 from .settings import *
+from .midpoint_tree import *
+from .harmonic import *
+from .progression import *
+from .lunation import *
+from .fixed_star import *
+from .astrocartography import *
+from .relocation import *
 from .types import *
 from .chart import *
+from .returns import *
@@ -0,0 +1,136 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import Field, validator
+
+from astro.util import ZodiacSign, Point, HouseSystem, to_utc_date
+from .base import BaseSchema
+from .transit import TransitEventSchema
+
+max_angle_series_polls = 20160
+"""
+Defines the max number of times to calculate the angles and house cusps at, two weeks of polls each minute.
+"""
+
+
+class AngleSeriesSettingsSchema(BaseSchema):
+    """
+    Defines a time range and location to calculate the angles and house cusps throughout.
+    """
+    event: TransitEventSchema = Field(
+        ...,
+        title="Time Range and Location",
+        description="The location, and the UTC start and end dates to calculate angles between."
+    )
+    minutes_per_poll: float = Field(
+        1,
+        title="Minutes Per Poll",
+        description="How many minutes apart to calculate the angles and house cusps.",
+        gt=0
+    )
+    house_system: HouseSystem = Field(
+        HouseSystem.porphyry,
+        title="House System",
+        description="The house system to calculate the cusps of.",
+    )
+
+    @validator("event")
+    def validate_event(cls, event: TransitEventSchema) -> TransitEventSchema:
+        """
+        Rejects a time range that ends before it starts.
+        """
+        if to_utc_date(event.utc_end_date) < to_utc_date(event.utc_date):
+            raise ValueError("The end date must not be before the start date.")
+
+        return event
+
+    @validator("minutes_per_poll")
+    def validate_minutes_per_poll(cls, minutes_per_poll: float, values: dict) -> float:
+        """
+        Rejects polls too close together for the time range, which would calculate too many times.
+        """
+        if "event" in values:
+            event = values["event"]
+            range_minutes = (to_utc_date(event.utc_end_date) - to_utc_date(event.utc_date)).total_seconds() / 60
+
+            if range_minutes // minutes_per_poll + 1 > max_angle_series_polls:
+                raise ValueError(f"The time range must not include more than {max_angle_series_polls} polls.")
+
+        return minutes_per_poll
+
+
+class AngleChangeSchema(BaseSchema):
+    """
+    Defines a time when an angle moves into a new degree or sign.
+    """
+    name: Point = Field(
+        ...,
+        title="Angle Name",
+        description="The angle that changed degree or sign."
+    )
+    utc_date: datetime = Field(
+        ...,
+        title="UTC Date",
+        description="The UTC time the angle entered its new degree."
+    )
+    longitude: float = Field(
+        ...,
+        title="Longitude",
+        description="The degree of the zodiac entered, from 0 to 359."
+    )
+    sign: ZodiacSign = Field(
+        ...,
+        title="Zodiac Sign",
+        description="The zodiac sign the angle is in after the change."
+    )
+    degrees_in_sign: int = Field(
+        ...,
+        title="Degrees in Sign",
+        description="The degree within the sign entered, from 0 to 29."
+    )
+    is_sign_change: bool = Field(
+        False,
+        title="Is Sign Change",
+        description="Whether the angle entered a new sign."
+    )
+
+
+class AngleSeriesSchema(BaseSchema):
+    """
+    Defines the angles and house cusps at each time within a time range.
+    """
+    house_system: HouseSystem = Field(
+        HouseSystem.porphyry,
+        title="House System",
+        description="The house system of the cusps.",
+    )
+    utc_dates: List[datetime] = Field(
+        [],
+        title="UTC Dates",
+        description="The UTC time of each calculation."
+    )
+    ascendant: List[float] = Field(
+        [],
+        title="Ascendant",
+        description="The longitude of the Ascendant at each time."
+    )
+    midheaven: List[float] = Field(
+        [],
+        title="Midheaven",
+        description="The longitude of the Midheaven at each time."
+    )
+    vertex: List[float] = Field(
+        [],
+        title="Vertex",
+        description="The longitude of the Vertex at each time."
+    )
+    cusps: List[List[float]] = Field(
+        [],
+        title="House Cusps",
+        description="The longitude of the 12 house cusps at each time."
+    )
+    changes: List[AngleChangeSchema] = Field(
+        [],
+        title="Degree and Sign Changes",
+        description="Each time the Ascendant or Midheaven enters a new degree or sign, in order."
+    )
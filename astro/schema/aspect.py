@@ -149,6 +149,8 @@ class AspectOrbsSchema(BaseSchema):
             AspectType.quadri_novile: self.quadri_novile,
             AspectType.semi_sextile: self.semi_sextile,
             AspectType.quincunx: self.quincunx,
+            AspectType.parallel: self.parallel,
+            AspectType.contraparallel: self.contraparallel,
         }
 
 
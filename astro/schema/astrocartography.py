@@ -0,0 +1,114 @@
+from typing import List
+
+from pydantic import Field
+
+from astro.util import Point, traditional_points, modern_points
+from .base import BaseSchema
+from .settings import EventSettingsSchema
+
+
+class AstrocartographySettingsSchema(BaseSchema):
+    """
+    Defines an event to draw the angular lines of its points on a world map for.
+    """
+    event: EventSettingsSchema = Field(
+        ...,
+        title="Event",
+        description="The time of the event. The lines are the same for any location of the event."
+    )
+    points: List[Point] = Field(
+        [*traditional_points, *modern_points],
+        title="Points",
+        description="The points to draw angular lines for."
+    )
+    angles: List[Point] = Field(
+        [Point.ascendant, Point.midheaven, Point.descendant, Point.inner_heaven],
+        title="Angles",
+        description="The angles to draw the lines of, out of the Ascendant, Midheaven, Descendant, and IC."
+    )
+    latitude_step: float = Field(
+        1,
+        title="Latitude Step",
+        description="The degrees of latitude between each coordinate of a line.",
+        gt=0,
+        le=10
+    )
+    max_latitude: float = Field(
+        80,
+        title="Max Latitude",
+        description="The furthest latitude north and south to draw lines to.",
+        gt=0,
+        lt=90
+    )
+
+
+class GeoJsonMultiLineStringSchema(BaseSchema):
+    """
+    Defines a GeoJSON geometry made of one or more lines.
+    """
+    type: str = Field(
+        "MultiLineString",
+        title="Type",
+        description="The GeoJSON geometry type."
+    )
+    # Each line is a list of [longitude, latitude] pairs. The pairs are not validated one at a time,
+    # since the lines of a chart have thousands of them.
+    coordinates: List[list] = Field(
+        [],
+        title="Coordinates",
+        description="The longitude and latitude of each position along each line."
+    )
+
+
+class AstrocartographyLinePropertiesSchema(BaseSchema):
+    """
+    Defines the point and angle of an astrocartography line.
+    """
+    point: Point = Field(
+        ...,
+        title="Point",
+        description="The point that is on the angle along this line."
+    )
+    angle: Point = Field(
+        ...,
+        title="Angle",
+        description="The angle that the point is on along this line."
+    )
+
+
+class AstrocartographyLineSchema(BaseSchema):
+    """
+    Defines a GeoJSON feature of the locations where a point is on an angle.
+    """
+    type: str = Field(
+        "Feature",
+        title="Type",
+        description="The GeoJSON object type."
+    )
+    geometry: GeoJsonMultiLineStringSchema = Field(
+        ...,
+        title="Geometry",
+        description="The lines of locations, split where they cross the antimeridian or where the point "
+                    "never rises or sets."
+    )
+    properties: AstrocartographyLinePropertiesSchema = Field(
+        ...,
+        title="Properties",
+        description="The point and angle of this line."
+    )
+
+
+class AstrocartographyCollectionSchema(BaseSchema):
+    """
+    Defines a GeoJSON feature collection of the angular lines of each point.
+    """
+    type: str = Field(
+        "FeatureCollection",
+        title="Type",
+        description="The GeoJSON object type."
+    )
+    features: List[AstrocartographyLineSchema] = Field(
+        [],
+        title="Features",
+        description="The line of each point on each angle."
+    )
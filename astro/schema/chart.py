@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 from pydantic import Field
 
@@ -9,6 +9,7 @@ from .event import EventSchema
 from .relationship import RelationshipCollectionSchema
 from .transit import TransitGroupSchema
 from .house import HouseSchema
+from .lunation import LunationSchema
 
 
 class SummarySchema(BaseSchema):
@@ -46,6 +47,16 @@ class ChartSchema(BaseSchema):
         title="Event Time and Location",
         description="The date, time, and location of calculations."
     )
+    harmonic: int = Field(
+        1,
+        title="Harmonic",
+        description="The harmonic of this chart's positions, or 1 for the base chart."
+    )
+    derived_from: List[int] = Field(
+        [],
+        title="Derived From",
+        description="The indices of the two charts a composite or Davison chart is derived from."
+    )
     summary: Optional[SummarySchema] = Field(
         None,
         title="Chart Summary",
@@ -71,6 +82,16 @@ class ChartSchema(BaseSchema):
         title="Secondary Houses",
         description="Each secondary house, its sign, and the points within it."
     )
+    houses_comparison: Dict[HouseSystem, List[HouseSchema]] = Field(
+        {},
+        title="Compared Houses",
+        description="Each house of each compared house system, its sign, and the points within it."
+    )
+    prenatal_lunation: Optional[LunationSchema] = Field(
+        None,
+        title="Prenatal Lunation",
+        description="The last new or full moon before this chart."
+    )
     transits: List[TransitGroupSchema] = Field(
         [],
         title="Transits",
@@ -92,4 +113,10 @@ class ChartCollectionSchema(BaseSchema):
         title="Relationships",
         description="A list of sets of relationships within and between each chart."
     )
+    relationship_settings_hash: Optional[str] = Field(
+        None,
+        title="Relationship Settings Hash",
+        description="A hash of the settings the relationships were calculated with, "
+                    "so that updates only reuse relationships calculated with the same settings."
+    )
 
@@ -1,8 +1,9 @@
-from typing import List
+from typing import List, Union
 
-from pydantic import Field
+from pydantic import Field, validator
 
-from astro.util import Point, default_enabled_points, AspectType, default_enabled_aspects
+from astro.util import Point, default_enabled_points, AspectType, default_enabled_aspects, parse_lot_formula, \
+    is_lot_formula_term
 from .base import BaseSchema
 from .point import PointSchema
 from .aspect import AspectOrbsSchema
@@ -15,18 +16,61 @@ class MidpointSchema(BaseSchema):
     def __str__(self):
         return f"{self.from_point}-{self.to_point} Midpoint"
 
-    from_point: Point = Field(
+    from_point: Union[Point, str] = Field(
         None,
         title="From Point",
-        description="Defines the point to calculate a midpoint from."
+        description="Defines the point or lot to calculate a midpoint from."
     )
-    to_point: Point = Field(
+    to_point: Union[Point, str] = Field(
         None,
         title="To Point",
-        description="Defines the point to calculate a midpoint to."
+        description="Defines the point or lot to calculate a midpoint to."
     )
 
 
+class LotFormulaSchema(BaseSchema):
+    """
+    Defines a custom lot to calculate for a specific event.
+    """
+    name: str = Field(
+        ...,
+        title="Lot Name",
+        description="The name of this lot."
+    )
+    formula: str = Field(
+        ...,
+        title="Formula",
+        description="The points, lots, and house cusps (such as `Cusp 2`) to add and subtract, " +
+                    "separated by ` + ` and ` - `, such as `Ascendant + Moon - Sun`."
+    )
+    reverse_at_night: bool = Field(
+        True,
+        title="Reverse at Night",
+        description="If true, every term after the first will be negated in night charts."
+    )
+
+    @validator("name")
+    def validate_name(cls, name: str) -> str:
+        """
+        Rejects names that are already used by a point, preset lot, midpoint, or house cusp.
+        """
+        if is_lot_formula_term(name):
+            raise ValueError(f"The lot name {name} is already used by a point, preset lot, midpoint, or house cusp.")
+
+        return name
+
+    @validator("formula")
+    def validate_formula(cls, formula: str) -> str:
+        """
+        Rejects formulas whose terms are not each separated by ` + ` or ` - `.
+        """
+        for _, operand in parse_lot_formula(formula):
+            if not operand or "+" in operand or operand.startswith("-") or operand.endswith("-"):
+                raise ValueError(f"The formula {formula} must separate each term by ` + ` or ` - `.")
+
+        return formula
+
+
 class EnabledPointsSchema(BaseSchema):
     """
     Defines what points to calculate and how to calculate relationships between them.
@@ -41,6 +85,11 @@ class EnabledPointsSchema(BaseSchema):
         title="Enabled Midpoints",
         description="Defines what midpoints should be enabled for calculations."
     )
+    lots: List[LotFormulaSchema] = Field(
+        [],
+        title="Custom Lots",
+        description="Defines custom lots to calculate, which may use other lots and house cusps."
+    )
 
     orbs: AspectOrbsSchema = Field(
         AspectOrbsSchema(),
@@ -71,4 +120,7 @@ class EnabledPointsSchema(BaseSchema):
                 if midpoint.from_point == point_names[0] and midpoint.to_point == point_names[1]:
                     return True
 
+        if any(lot.name == point.name for lot in self.lots):
+            return True
+
         return point.name in self.points
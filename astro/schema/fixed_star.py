@@ -0,0 +1,118 @@
+from typing import List
+
+from pydantic import Field
+
+from astro.util import AspectType
+from .base import BaseSchema
+from .settings import EventSettingsSchema
+
+
+class FixedStarSettingsSchema(BaseSchema):
+    """
+    Defines an event to find the fixed stars conjunct or parallel to its points.
+    """
+    event: EventSettingsSchema = Field(
+        ...,
+        title="Event",
+        description="The time and location, and the enabled points to find fixed star contacts with."
+    )
+    max_magnitude: float = Field(
+        2.5,
+        title="Max Magnitude",
+        description="The dimmest visual magnitude of the stars to include. Brighter stars have lower magnitudes."
+    )
+    conjunction_orb: float = Field(
+        1,
+        title="Conjunction Orb",
+        description="The degrees of longitude within which a star is conjunct a point.",
+        ge=0
+    )
+    parallel_orb: float = Field(
+        1,
+        title="Parallel Orb",
+        description="The degrees of declination within which a star is parallel or contraparallel to a point.",
+        ge=0
+    )
+    stars: List[str] = Field(
+        [],
+        title="Stars",
+        description="The names of the stars to include, defaulting to every star within the max magnitude."
+    )
+
+
+class FixedStarSchema(BaseSchema):
+    """
+    Defines the position of a fixed star at a time.
+    """
+    name: str = Field(
+        ...,
+        title="Name",
+        description="The traditional name of the star, or its nomenclature if it has none."
+    )
+    nomenclature: str = Field(
+        "",
+        title="Nomenclature",
+        description="The Bayer or Flamsteed designation of the star, such as `alLeo`."
+    )
+    magnitude: float = Field(
+        ...,
+        title="Magnitude",
+        description="The visual magnitude of the star."
+    )
+    longitude: float = Field(
+        ...,
+        title="Longitude",
+        description="The ecliptic longitude of the star."
+    )
+    latitude: float = Field(
+        ...,
+        title="Latitude",
+        description="The ecliptic latitude of the star."
+    )
+    declination: float = Field(
+        ...,
+        title="Declination",
+        description="The declination of the star."
+    )
+
+
+class FixedStarContactSchema(BaseSchema):
+    """
+    Defines a fixed star that is conjunct, parallel, or contraparallel to a point.
+    """
+    star: str = Field(
+        ...,
+        title="Star",
+        description="The name of the fixed star."
+    )
+    point: str = Field(
+        ...,
+        title="Point",
+        description="The name of the point."
+    )
+    type: AspectType = Field(
+        ...,
+        title="Type",
+        description="Whether the star is conjunct, parallel, or contraparallel to the point."
+    )
+    orb: float = Field(
+        ...,
+        title="Orb",
+        description="The degrees from the point to the star, negative when the star is before the point."
+    )
+
+
+class FixedStarCollectionSchema(BaseSchema):
+    """
+    Defines the positions of the fixed stars at an event, and their contacts with its points.
+    """
+    stars: List[FixedStarSchema] = Field(
+        [],
+        title="Stars",
+        description="The position of each star, ordered by longitude."
+    )
+    contacts: List[FixedStarContactSchema] = Field(
+        [],
+        title="Contacts",
+        description="The stars conjunct, parallel, or contraparallel to each point, ordered by the closest orb."
+    )
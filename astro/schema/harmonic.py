@@ -0,0 +1,125 @@
+from typing import List, Union
+
+from pydantic import Field, validator
+
+from astro.util import Point, AspectType, longitude_aspects
+from .base import BaseSchema
+from .aspect import AspectOrbsSchema
+from .settings import EventSettingsSchema
+
+
+class HarmonicSpectrumSettingsSchema(BaseSchema):
+    """
+    Defines an event to calculate the harmonic spectrum of, and the harmonics and aspects to search.
+    """
+    event: EventSettingsSchema = Field(
+        ...,
+        title="Event",
+        description="The time and location, and the enabled points to find aspects between in each harmonic."
+    )
+    from_harmonic: int = Field(
+        1,
+        title="From Harmonic",
+        description="The first harmonic to calculate.",
+        ge=1
+    )
+    to_harmonic: int = Field(
+        180,
+        title="To Harmonic",
+        description="The last harmonic to calculate.",
+        ge=1
+    )
+    aspects: List[AspectType] = Field(
+        [AspectType.conjunction, AspectType.opposition],
+        title="Aspects",
+        description="The aspects to find between points within each harmonic chart."
+    )
+    orbs: AspectOrbsSchema = Field(
+        AspectOrbsSchema(),
+        title="Aspect Orbs",
+        description="The orbs of each aspect within each harmonic chart."
+    )
+    points: List[Point] = Field(
+        [],
+        title="Points",
+        description="The points to find aspects between, defaulting to every enabled point."
+    )
+
+    @validator("to_harmonic")
+    def validate_to_harmonic(cls, to_harmonic: int, values: dict) -> int:
+        """
+        Rejects a range of harmonics that ends before it starts.
+        """
+        if "from_harmonic" in values and to_harmonic < values["from_harmonic"]:
+            raise ValueError("The last harmonic must not be before the first harmonic.")
+
+        return to_harmonic
+
+    @validator("aspects", each_item=True)
+    def validate_aspect(cls, aspect: AspectType) -> AspectType:
+        """
+        Rejects declination aspects and aversions, which have no angle of longitude to find in a harmonic chart.
+        """
+        if aspect not in longitude_aspects:
+            raise ValueError(f"The aspect {aspect} is not formed by an angle of longitude.")
+
+        return aspect
+
+
+class HarmonicAspectSchema(BaseSchema):
+    """
+    Defines an aspect between two points within a harmonic chart.
+    """
+    from_point: Union[Point, str] = Field(
+        ...,
+        title="From Point",
+        description="The first point or lot in the aspect."
+    )
+    to_point: Union[Point, str] = Field(
+        ...,
+        title="To Point",
+        description="The second point or lot in the aspect."
+    )
+    type: AspectType = Field(
+        ...,
+        title="Aspect Type",
+        description="The type of aspect within the harmonic chart."
+    )
+    orb: float = Field(
+        ...,
+        title="Orb",
+        description="The degrees from exact of the aspect within the harmonic chart."
+    )
+
+
+class HarmonicSchema(BaseSchema):
+    """
+    Defines the aspects formed within a single harmonic chart.
+    """
+    harmonic: int = Field(
+        ...,
+        title="Harmonic",
+        description="The number that each longitude is multiplied by."
+    )
+    strength: float = Field(
+        0,
+        title="Strength",
+        description="The sum of the significance of each aspect, where an exact aspect is 1 "
+                    "and an aspect at the edge of its orb is 0."
+    )
+    aspects: List[HarmonicAspectSchema] = Field(
+        [],
+        title="Aspects",
+        description="The aspects between points within this harmonic chart, ordered by the closest orb."
+    )
+
+
+class HarmonicSpectrumSchema(BaseSchema):
+    """
+    Defines the aspects and strength of each harmonic of an event.
+    """
+    harmonics: List[HarmonicSchema] = Field(
+        [],
+        title="Harmonics",
+        description="The aspects and strength of each harmonic, in order."
+    )
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field, validator
+
+from astro.util import PhaseType, EclipseType, ZodiacSign, Ayanamsa
+from .base import BaseSchema
+
+
+class LunationSettingsSchema(BaseSchema):
+    """
+    Defines a page of lunations and eclipses to find after a date.
+    """
+    start_date: datetime = Field(
+        ...,
+        title="UTC Start Date",
+        description="The date to find lunations after. To fetch the next page, pass the previous page's next date."
+    )
+    page_size: int = Field(
+        50,
+        title="Page Size",
+        description="How many lunations to find.",
+        ge=1,
+        le=1000
+    )
+    phases: List[PhaseType] = Field(
+        [PhaseType.new, PhaseType.first_quarter, PhaseType.full, PhaseType.last_quarter],
+        title="Phases",
+        description="The phases to find, out of the new moon, first quarter, full moon, and last quarter."
+    )
+    eclipses_only: bool = Field(
+        False,
+        title="Eclipses Only",
+        description="If true, only the new and full moons that are eclipses are included."
+    )
+    sidereal_ayanamsa: Optional[Ayanamsa] = Field(
+        None,
+        title="Sidereal Ayanamsa",
+        description="If set, the moon's longitude and sign are in the sidereal zodiac of this ayanamsa, "
+                    "instead of the tropical zodiac.",
+    )
+
+    @validator("eclipses_only")
+    def validate_eclipses_only(cls, eclipses_only: bool, values: dict) -> bool:
+        """
+        Rejects finding only eclipses without the new or full moon, since no other phase can be an eclipse.
+        """
+        phases = values.get("phases") or []
+
+        if eclipses_only and PhaseType.new not in phases and PhaseType.full not in phases:
+            raise ValueError("Finding only eclipses requires the new or full moon phase.")
+
+        return eclipses_only
+
+
+class LunationSchema(BaseSchema):
+    """
+    Defines an exact phase between the sun and moon, and whether it is an eclipse.
+    """
+    phase: PhaseType = Field(
+        ...,
+        title="Phase",
+        description="The phase of the moon to the sun."
+    )
+    utc_date: datetime = Field(
+        ...,
+        title="UTC Date",
+        description="The time that the phase is exact."
+    )
+    julian_day: float = Field(
+        ...,
+        title="Julian Day",
+        description="The julian day that the phase is exact."
+    )
+    longitude: float = Field(
+        ...,
+        title="Moon Longitude",
+        description="The longitude of the moon when the phase is exact."
+    )
+    sign: ZodiacSign = Field(
+        ...,
+        title="Moon Sign",
+        description="The zodiac sign of the moon when the phase is exact."
+    )
+    eclipse: Optional[EclipseType] = Field(
+        None,
+        title="Eclipse",
+        description="The type of solar or lunar eclipse at this new or full moon, if any."
+    )
+
+
+class LunationPageSchema(BaseSchema):
+    """
+    Defines a page of lunations in order, and where the next page starts.
+    """
+    lunations: List[LunationSchema] = Field(
+        [],
+        title="Lunations",
+        description="The lunations in this page, ordered by date."
+    )
+    next_start_date: datetime = Field(
+        ...,
+        title="Next Start Date",
+        description="The start date of the next page of lunations."
+    )
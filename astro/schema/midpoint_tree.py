@@ -0,0 +1,104 @@
+from typing import List, Union
+
+from pydantic import Field
+
+from astro.util import Point
+from .base import BaseSchema
+from .settings import EventSettingsSchema
+
+
+class MidpointTreeSettingsSchema(BaseSchema):
+    """
+    Defines an event to calculate midpoint trees for, and the dial to sort them on.
+    """
+    event: EventSettingsSchema = Field(
+        ...,
+        title="Event",
+        description="The time and location, and the enabled points to calculate midpoints between."
+    )
+    dial_degrees: float = Field(
+        90,
+        title="Dial Degrees",
+        description="The size of the dial that positions are sorted on, such as 90 or 45 degrees.",
+        gt=0,
+        le=360
+    )
+    orb: float = Field(
+        1.5,
+        title="Orb",
+        description="The orb on the dial within which midpoints are included in a point's tree.",
+        ge=0
+    )
+    points: List[Union[Point, str]] = Field(
+        [],
+        title="Tree Points",
+        description="The points and lots to create trees for, defaulting to every enabled point and lot."
+    )
+
+
+class MidpointTreeEntrySchema(BaseSchema):
+    """
+    Defines a point or midpoint within orb of a point on the dial.
+    """
+    name: str = Field(
+        ...,
+        title="Name",
+        description="The name of the point or midpoint."
+    )
+    points: List[Union[Point, str]] = Field(
+        [],
+        title="Points",
+        description="The point or lot, or the two points or lots of the midpoint."
+    )
+    dial_longitude: float = Field(
+        ...,
+        title="Dial Longitude",
+        description="The position on the dial, from 0 to the dial degrees."
+    )
+    orb: float = Field(
+        ...,
+        title="Orb",
+        description="The degrees on the dial from the tree's point, negative when before it."
+    )
+
+
+class MidpointTreeSchema(BaseSchema):
+    """
+    Defines the points and midpoints within orb of a point on the dial.
+    """
+    name: Union[Point, str] = Field(
+        ...,
+        title="Point",
+        description="The point or lot at the root of this tree."
+    )
+    dial_longitude: float = Field(
+        ...,
+        title="Dial Longitude",
+        description="The position of the point on the dial, from 0 to the dial degrees."
+    )
+    entries: List[MidpointTreeEntrySchema] = Field(
+        [],
+        title="Entries",
+        description="The points and midpoints within orb, ordered by the closest orb."
+    )
+
+
+class MidpointTreeCollectionSchema(BaseSchema):
+    """
+    Defines the midpoint trees of an event.
+    """
+    dial_degrees: float = Field(
+        90,
+        title="Dial Degrees",
+        description="The size of the dial that positions are sorted on."
+    )
+    orb: float = Field(
+        1.5,
+        title="Orb",
+        description="The orb on the dial within which midpoints are included."
+    )
+    trees: List[MidpointTreeSchema] = Field(
+        [],
+        title="Trees",
+        description="The midpoint tree of each point."
+    )
@@ -2,7 +2,8 @@ from typing import Optional, List, Union
 
 from pydantic import Field
 
-from astro.util import ZodiacSign, Point, SectPlacement, Modality, Element, HouseSystem, SunCondition
+from astro.util import ZodiacSign, Point, SectPlacement, Modality, Element, HouseSystem, SunCondition, \
+    midpoint_name_pattern
 from .base import BaseSchema
 
 
@@ -159,9 +160,9 @@ class MinimalPointSchema(BaseSchema):
 
     def is_midpoint(self):
         """
-        :return: Returns true if this point represents a midpoint.
+        :return: Returns true if this point represents a midpoint, rather than a point or lot made of two points.
         """
-        return len(self.points) == 2
+        return midpoint_name_pattern.match(self.name) is not None
 
 
 class PointSchema(MinimalPointSchema):
@@ -191,6 +192,12 @@ class PointSchema(MinimalPointSchema):
         title="Declination Degrees Moved Per Day",
         description="The degrees from the equatorial that this point is moving per day."
     )
+    calculated_julian_day: Optional[float] = Field(
+        None,
+        title="Calculated Julian Day",
+        description="The julian day this point's position was calculated at, "
+                    "which stays the same when an updated chart reuses the position."
+    )
 
     is_stationary: Optional[bool] = Field(
         None,
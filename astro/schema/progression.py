@@ -0,0 +1,101 @@
+from datetime import datetime
+from typing import List, Union
+
+from pydantic import Field, validator
+
+from astro.util import Point, AspectType, major_aspects, traditional_points, longitude_aspects
+from .base import BaseSchema
+from .settings import EventSettingsSchema
+
+
+class ProgressionTimelineSettingsSchema(BaseSchema):
+    """
+    Defines a natal event and a range of dates to find exact progressed aspects within.
+    """
+    event: EventSettingsSchema = Field(
+        ...,
+        title="Natal Event",
+        description="The natal time and location, and the enabled natal points to find aspects to."
+    )
+    start_date: datetime = Field(
+        ...,
+        title="UTC Start Date",
+        description="The first date to find progressed aspects on."
+    )
+    end_date: datetime = Field(
+        ...,
+        title="UTC End Date",
+        description="The last date to find progressed aspects on."
+    )
+    points: List[Point] = Field(
+        traditional_points,
+        title="Progressed Points",
+        description="The progressed planets to find aspects from."
+    )
+    aspects: List[AspectType] = Field(
+        major_aspects,
+        title="Aspects",
+        description="The aspects to find between progressed and natal points."
+    )
+
+    @validator("end_date")
+    def validate_end_date(cls, end_date: datetime, values: dict) -> datetime:
+        """
+        Rejects a range of dates that ends before it starts.
+        """
+        if "start_date" in values and end_date < values["start_date"]:
+            raise ValueError("The end date must not be before the start date.")
+
+        return end_date
+
+    @validator("aspects", each_item=True)
+    def validate_aspect(cls, aspect: AspectType) -> AspectType:
+        """
+        Rejects declination aspects and aversions, which have no angle of longitude for a progressed point to cross.
+        """
+        if aspect not in longitude_aspects:
+            raise ValueError(f"The aspect {aspect} is not formed by an angle of longitude.")
+
+        return aspect
+
+
+class ProgressedAspectSchema(BaseSchema):
+    """
+    Defines when a progressed point forms an exact aspect to a natal point.
+    """
+    progressed_point: Point = Field(
+        ...,
+        title="Progressed Point",
+        description="The progressed planet forming the aspect."
+    )
+    natal_point: Union[Point, str] = Field(
+        ...,
+        title="Natal Point",
+        description="The natal point or lot being aspected."
+    )
+    type: AspectType = Field(
+        ...,
+        title="Aspect Type",
+        description="The type of aspect formed."
+    )
+    utc_date: datetime = Field(
+        ...,
+        title="UTC Date",
+        description="The date in life that the progressed aspect is exact."
+    )
+    progressed_longitude: float = Field(
+        ...,
+        title="Progressed Longitude",
+        description="The longitude of the progressed point when the aspect is exact."
+    )
+
+
+class ProgressionTimelineSchema(BaseSchema):
+    """
+    Defines the exact progressed aspects within a range of dates.
+    """
+    aspects: List[ProgressedAspectSchema] = Field(
+        [],
+        title="Progressed Aspects",
+        description="The exact progressed to natal aspects, ordered by date."
+    )
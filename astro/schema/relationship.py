@@ -89,18 +89,19 @@ class RelationshipSchema(Point2PointSchema):
         title="Sign Based Aspect",
         description="The type of aspect by sign between the points."
     )
+    # Default factories avoid deep copying a default aspect for every relationship.
     ecliptic_aspect: AspectSchema = Field(
-        AspectSchema(),
+        default_factory=AspectSchema,
         title="Ecliptic Aspect",
         description="The aspect between the two points based on ecliptic longitude."
     )
     precession_corrected_aspect: AspectSchema = Field(
-        AspectSchema(is_precession_corrected=True),
+        default_factory=lambda: AspectSchema(is_precession_corrected=True),
         title="Precession Corrected Ecliptic Aspect",
         description="The aspect between the two points based on ecliptic longitude, corrected for precession."
     )
     declination_aspect: AspectSchema = Field(
-        AspectSchema(),
+        default_factory=AspectSchema,
         title="Declination Aspect",
         description="The aspect between the two points based on declination."
     )
@@ -174,3 +175,14 @@ class RelationshipCollectionSchema(BaseSchema):
         title="Relationships",
         description="A list of relationships between every set of points in the first to the second chart."
     )
+    compact_columns: List[str] = Field(
+        [],
+        title="Compact Relationship Columns",
+        description="The name of each column in the compact relationships."
+    )
+    compact_relationships: List[list] = Field(
+        [],
+        title="Compact Relationships",
+        description="When relationships are compacted, a list of rows of relationship values in the order "
+                    "of the compact columns. Points are given as indices into each chart's points."
+    )
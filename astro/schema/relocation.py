@@ -0,0 +1,174 @@
+from typing import List, Dict
+
+from pydantic import Field, validator
+
+from astro.util import Point, HouseSystem
+from .base import BaseSchema
+from .settings import EventSettingsSchema
+
+
+class RelocationSettingsSchema(BaseSchema):
+    """
+    Defines an event to relocate to many locations at once, and the parans of its points.
+    """
+    event: EventSettingsSchema = Field(
+        ...,
+        title="Event",
+        description="The time of the event, and the enabled points to relocate."
+    )
+    latitudes: List[float] = Field(
+        [],
+        title="Latitudes",
+        description="The latitude of each location to relocate the event to."
+    )
+    longitudes: List[float] = Field(
+        [],
+        title="Longitudes",
+        description="The longitude of each location to relocate the event to, in the same order as the latitudes."
+    )
+    house_system: HouseSystem = Field(
+        HouseSystem.porphyry,
+        title="House System",
+        description="The house system to calculate the cusps of at each location.",
+    )
+    angular_orb: float = Field(
+        3,
+        title="Angular Orb",
+        description="The degrees of longitude within which a point is on an angle.",
+        ge=0
+    )
+    calculate_parans: bool = Field(
+        True,
+        title="Calculate Parans",
+        description="If true, the latitudes where two points are on angles at the same time are calculated."
+    )
+    paran_stars: List[str] = Field(
+        [],
+        title="Paran Stars",
+        description="The names of the fixed stars to include in the parans alongside the points."
+    )
+    max_paran_latitude: float = Field(
+        70,
+        title="Max Paran Latitude",
+        description="The furthest latitude north and south to find parans within.",
+        gt=0,
+        lt=90
+    )
+
+    @validator("latitudes", each_item=True)
+    def validate_latitude(cls, latitude: float) -> float:
+        """
+        Rejects latitudes beyond the poles.
+        """
+        if not -90 <= latitude <= 90:
+            raise ValueError(f"The latitude {latitude} must be between -90 and 90.")
+
+        return latitude
+
+    @validator("longitudes")
+    def validate_longitudes(cls, longitudes: List[float], values: dict) -> List[float]:
+        """
+        Rejects locations without both a latitude and a longitude.
+        """
+        if "latitudes" in values and len(longitudes) != len(values["latitudes"]):
+            raise ValueError("Each location must have both a latitude and a longitude.")
+
+        return longitudes
+
+
+class AngularPointSchema(BaseSchema):
+    """
+    Defines a point within orb of an angle at a location.
+    """
+    point: str = Field(
+        ...,
+        title="Point",
+        description="The name of the point."
+    )
+    angle: Point = Field(
+        ...,
+        title="Angle",
+        description="The angle the point is on."
+    )
+    orb: float = Field(
+        ...,
+        title="Orb",
+        description="The degrees from the angle to the point, negative when the point is before the angle."
+    )
+
+
+class ParanSchema(BaseSchema):
+    """
+    Defines a latitude where two points are on angles at the same time.
+    """
+    from_point: str = Field(
+        ...,
+        title="From Point",
+        description="The name of the first point or fixed star."
+    )
+    from_angle: Point = Field(
+        ...,
+        title="From Angle",
+        description="The angle the first point is on."
+    )
+    to_point: str = Field(
+        ...,
+        title="To Point",
+        description="The name of the second point or fixed star."
+    )
+    to_angle: Point = Field(
+        ...,
+        title="To Angle",
+        description="The angle the second point is on."
+    )
+    latitude: float = Field(
+        ...,
+        title="Latitude",
+        description="The latitude where both points are on their angles at the same time, at every longitude."
+    )
+
+
+class RelocationCollectionSchema(BaseSchema):
+    """
+    Defines the angles, houses, and angular points of an event at each location, and the parans of its points.
+    """
+    house_system: HouseSystem = Field(
+        HouseSystem.porphyry,
+        title="House System",
+        description="The house system of the cusps.",
+    )
+    ascendant: List[float] = Field(
+        [],
+        title="Ascendant",
+        description="The longitude of the Ascendant at each location."
+    )
+    midheaven: List[float] = Field(
+        [],
+        title="Midheaven",
+        description="The longitude of the Midheaven at each location."
+    )
+    vertex: List[float] = Field(
+        [],
+        title="Vertex",
+        description="The longitude of the Vertex at each location."
+    )
+    cusps: List[List[float]] = Field(
+        [],
+        title="House Cusps",
+        description="The longitude of the 12 house cusps at each location."
+    )
+    point_houses: Dict[str, List[int]] = Field(
+        {},
+        title="Point Houses",
+        description="The house from 1 to 12 of each point at each location."
+    )
+    angular_points: List[List[AngularPointSchema]] = Field(
+        [],
+        title="Angular Points",
+        description="The points within orb of an angle at each location."
+    )
+    parans: List[ParanSchema] = Field(
+        [],
+        title="Parans",
+        description="The latitudes where two points are on angles at the same time, ordered by latitude."
+    )
@@ -0,0 +1,99 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from astro.util import ReturnType
+from .base import BaseSchema
+from .settings import EventSettingsSchema, SettingsSchema
+from .chart import ChartCollectionSchema
+
+
+class ReturnSettingsSchema(BaseSchema):
+    """
+    Defines a natal event and the returns of its sun or moon to find.
+    """
+    event: EventSettingsSchema = Field(
+        ...,
+        title="Natal Event",
+        description="The natal time and location, and the enabled points of each return chart."
+    )
+    type: ReturnType = Field(
+        ReturnType.solar_return,
+        title="Return Type",
+        description="Whether to find the returns of the sun or the moon."
+    )
+    start_date: datetime = Field(
+        ...,
+        title="UTC Start Date",
+        description="The date to find the first return after."
+    )
+    count: int = Field(
+        1,
+        title="Return Count",
+        description="How many consecutive returns to find, such as 100 solar returns or 1300 lunar returns.",
+        ge=1,
+        le=1500
+    )
+    latitude: Optional[float] = Field(
+        None,
+        title="Return Latitude",
+        description="The latitude to calculate return charts at, defaulting to the natal latitude."
+    )
+    longitude: Optional[float] = Field(
+        None,
+        title="Return Longitude",
+        description="The longitude to calculate return charts at, defaulting to the natal longitude."
+    )
+    include_charts: bool = Field(
+        True,
+        title="Include Charts",
+        description="If true, the full chart at each return is calculated, otherwise only the times are found."
+    )
+    settings: SettingsSchema = Field(
+        SettingsSchema(),
+        title="Chart Settings",
+        description="The settings to calculate each return chart with. Any events are ignored."
+    )
+
+
+class ReturnSchema(BaseSchema):
+    """
+    Defines a single return of a planet to its natal longitude.
+    """
+    utc_date: datetime = Field(
+        ...,
+        title="UTC Date",
+        description="The time that the return is exact."
+    )
+    julian_day: float = Field(
+        ...,
+        title="Julian Day",
+        description="The julian day that the return is exact."
+    )
+    chart: Optional[ChartCollectionSchema] = Field(
+        None,
+        title="Return Chart",
+        description="The chart at the time of the return, and the relationships within it."
+    )
+
+
+class ReturnCollectionSchema(BaseSchema):
+    """
+    Defines the consecutive returns of a planet to its natal longitude.
+    """
+    type: ReturnType = Field(
+        ReturnType.solar_return,
+        title="Return Type",
+        description="Whether these are returns of the sun or the moon."
+    )
+    natal_longitude: float = Field(
+        ...,
+        title="Natal Longitude",
+        description="The natal longitude of the returning planet."
+    )
+    returns: List[ReturnSchema] = Field(
+        [],
+        title="Returns",
+        description="Each return, in order."
+    )
@@ -1,13 +1,14 @@
 from typing import List, Optional, Tuple
 
-from pydantic import Field
+from pydantic import Field, validator
 
-from astro.util import Point, HouseSystem, AspectSortType, RulershipType
+from astro.util import Point, HouseSystem, AspectSortType, RulershipType, Ayanamsa, CoordinateMode, \
+    parse_lot_formula, is_lot_formula_term, order_lot_formulas
 from .base import BaseSchema
 from .event import EventSchema
 from .point import PointSchema
 from .transit import TransitSettingsSchema
-from .enabled_points import EnabledPointsSchema, MidpointSchema
+from .enabled_points import EnabledPointsSchema, MidpointSchema, LotFormulaSchema
 
 
 class EventSettingsSchema(BaseSchema):
@@ -31,17 +32,45 @@ class EventSettingsSchema(BaseSchema):
         title="Transit Settings",
         description="The settings for transits to calculate for this event."
     )
+    harmonic: int = Field(
+        1,
+        title="Harmonic",
+        description="The harmonic chart to calculate, which multiplies the longitude of every point by this number.",
+        ge=1
+    )
+
+    progress_to: Optional[EventSchema] = Field(
+        None,
+        title="Progressed Start Time and Location",
+        description="The progressed date, time, and location of calculations. " +
+                    "If set, a secondary progressed chart is calculated after this event's chart."
+    )
+    solar_arc_to: Optional[EventSchema] = Field(
+        None,
+        title="Solar Arc Start Time and Location",
+        description="The solar arc date, time, and location of calculations. " +
+                    "If set, a solar arc directed chart is calculated after this event's chart."
+    )
+
+    @validator("enabled")
+    def validate_lots(cls, enabled: List[EnabledPointsSchema]) -> List[EnabledPointsSchema]:
+        """
+        Rejects custom lots with duplicate names, formulas using unknown terms, or formulas that depend on themselves.
+        """
+        lots = [lot for enabled_points in enabled for lot in enabled_points.lots]
+        terms_by_name = {lot.name: parse_lot_formula(lot.formula) for lot in lots}
 
-    # progress_to: Optional[EventSchema] = Field(
-    #     None,
-    #     title="Progressed Start Time and Location",
-    #     description="The progressed date, time, and location of calculations."
-    # )
-    # solar_arc_to: Optional[EventSchema] = Field(
-    #     None,
-    #     title="Solar Arc Start Time and Location",
-    #     description="The solar arc date, time, and location of calculations."
-    # )
+        if len(terms_by_name) != len(lots):
+            raise ValueError("Each custom lot must have a unique name.")
+
+        for name, terms in terms_by_name.items():
+            for _, operand in terms:
+                if operand not in terms_by_name and not is_lot_formula_term(operand):
+                    raise ValueError(f"The formula of {name} uses an unknown point, lot, or house cusp: {operand}.")
+
+        order_lot_formulas(terms_by_name)
+
+        return enabled
 
     def get_all_enabled_points(self) -> List[Point]:
         """
@@ -65,6 +94,17 @@ class EventSettingsSchema(BaseSchema):
 
         return points
 
+    def get_all_enabled_lots(self) -> List[LotFormulaSchema]:
+        """
+        :return: Returns all enabled custom lots.
+        """
+        lots = []
+
+        for enabled_points in self.enabled:
+            lots = [*lots, *enabled_points.lots]
+
+        return lots
+
     def get_enabled_for_point(
             self,
             point: PointSchema,
@@ -110,6 +150,23 @@ class SettingsSchema(BaseSchema):
         title="Secondary House System",
         description="The secondary house system to calculate, besides the default whole sign.",
     )
+    compare_house_systems: List[HouseSystem] = Field(
+        [],
+        title="Compared House Systems",
+        description="The house systems to calculate side by side, with the points in each of their houses.",
+    )
+    sidereal_ayanamsa: Optional[Ayanamsa] = Field(
+        None,
+        title="Sidereal Ayanamsa",
+        description="If set, every longitude and house cusp is in the sidereal zodiac of this ayanamsa, "
+                    "instead of the tropical zodiac.",
+    )
+    coordinate_mode: CoordinateMode = Field(
+        CoordinateMode.geocentric,
+        title="Coordinate Mode",
+        description="Where positions are observed from: the center of the earth, the event's location, "
+                    "or the center of the sun.",
+    )
     aspect_sort: AspectSortType = Field(
         AspectSortType.no_sort,
         title="Aspect Sort",
@@ -125,6 +182,24 @@ class SettingsSchema(BaseSchema):
         title="Rulership System",
         description="The list of rulership systems to use in sign rulership calculations."
     )
+    lazy_midpoints: bool = Field(
+        False,
+        title="Lazy Midpoints",
+        description="If true, only the enabled midpoints that form an aspect to a point in the same chart "
+                    "are created, instead of every enabled midpoint."
+    )
+    incremental_tolerance: float = Field(
+        1 / 60,
+        title="Incremental Update Tolerance",
+        description="When updating a previous chart, bodies that have moved less than these degrees "
+                    "since the previous chart are reused instead of recalculated."
+    )
+    field_mask: List[str] = Field(
+        [],
+        title="Field Mask",
+        description="The dotted paths of the fields to calculate and return, such as `charts.points.sign` "
+                    "or `relationships.relationships.eclipticAspect`. If empty, every field is returned."
+    )
 
     calculate_condition: bool = Field(
         True,
@@ -136,6 +211,29 @@ class SettingsSchema(BaseSchema):
         title="Do Calculate Divisions",
         description="This flag enables the calculation of the condition of sign divisions."
     )
+    calculate_secondary_houses: bool = Field(
+        True,
+        title="Do Calculate Secondary Houses",
+        description="This flag enables assigning points to the houses of the secondary house system. "
+                    "House cusps and lots still use the secondary house system when disabled."
+    )
+    calculate_prenatal_lunation: bool = Field(
+        False,
+        title="Do Calculate Prenatal Lunation",
+        description="This flag enables the calculation of the last new or full moon before each chart."
+    )
+    calculate_composite_charts: bool = Field(
+        False,
+        title="Do Calculate Composite Charts",
+        description="This flag enables a composite chart, of the midpoints of each point, for each pair of events. "
+                    "Each composite chart is only related to the pair of events it is derived from."
+    )
+    calculate_davison_charts: bool = Field(
+        False,
+        title="Do Calculate Davison Charts",
+        description="This flag enables a Davison chart, at the midpoint in time and space, for each pair of events. "
+                    "Each Davison chart is only related to the pair of events it is derived from."
+    )
     calculate_relationships: bool = Field(
         True,
         title="Do Calculate Relationships",
@@ -156,3 +254,17 @@ class SettingsSchema(BaseSchema):
         title="Do Remove Empty Relationships",
         description="This flag will remove any point relationships with no ecliptic or declination aspects."
     )
+    min_relationship_significance: float = Field(
+        0,
+        title="Minimum Relationship Significance",
+        description="Removes any point relationships whose closest aspect is less significant than this value. "
+                    "Significance runs from 0 at the edge of an aspect's orb to 1 when the aspect is exact.",
+        ge=0,
+        le=1
+    )
+    compact_relationships: bool = Field(
+        False,
+        title="Do Compact Relationships",
+        description="This flag will output relationships as compact arrays of point indices and aspects, "
+                    "in place of relationship objects."
+    )
@@ -0,0 +1,2 @@
+from .encode_json import *
+from .encode_columns import *
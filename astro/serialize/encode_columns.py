@@ -0,0 +1,249 @@
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Iterable
+
+import msgpack
+
+from astro.schema import ChartCollectionSchema, ChartSchema, RelationshipCollectionSchema, PointSchema
+from astro.util import AspectType, TransitType, zodiac_sign_order
+
+columnar_media_type = "application/msgpack"
+"""
+Defines the media type of the columnar chart encoding.
+"""
+
+aspect_type_order = list(AspectType)
+"""
+Defines the order of aspect types, used to encode aspect types as integer codes.
+"""
+
+aspect_type_codes = {aspect_type.value: index for index, aspect_type in enumerate(aspect_type_order)}
+"""
+Maps each aspect type to its integer code.
+"""
+
+sign_codes = {sign.value: index for index, sign in enumerate(zodiac_sign_order)}
+"""
+Maps each zodiac sign to its integer code.
+"""
+
+transit_type_order = list(TransitType)
+"""
+Defines the order of transit types, used to encode transit types as integer codes.
+"""
+
+transit_type_codes = {transit_type.value: index for index, transit_type in enumerate(transit_type_order)}
+"""
+Maps each transit type to its integer code.
+"""
+
+
+def serialize_columns(collection: ChartCollectionSchema) -> bytes:
+    """
+    Serializes calculated charts to MessagePack, with points, relationships, and transits as typed columns.
+
+    - Float columns are little endian float64 bytes, with NaN for missing values.
+    - Code columns are int8 bytes, with -1 for missing values. The value of each code is
+      found at its index within the `aspectTypes`, `signs`, or `transitTypes` lists.
+    - Point columns within relationships are int16 bytes, indexing into each chart's points.
+
+    :param collection: The calculated charts.
+
+    :return: The encoded charts.
+    """
+    return msgpack.packb(create_chart_collection_columns(collection), use_bin_type=True)
+
+
+def create_chart_collection_columns(collection: ChartCollectionSchema) -> Dict[str, Any]:
+    """
+    Creates the columns for a collection of charts and the relationships between them.
+
+    :param collection: The calculated charts.
+
+    :return: The columns of each chart and relationship collection.
+    """
+    point_indices = [
+        {name: index for index, name in enumerate(chart.points.keys())}
+        for chart in collection.charts
+    ]
+
+    return {
+        "aspectTypes": [aspect_type.value for aspect_type in aspect_type_order],
+        "signs": [sign.value for sign in zodiac_sign_order],
+        "transitTypes": [transit_type.value for transit_type in transit_type_order],
+        "charts": [create_chart_columns(chart) for chart in collection.charts],
+        "relationships": [
+            create_relationship_columns(
+                relationships,
+                point_indices[relationships.from_chart_index],
+                point_indices[relationships.to_chart_index],
+            )
+            for relationships in collection.relationships
+        ],
+    }
+
+
+def create_chart_columns(chart: ChartSchema) -> Dict[str, Any]:
+    """
+    Creates the columns for a chart's points and transits.
+
+    :param chart: The calculated chart.
+
+    :return: The chart's event and its columns.
+    """
+    points: List[PointSchema] = list(chart.points.values())
+    transits = [transit for group in chart.transits for transit in group.transits]
+
+    return {
+        "name": chart.event.name,
+        "type": chart.event.type,
+        "julianDay": chart.event.julian_day,
+        "points": {
+            "name": [point.name for point in points],
+            "longitude": encode_floats(point.longitude for point in points),
+            "longitudeVelocity": encode_floats(point.longitude_velocity for point in points),
+            "declination": encode_floats(point.declination for point in points),
+            "declinationVelocity": encode_floats(point.declination_velocity for point in points),
+            "sign": encode_codes(point.sign for point in points),
+            "houseWholeSign": encode_codes(point.houses_whole_sign.house for point in points),
+            "houseSecondary": encode_codes(point.houses_secondary.house for point in points),
+        },
+        "transits": {
+            "name": [transit.name for transit in transits],
+            "fromPoint": [transit.from_point for transit in transits],
+            "toPoint": [transit.to_point for transit in transits],
+            "transitType": encode_codes(transit.transit_type for transit in transits),
+            "aspectType": encode_codes(transit.type for transit in transits),
+            "orb": encode_floats(transit.orb for transit in transits),
+            "utcExactTimestamp": encode_floats(
+                encode_timestamp(transit.utc_exact_date) for transit in transits
+            ),
+        },
+    }
+
+
+def create_relationship_columns(
+        collection: RelationshipCollectionSchema,
+        from_indices: Dict[str, int],
+        to_indices: Dict[str, int],
+) -> Dict[str, Any]:
+    """
+    Creates the columns for the relationships between two charts.
+
+    :param collection: The relationships between two charts.
+    :param from_indices: The index of each point in the chart the relationships are from.
+    :param to_indices: The index of each point in the chart the relationships are to.
+
+    :return: The relationship columns.
+    """
+    if collection.compact_relationships:
+        # Compact relationships already reference points by index.
+        rows = [dict(zip(collection.compact_columns, row)) for row in collection.compact_relationships]
+        from_points = [row["fromPoint"] for row in rows]
+        to_points = [row["toPoint"] for row in rows]
+        aspects = {
+            name: ([row[f"{name}Type"] for row in rows], [row[f"{name}Orb"] for row in rows])
+            for name in ["ecliptic", "precessionCorrected", "declination"]
+        }
+    else:
+        relationships = collection.relationships
+        from_points = [from_indices[relationship.from_point] for relationship in relationships]
+        to_points = [to_indices[relationship.to_point] for relationship in relationships]
+        aspects = {
+            name: (
+                [getattr(relationship, attribute).type for relationship in relationships],
+                [getattr(relationship, attribute).orb for relationship in relationships],
+            )
+            for name, attribute in [
+                ("ecliptic", "ecliptic_aspect"),
+                ("precessionCorrected", "precession_corrected_aspect"),
+                ("declination", "declination_aspect"),
+            ]
+        }
+
+    columns = {
+        "fromChartIndex": collection.from_chart_index,
+        "toChartIndex": collection.to_chart_index,
+        "fromPoint": encode_array("h", from_points),
+        "toPoint": encode_array("h", to_points),
+    }
+
+    for name, (types, orbs) in aspects.items():
+        columns[f"{name}Type"] = encode_codes(types)
+        columns[f"{name}Orb"] = encode_floats(orbs)
+
+    return columns
+
+
+def encode_floats(values: Iterable[Optional[float]]) -> bytes:
+    """
+    Encodes a column of floats, replacing missing values with NaN.
+
+    :param values: The values to encode.
+
+    :return: The little endian float64 bytes.
+    """
+    return encode_array("d", [float("nan") if value is None else value for value in values])
+
+
+def encode_codes(values: Iterable[Optional[str]]) -> bytes:
+    """
+    Encodes a column of aspect types, signs, transit types, or house numbers as integer codes.
+
+    :param values: The values to encode.
+
+    :return: The int8 bytes, with -1 for missing values.
+    """
+    return encode_array("b", [encode_code(value) for value in values])
+
+
+def encode_code(value: Any) -> int:
+    """
+    Encodes a single value as an integer code.
+
+    :param value: The aspect type, sign, transit type, or house number to encode.
+
+    :return: The code of the value, or -1 if it is missing.
+    """
+    if value is None:
+        return -1
+    elif isinstance(value, int):
+        return value
+    elif value in aspect_type_codes:
+        return aspect_type_codes[value]
+    elif value in sign_codes:
+        return sign_codes[value]
+
+    return transit_type_codes[value]
+
+
+def encode_array(type_code: str, values: List[Any]) -> bytes:
+    """
+    Encodes a list of values as little endian bytes.
+
+    :param type_code: The `array` type code of the values.
+    :param values: The values to encode.
+
+    :return: The encoded bytes.
+    """
+    encoded = array(type_code, values)
+
+    if sys.byteorder == "big":
+        encoded.byteswap()
+
+    return encoded.tobytes()
+
+
+def encode_timestamp(date: datetime) -> float:
+    """
+    Encodes a date as seconds since the unix epoch, treating dates without a timezone as UTC.
+
+    :param date: The date to encode.
+
+    :return: The unix timestamp.
+    """
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return date.timestamp()
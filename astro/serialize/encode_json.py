@@ -0,0 +1,90 @@
+from typing import Any, Dict, Tuple, Type, Optional
+
+import orjson
+from pydantic import BaseModel
+
+from astro.util import FieldMask
+
+field_aliases: Dict[Type[BaseModel], Tuple[Tuple[str, str], ...]] = {}
+"""
+A cache from each schema class to its pairs of field names and camel cased aliases.
+"""
+
+
+def serialize_schema(schema: Any, field_mask: Optional[FieldMask] = None) -> bytes:
+    """
+    Serializes a schema, or any structure containing schemas, to JSON bytes.
+
+    - Produces the same output as FastAPI's default encoding, with camel cased field aliases.
+    - Schemas are read attribute by attribute, skipping pydantic's `.dict()` copies and
+      the standard `json` module.
+
+    :param schema: The schema to serialize.
+    :param field_mask: If given, only the fields within this mask are serialized.
+
+    :return: The encoded JSON.
+    """
+    if field_mask:
+        schema = project_schema(schema, field_mask)
+
+    return orjson.dumps(schema, default=encode_schema, option=orjson.OPT_NON_STR_KEYS)
+
+
+def project_schema(value: Any, field_mask: FieldMask) -> Any:
+    """
+    Trims a schema, or any structure containing schemas, to the fields within a field mask.
+
+    - Maps and lists apply the same field mask to each of their values.
+    - Values beneath a fully included field are left as is.
+
+    :param value: The value to trim.
+    :param field_mask: The fields to keep.
+
+    :return: The trimmed value.
+    """
+    if not field_mask:
+        return value
+    elif isinstance(value, BaseModel):
+        return {
+            alias: project_schema(getattr(value, name), field_mask[name])
+            for name, alias in get_field_aliases(type(value))
+            if name in field_mask
+        }
+    elif isinstance(value, dict):
+        return {key: project_schema(item, field_mask) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [project_schema(item, field_mask) for item in value]
+
+    return value
+
+
+def encode_schema(value: Any) -> Any:
+    """
+    Encodes a value that orjson cannot natively serialize.
+
+    - Schemas are encoded one level at a time, leaving nested schemas to be encoded by orjson.
+
+    :param value: The value to encode.
+
+    :return: A serializable mapping of the schema's aliases to its values.
+    """
+    if isinstance(value, BaseModel):
+        return {alias: getattr(value, name) for name, alias in get_field_aliases(type(value))}
+
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def get_field_aliases(schema_type: Type[BaseModel]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Returns the field names and aliases of a schema, calculating them once per schema class.
+
+    :param schema_type: The schema class to find the fields of.
+
+    :return: Each field name with its alias.
+    """
+    if schema_type not in field_aliases:
+        field_aliases[schema_type] = tuple(
+            (name, field.alias) for name, field in schema_type.__fields__.items()
+        )
+
+    return field_aliases[schema_type]
@@ -2,3 +2,6 @@ from .enums import *
 from .globals import *
 from .functions import *
 from .midpoints import *
+from .field_mask import *
+from .coordinates import *
+from .lot_formulas import *
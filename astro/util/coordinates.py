@@ -0,0 +1,140 @@
+from typing import Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from astro.util import wrap_degrees
+
+
+def ecliptic_to_equatorial(
+        longitudes: Iterable[float],
+        obliquity: float,
+        latitudes: Optional[Iterable[float]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts ecliptic coordinates to equatorial coordinates.
+
+    :param longitudes: The ecliptic longitudes in degrees.
+    :param obliquity: The obliquity of the ecliptic in degrees.
+    :param latitudes: The ecliptic latitudes in degrees, or None for points on the ecliptic.
+
+    :return:
+        [0] The right ascension of each point in degrees.
+        [1] The declination of each point in degrees.
+    """
+    longitudes = np.radians(np.asarray(longitudes, dtype=float))
+    latitudes = np.zeros_like(longitudes) if latitudes is None \
+        else np.radians(np.asarray(latitudes, dtype=float))
+    obliquity = np.radians(obliquity)
+
+    sin_declinations = np.sin(latitudes) * np.cos(obliquity) + \
+        np.cos(latitudes) * np.sin(obliquity) * np.sin(longitudes)
+    right_ascensions = np.arctan2(
+        np.sin(longitudes) * np.cos(obliquity) - np.tan(latitudes) * np.sin(obliquity),
+        np.cos(longitudes)
+    )
+
+    return np.degrees(right_ascensions) % 360, np.degrees(np.arcsin(sin_declinations))
+
+
+def ecliptic_to_declination_velocity(
+        longitudes: Iterable[float],
+        longitude_velocities: Iterable[float],
+        obliquity: float
+) -> np.ndarray:
+    """
+    Converts the longitude velocities of points on the ecliptic to declination velocities.
+
+    :param longitudes: The ecliptic longitudes in degrees.
+    :param longitude_velocities: The ecliptic longitude velocities in degrees per day.
+    :param obliquity: The obliquity of the ecliptic in degrees.
+
+    :return: The declination velocity of each point in degrees per day.
+    """
+    longitudes = np.radians(np.asarray(longitudes, dtype=float))
+    longitude_velocities = np.asarray(longitude_velocities, dtype=float)
+    obliquity = np.radians(obliquity)
+
+    # Differentiates sin(declination) = sin(obliquity) * sin(longitude) with respect to time.
+    declinations = np.arcsin(np.sin(obliquity) * np.sin(longitudes))
+
+    return np.sin(obliquity) * np.cos(longitudes) * longitude_velocities / np.cos(declinations)
+
+
+def armc_to_angles(
+        armcs: Iterable[float],
+        latitude: Union[float, Iterable[float]],
+        obliquity: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculates the Ascendant, Midheaven, and Vertex from the right ascension of the Midheaven (ARMC).
+
+    - The ARMC is the local sidereal time in degrees, so this is the only time dependent part of the angles.
+
+    :param armcs: The right ascension of the Midheaven in degrees.
+    :param latitude: The geographic latitude in degrees, or the latitude at each ARMC.
+    :param obliquity: The obliquity of the ecliptic in degrees.
+
+    :return:
+        [0] The ecliptic longitude of the Ascendant at each ARMC.
+        [1] The ecliptic longitude of the Midheaven at each ARMC.
+        [2] The ecliptic longitude of the Vertex at each ARMC.
+    """
+    armcs = np.radians(np.asarray(armcs, dtype=float))
+    obliquity = np.radians(obliquity)
+
+    def calculate_ascendant(armc: np.ndarray, pole: float) -> np.ndarray:
+        return np.degrees(np.arctan2(
+            np.cos(armc),
+            -(np.sin(armc) * np.cos(obliquity) + np.tan(pole) * np.sin(obliquity))
+        )) % 360
+
+    latitude = np.asarray(latitude, dtype=float)
+    ascendants = calculate_ascendant(armcs, np.radians(latitude))
+    midheavens = np.degrees(np.arctan2(np.sin(armcs), np.cos(armcs) * np.cos(obliquity))) % 360
+    # Within the polar circles, the ascendant is kept after the midheaven, as in the swiss ephemeris.
+    is_polar_ascendant = (np.abs(latitude) >= 90 - np.degrees(obliquity)) & \
+        (wrap_degrees(ascendants - midheavens) < 0)
+    ascendants = np.where(is_polar_ascendant, (ascendants + 180) % 360, ascendants)
+    # The vertex is the ascendant of the opposite ARMC at the co-latitude.
+    vertices = calculate_ascendant(armcs + np.pi, np.radians(90 - latitude))
+    # Within the tropics, the vertex is kept in the western hemisphere, as in the swiss ephemeris.
+    is_eastern_vertex = (np.abs(latitude) <= np.degrees(obliquity)) & \
+        (wrap_degrees(vertices - midheavens) > 0)
+    vertices = np.where(is_eastern_vertex, (vertices + 180) % 360, vertices)
+
+    return ascendants, midheavens, vertices
+
+
+def calculate_semi_diurnal_arcs(
+        declinations: Iterable[float],
+        latitudes: Iterable[float]
+) -> np.ndarray:
+    """
+    Calculates the hour angle from the meridian at which points cross the horizon, for each point and latitude.
+
+    - A point rises at the negative of this hour angle, and sets at the positive hour angle.
+
+    :param declinations: The declinations of the points in degrees.
+    :param latitudes: The geographic latitudes in degrees.
+
+    :return: The semi-diurnal arc in degrees, with a row for each point and a column for each latitude.
+        Points that never rise or never set at a latitude have an arc of NaN.
+    """
+    declinations = np.radians(np.asarray(declinations, dtype=float))[:, np.newaxis]
+    latitudes = np.radians(np.asarray(latitudes, dtype=float))[np.newaxis, :]
+    cos_hour_angles = -np.tan(latitudes) * np.tan(declinations)
+    cos_hour_angles[np.abs(cos_hour_angles) > 1] = np.nan
+
+    return np.degrees(np.arccos(cos_hour_angles))
+
+
+def to_sidereal(longitudes: Iterable[float], ayanamsa: float) -> np.ndarray:
+    """
+    Converts tropical longitudes to sidereal longitudes by subtracting the ayanamsa from all of them at once.
+
+    :param longitudes: The tropical longitudes in degrees.
+    :param ayanamsa: The ayanamsa in degrees.
+
+    :return: The sidereal longitudes in degrees.
+    """
+    return (np.asarray(longitudes, dtype=float) - ayanamsa) % 360
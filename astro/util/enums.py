@@ -10,6 +10,12 @@ class EventType(str, Enum):
     event = "Event"
     horary = "Horary"
     election = "Election"
+    progressed = "Progressed"
+    solar_arc = "Solar Arc"
+    solar_return = "Solar Return"
+    lunar_return = "Lunar Return"
+    composite = "Composite"
+    davison = "Davison"
 
 
 class HouseSystem(str, Enum):
@@ -24,6 +30,29 @@ class HouseSystem(str, Enum):
     campanus = "Campanus"  # C
 
 
+class CoordinateMode(str, Enum):
+    """
+    Enumerates where positions are observed from.
+    """
+    geocentric = "Geocentric"
+    topocentric = "Topocentric"
+    heliocentric = "Heliocentric"
+
+
+class Ayanamsa(str, Enum):
+    """
+    Enumerates the ayanamsas that define the start of the sidereal zodiac.
+    """
+    fagan_bradley = "Fagan/Bradley"
+    lahiri = "Lahiri"
+    raman = "Raman"
+    krishnamurti = "Krishnamurti"
+    yukteshwar = "Yukteshwar"
+    true_citra = "True Citra"
+    galactic_center = "Galactic Center 0 Sag"
+    hipparchos = "Hipparchos"
+
+
 class Polarity(str, Enum):
     """
     Enumerates all of the polarities.
@@ -224,6 +253,17 @@ class PhaseType(str, Enum):
     balsamic = "Balsamic"
 
 
+class EclipseType(str, Enum):
+    """
+    Enumerates the types of solar and lunar eclipses.
+    """
+    total = "Total"
+    annular = "Annular"
+    hybrid = "Hybrid"
+    partial = "Partial"
+    penumbral = "Penumbral"
+
+
 class AspectMovementType(str, Enum):
     """
     Enumerates all the aspect movement types.
@@ -284,3 +324,10 @@ class TransitGroupType(str, Enum):
     by_transit_point = "By Transit Point"
     by_day = "By Day"
 
+
+class ReturnType(str, Enum):
+    """
+    Enumerates the types of returns of a planet to its natal longitude.
+    """
+    solar_return = "Solar Return"
+    lunar_return = "Lunar Return"
@@ -0,0 +1,62 @@
+from typing import List, Dict
+
+from humps import decamelize
+
+FieldMask = Dict[str, "FieldMask"]
+"""
+A tree of the requested fields, where an empty mask includes every field beneath it.
+"""
+
+
+def create_field_mask(fields: List[str]) -> FieldMask:
+    """
+    Creates a tree of requested fields from dotted field paths.
+
+    - Paths may be camel cased or snake cased, such as `charts.points.degreesInSign`.
+    - If a path is requested along with a more specific path beneath it, the whole path is included.
+
+    :param fields: The requested field paths.
+
+    :return: The field mask.
+    """
+    field_mask = {}
+
+    for field in fields:
+        node = field_mask
+        parts = decamelize(field).split(".")
+
+        for index, part in enumerate(parts):
+            is_last = index == len(parts) - 1
+
+            if part in node and not node[part]:
+                # A parent of this path already includes every field.
+                break
+
+            node = node.setdefault(part, {})
+
+            if is_last:
+                node.clear()
+
+    return field_mask
+
+
+def includes_field(field_mask: FieldMask, path: str) -> bool:
+    """
+    Returns whether a field, or any field beneath it, is requested by a field mask.
+
+    :param field_mask: The field mask.
+    :param path: The snake cased dotted path of the field, such as `charts.points.degrees_in_sign`.
+
+    :return: Whether the field is included.
+    """
+    node = field_mask
+
+    for part in path.split("."):
+        if not node:
+            return True
+        if part not in node:
+            return False
+
+        node = node[part]
+
+    return True
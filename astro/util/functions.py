@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import List
 
 from astro.util import Point, point_axis_list
@@ -27,3 +28,25 @@ def do_points_form_axis(from_point: Point, to_point: Point) -> bool:
     """
     return [from_point, to_point] in point_axis_list \
         or [to_point, from_point] in point_axis_list
+
+
+def wrap_degrees(degrees):
+    """
+    Wraps degrees to the range from -180 to 180.
+
+    :param degrees: The degrees to wrap, as a number or an array.
+
+    :return: The wrapped degrees.
+    """
+    return (degrees + 180) % 360 - 180
+
+
+def to_utc_date(date: datetime) -> datetime:
+    """
+    Treats a date without a timezone as UTC, so that it can be compared with timezone aware dates.
+
+    :param date: The date to convert.
+
+    :return: The timezone aware date.
+    """
+    return date.replace(tzinfo=timezone.utc) if date.tzinfo is None else date
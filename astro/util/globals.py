@@ -188,6 +188,14 @@ minor_aspects = [
 Defines all minor aspects.
 """
 
+longitude_aspects = [
+    *major_aspects,
+    *minor_aspects,
+]
+"""
+Defines all aspects formed by an angle of longitude between points.
+"""
+
 declination_aspects = [
     AspectType.parallel,
     AspectType.contraparallel,
@@ -232,6 +240,11 @@ zodiac_sign_order = [
 Defines the traditional order of zodiac signs.
 """
 
+zodiac_sign_index = {sign: index for index, sign in enumerate(zodiac_sign_order)}
+"""
+Maps each zodiac sign to its index in the traditional order.
+"""
+
 point_axis_list = [
     [Point.north_mode, Point.south_node],
     [Point.ascendant, Point.descendant],
@@ -0,0 +1,93 @@
+import re
+from typing import Dict, List, Tuple
+
+from astro.util import Point
+
+LotTerm = Tuple[int, str]
+"""
+The sign to add or subtract a term by, and the name of the point, lot, or house cusp.
+"""
+
+formula_operator_pattern = re.compile(r"\s+([+-])\s+")
+"""
+Matches the operators between the terms of a lot formula.
+"""
+
+midpoint_name_pattern = re.compile(r"^(.+)-(.+) Midpoint$")
+"""
+Matches the name of a midpoint, such as `Sun-Moon Midpoint`.
+"""
+
+house_cusp_names = [f"Cusp {number}" for number in range(1, 13)]
+"""
+The names of the house cusps that lot formulas can use.
+"""
+
+
+def parse_lot_formula(formula: str) -> List[LotTerm]:
+    """
+    Parses a lot formula into the terms that are added and subtracted.
+
+    :param formula: The formula, such as `Ascendant + Moon - Sun`.
+
+    :return: The sign and name of each term.
+    """
+    parts = formula_operator_pattern.split(formula.strip())
+    terms = [(1, parts[0])]
+
+    for operator, operand in zip(parts[1::2], parts[2::2]):
+        terms.append((1 if operator == "+" else -1, operand))
+
+    return terms
+
+
+def is_lot_formula_term(operand: str) -> bool:
+    """
+    Returns whether a term of a lot formula names a point, midpoint, or house cusp.
+
+    :param operand: The name of the term.
+
+    :return: Whether the term is a known position.
+    """
+    point_names = {point.value for point in Point}
+    midpoint_match = midpoint_name_pattern.match(operand)
+
+    if midpoint_match:
+        return midpoint_match.group(1) in point_names and midpoint_match.group(2) in point_names
+
+    return operand in point_names or operand in house_cusp_names
+
+
+def order_lot_formulas(terms_by_name: Dict[str, List[LotTerm]]) -> List[str]:
+    """
+    Orders lots so that each lot comes after the lots its formula uses.
+
+    :param terms_by_name: The terms of each lot's formula, by the lot's name.
+
+    :return: The names of the lots in the order to evaluate them.
+
+    :raises ValueError: If a lot's formula depends on itself.
+    """
+    ordered_names = []
+    visiting, visited = set(), set()
+
+    def visit(name: str):
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"The formula of {name} depends on itself.")
+
+        visiting.add(name)
+
+        for _, operand in terms_by_name[name]:
+            if operand in terms_by_name:
+                visit(operand)
+
+        visiting.remove(name)
+        visited.add(name)
+        ordered_names.append(name)
+
+    for lot_name in terms_by_name:
+        visit(lot_name)
+
+    return ordered_names
@@ -0,0 +1,61 @@
+import json
+import statistics
+import time
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+
+from astro import create_chart
+from astro.schema import SettingsSchema
+from astro.serialize import serialize_schema
+from astro.util.test_events import tim_natal
+
+iterations = 200
+"""
+Defines how many times each serializer is run.
+"""
+
+
+def time_serializer(serialize: Callable[[], bytes]) -> List[float]:
+    """
+    Times repeated runs of a serializer.
+
+    :param serialize: The serializer to run.
+
+    :return: The duration of each run in milliseconds.
+    """
+    durations = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        serialize()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return durations
+
+
+def print_percentiles(name: str, durations: List[float]):
+    """
+    Prints the p50 and p99 of the given durations.
+
+    :param name: The name of the serializer.
+    :param durations: The duration of each run in milliseconds.
+    """
+    percentiles = statistics.quantiles(durations, n=100)
+
+    print(f"{name}: p50 {percentiles[49]:.2f}ms, p99 {percentiles[98]:.2f}ms")
+
+
+if __name__ == "__main__":
+    chart = create_chart(SettingsSchema(events=[tim_natal]))
+
+    print_percentiles("fastapi + json", time_serializer(
+        lambda: json.dumps(
+            jsonable_encoder(chart),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    ))
+    print_percentiles("orjson", time_serializer(lambda: serialize_schema(chart)))
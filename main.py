@@ -1,16 +1,25 @@
-from typing import List, Dict, Optional
+import os
+from typing import List, Dict, Optional, Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
 from astro.schema import ZodiacSignCollection, SettingsSchema, \
-    PointTraitsCollection, AspectTraitsCollection, EventSettingsSchema, TransitGroupSchema
+    PointTraitsCollection, AspectTraitsCollection, EventSettingsSchema, TransitGroupSchema, ChartCollectionSchema, \
+    AngleSeriesSettingsSchema, MidpointTreeSettingsSchema, HarmonicSpectrumSettingsSchema, \
+    ProgressionTimelineSettingsSchema, ReturnSettingsSchema, LunationSettingsSchema, \
+    FixedStarSettingsSchema, AstrocartographySettingsSchema, RelocationSettingsSchema
 from astro.collection import aspect_traits, point_traits, zodiac_sign_traits
 from astro.schema.timezone import TimezoneSchema, TimezoneQuerySchema
+from astro.serialize import serialize_schema, serialize_columns, columnar_media_type
 from astro.timezone import calculate_timezone
-from astro.util import default_midpoints, AspectType, TransitCalculationType, TransitGroupType
+from astro.util import default_midpoints, AspectType, TransitCalculationType, TransitGroupType, create_field_mask
 from astro.util.test_events import tim_natal, local_event, tim_transits
-from astro import create_chart, ChartCollectionSchema
+from astro.chart import calculate_angle_series, calculate_midpoint_trees, calculate_harmonic_spectrum, \
+    calculate_progression_timeline, calculate_lunations, calculate_fixed_stars, \
+    calculate_astrocartography, calculate_relocations, fixed_star_catalog_path
+from astro import create_chart, create_returns
 
 app = FastAPI()
 
@@ -25,6 +34,62 @@ app.add_middleware(
 )
 
 
+class SchemaResponse(Response):
+    """
+    Serializes schemas directly to JSON with orjson, skipping FastAPI's default encoding.
+    """
+    media_type = "application/json"
+
+    def __init__(self, content: Any, field_mask: Optional[List[str]] = None, **kwargs):
+        self.field_mask = create_field_mask(field_mask or [])
+
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return serialize_schema(content, self.field_mask)
+
+
+class ColumnarResponse(Response):
+    """
+    Serializes charts to MessagePack, with points, relationships, and transits as typed columns.
+    """
+    media_type = columnar_media_type
+
+    def render(self, content: ChartCollectionSchema) -> bytes:
+        return serialize_columns(content)
+
+
+def create_chart_response(
+        charts: ChartCollectionSchema,
+        accept: Optional[str] = None,
+        field_mask: Optional[List[str]] = None
+) -> Response:
+    """
+    Creates the response for calculated charts in the encoding requested by the `Accept` header.
+
+    :param charts: The calculated charts.
+    :param accept: The `Accept` header of the request.
+    :param field_mask: The fields to return in JSON responses.
+
+    :return: The columnar response if it was requested, or else the JSON response.
+    """
+    if accept and columnar_media_type in accept:
+        return ColumnarResponse(charts)
+
+    return SchemaResponse(charts, field_mask)
+
+
+def require_fixed_star_catalog():
+    """
+    Responds with a 503 if the fixed star catalog has not been added to the ephemeris directory.
+    """
+    if not os.path.isfile(fixed_star_catalog_path):
+        raise HTTPException(
+            status_code=503,
+            detail="The fixed star catalog sefstars.txt has not been added to the ephemeris directory."
+        )
+
+
 # Static Collections
 
 
@@ -76,28 +141,166 @@ async def calc_timezone() -> TimezoneSchema:
 # Chart Calculations
 
 
-@app.post("/chart")
-async def calc_chart(settings: SettingsSchema) -> ChartCollectionSchema:
+@app.post("/chart", response_class=SchemaResponse)
+async def calc_chart(settings: SettingsSchema, accept: Optional[str] = Header(None)) -> Response:
     """
     Calculates the chart for a given time.
 
     :param settings: The current calculation settings, including the time and location.
+    :param accept: The response encoding. Use `application/msgpack` for columnar charts.
 
     :return: Calculated points and aspects.
     """
-    return create_chart(settings)
+    return create_chart_response(create_chart(settings), accept, settings.field_mask)
 
 
-@app.get("/now")
-async def calc_now() -> ChartCollectionSchema:
+@app.post("/chart/update", response_class=SchemaResponse)
+async def calc_chart_update(
+        settings: SettingsSchema,
+        previous: ChartCollectionSchema,
+        accept: Optional[str] = Header(None)
+) -> Response:
+    """
+    Recalculates a previous chart for slightly changed times or locations, such as while rectifying a birth time.
+
+    - Bodies that have moved less than the incremental tolerance, and the relationships
+      between unchanged points, are reused from the previous chart.
+
+    :param settings: The current calculation settings, including the changed times and locations.
+    :param previous: The chart previously calculated with the same settings.
+    :param accept: The response encoding. Use `application/msgpack` for columnar charts.
+
+    :return: Calculated points and aspects.
+    """
+    return create_chart_response(create_chart(settings, previous), accept, settings.field_mask)
+
+
+@app.get("/now", response_class=SchemaResponse)
+async def calc_now(accept: Optional[str] = Header(None)) -> Response:
     """
     Calculates the current chart in the current location.
 
+    :param accept: The response encoding. Use `application/msgpack` for columnar charts.
+
     :return: Calculated points and aspects.
     """
     return await calc_chart(SettingsSchema(
         events=[local_event()]
-    ))
+    ), accept)
+
+
+@app.post("/angles/series", response_class=SchemaResponse)
+async def calc_angle_series(settings: AngleSeriesSettingsSchema) -> Response:
+    """
+    Calculates the angles and house cusps throughout a time range, such as for rectifying a birth time.
+
+    :param settings: The time range, location, poll frequency, and house system.
+
+    :return: The angles and house cusps at each time, and when the Ascendant and Midheaven change degree.
+    """
+    return SchemaResponse(calculate_angle_series(settings))
+
+
+@app.post("/midpoints/trees", response_class=SchemaResponse)
+async def calc_midpoint_trees(settings: MidpointTreeSettingsSchema) -> Response:
+    """
+    Calculates the points and midpoints within orb of each point on a dial, such as a 90 or 45 degree dial.
+
+    :param settings: The event, dial size, orb, and points to create trees for.
+
+    :return: The midpoint tree of each point.
+    """
+    return SchemaResponse(calculate_midpoint_trees(settings))
+
+
+@app.post("/harmonics/spectrum", response_class=SchemaResponse)
+async def calc_harmonic_spectrum(settings: HarmonicSpectrumSettingsSchema) -> Response:
+    """
+    Calculates the aspects between points within each harmonic chart of an event, such as harmonics 1 to 180.
+
+    :param settings: The event, the range of harmonics, and the aspects to find.
+
+    :return: The aspects and strength of each harmonic.
+    """
+    return SchemaResponse(calculate_harmonic_spectrum(settings))
+
+
+@app.post("/progressions/timeline", response_class=SchemaResponse)
+async def calc_progression_timeline(settings: ProgressionTimelineSettingsSchema) -> Response:
+    """
+    Calculates the dates that secondary progressed planets form exact aspects to natal points.
+
+    :param settings: The natal event, the range of dates, and the progressed points and aspects.
+
+    :return: The exact progressed aspects, ordered by date.
+    """
+    return SchemaResponse(calculate_progression_timeline(settings))
+
+
+@app.post("/returns", response_class=SchemaResponse)
+async def calc_returns(settings: ReturnSettingsSchema) -> Response:
+    """
+    Calculates the exact times and charts of consecutive solar or lunar returns.
+
+    :param settings: The natal event, the type and number of returns, and the return chart settings.
+
+    :return: The time and chart of each return.
+    """
+    return SchemaResponse(create_returns(settings))
+
+
+@app.post("/lunations", response_class=SchemaResponse)
+async def calc_lunations(settings: LunationSettingsSchema) -> Response:
+    """
+    Calculates a page of the new moons, full moons, quarter moons, and eclipses after a date.
+
+    :param settings: The start date, page size, and phases to find.
+
+    :return: The page of lunations, and the start date of the next page.
+    """
+    return SchemaResponse(calculate_lunations(settings))
+
+
+@app.post("/stars", response_class=SchemaResponse)
+async def calc_fixed_stars(settings: FixedStarSettingsSchema) -> Response:
+    """
+    Calculates the positions of the fixed stars at an event, and the stars conjunct or parallel to its points.
+
+    :param settings: The event, the stars to include, and the orbs of conjunctions and parallels.
+
+    :return: The positions of the stars, and their contacts with the event's points.
+    """
+    require_fixed_star_catalog()
+
+    return SchemaResponse(calculate_fixed_stars(settings))
+
+
+@app.post("/astrocartography", response_class=SchemaResponse)
+async def calc_astrocartography(settings: AstrocartographySettingsSchema) -> Response:
+    """
+    Calculates the lines on a world map where each point is on each angle at the time of an event.
+
+    :param settings: The event time, the points and angles to draw, and the latitudes to draw them over.
+
+    :return: A GeoJSON feature collection of the line of each point on each angle.
+    """
+    return SchemaResponse(calculate_astrocartography(settings))
+
+
+@app.post("/relocations", response_class=SchemaResponse)
+async def calc_relocations(settings: RelocationSettingsSchema) -> Response:
+    """
+    Calculates the angles, houses, and angular points of an event at many locations at once,
+    and the latitudes where its points form parans.
+
+    :param settings: The event, the locations to relocate it to, and the points and stars to find parans between.
+
+    :return: The relocated angles, houses, and angular points at each location, and the parans.
+    """
+    if settings.paran_stars:
+        require_fixed_star_catalog()
+
+    return SchemaResponse(calculate_relocations(settings))
 
 
 @app.post("/timezone")
@@ -113,24 +316,27 @@ async def calc_timezone(query: TimezoneQuerySchema) -> TimezoneSchema:
 # Tim Test Endpoints
 
 
-@app.get("/tim")
-async def calc_tim() -> ChartCollectionSchema:
+@app.get("/tim", response_class=SchemaResponse)
+async def calc_tim(accept: Optional[str] = Header(None)) -> Response:
     """
     Calculates the natal chart of tim.
 
+    :param accept: The response encoding. Use `application/msgpack` for columnar charts.
+
     :return: Calculated points and aspects.
     """
     return await calc_chart(SettingsSchema(
         events=[tim_natal],
-    ))
+    ), accept)
 
 
-@app.get("/tim/transits/chart")
-async def calc_tim_transits_chart(midpoints: bool = False) -> ChartCollectionSchema:
+@app.get("/tim/transits/chart", response_class=SchemaResponse)
+async def calc_tim_transits_chart(midpoints: bool = False, accept: Optional[str] = Header(None)) -> Response:
     """
     Calculates the natal chart of tim with current transits.
 
     :param midpoints: Whether midpoints should be calculated.
+    :param accept: The response encoding. Use `application/msgpack` for columnar charts.
 
     :return: Calculated points and aspects.
     """
@@ -157,7 +363,7 @@ async def calc_tim_transits_chart(midpoints: bool = False) -> ChartCollectionSch
             create_event(local_event()),
             create_event(tim_natal)
         ]
-    ))
+    ), accept)
 
 
 @app.get("/tim/transits/upcoming")
@@ -173,7 +379,7 @@ async def calc_tim_transits_upcoming(
 
     :return: The calculated transits.
     """
-    calculated = await calc_chart(SettingsSchema(
+    calculated = create_chart(SettingsSchema(
         events=[
             tim_transits(
                 TransitCalculationType.transit_to_transit if mundane else TransitCalculationType.transit_to_chart,
@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+from astro.chart import calculate_condition, calculate_is_day_time, calculate_houses
+from astro.chart.condition import calculate_batch_condition, sun_condition_order, sect_placement_order
+from astro.chart.point import create_points_with_attributes
+from astro.util import Point
+from astro.util.test_events import tim_natal
+
+
+def test_calculate_batch_condition():
+    """
+    Tests that the condition calculated across many charts matches each chart's point condition.
+    """
+    planets = [Point.sun, Point.moon, Point.mercury, Point.venus, Point.mars, Point.jupiter, Point.saturn]
+    all_points = []
+    is_day_time = []
+
+    for days in range(0, 400, 37):
+        event_settings = tim_natal.copy(deep=True)
+        event_settings.event.utc_date += timedelta(days=days, hours=days % 24)
+        points = create_points_with_attributes(event_settings)
+        is_day = calculate_is_day_time(points)
+        calculate_houses(points)
+        calculate_condition(points, is_day)
+
+        all_points.append(points)
+        is_day_time.append(is_day)
+
+    condition = calculate_batch_condition(
+        planets,
+        [[points[planet].longitude for planet in planets] for points in all_points],
+        is_day_time,
+        [points[Point.sun].longitude for points in all_points]
+    )
+
+    for chart_index, points in enumerate(all_points):
+        for point_index, planet in enumerate(planets):
+            expected = points[planet].condition
+
+            for attribute in ["in_domicile", "in_exaltation", "in_detriment", "in_fall", "in_bound", "in_decan"]:
+                assert condition[attribute][chart_index, point_index] == getattr(expected, attribute)
+
+            assert bool(condition["in_triplicity"][chart_index, point_index]) == bool(expected.in_triplicity)
+
+            sun_code = condition["sun_proximity"][chart_index, point_index]
+            assert (sun_condition_order[sun_code] if sun_code >= 0 else None) == expected.sun_proximity
+
+            sect_code = condition["sect_placement"][chart_index, point_index]
+            assert (sect_placement_order[sect_code] if sect_code >= 0 else None) == expected.sect_placement
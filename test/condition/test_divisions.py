@@ -1,4 +1,7 @@
+import numpy as np
+
 from astro.chart.condition.divisions import calculate_divisions
+from astro.collection import degree_sign_rulers, degree_bound_rulers, degree_decan_rulers
 from astro.util import Point
 from test.utils import create_test_points
 
@@ -79,3 +82,15 @@ def test_calculate_divisions__divisions():
 
     assert moon.condition.in_decan is True
     assert mercury.condition.in_bound is True
+
+
+def test_division_tables():
+    """
+    Tests that the division tables can be indexed by many degrees at once.
+    """
+    degrees = np.array([0, 6, 180, 195, 359])
+
+    assert degree_sign_rulers[degrees].tolist() == [Point.mars, Point.mars, Point.venus, Point.venus, Point.jupiter]
+    assert degree_bound_rulers[degrees].tolist() == \
+        [Point.jupiter, Point.venus, Point.saturn, Point.jupiter, Point.saturn]
+    assert degree_decan_rulers[degrees].tolist() == [Point.mars, Point.mars, Point.moon, Point.saturn, Point.mars]
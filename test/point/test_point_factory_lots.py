@@ -1,6 +1,12 @@
+import numpy as np
+import pytest
+import swisseph as swe
+from pydantic import ValidationError
+
 from astro import create_points_with_attributes
-from astro.chart.point.lot_factory import create_lot
-from astro.schema import EventSettingsSchema
+from astro.chart.point.ephemeris import get_obliquity
+from astro.chart.point.lot_factory import create_lot, create_lots, compile_lots, evaluate_lots, preset_lot_formulas
+from astro.schema import EventSettingsSchema, LotFormulaSchema, EnabledPointsSchema
 from astro.util import Point
 from astro.util.test_events import tim_natal
 
@@ -38,3 +44,126 @@ def test_create_lot_of_fortune__night():
 
     assert lot.name == Point.lot_of_fortune
     assert int(lot.longitude) == 128
+
+
+def test_create_lot_declinations():
+    """
+    Tests that lots are given the declination of their longitude on the ecliptic.
+    """
+    points = create_points_with_attributes(tim_natal)
+    lot = points[Point.lot_of_fortune]
+    obliquity = get_obliquity(tim_natal.event.julian_day)
+
+    assert lot.declination == pytest.approx(swe.cotrans((lot.longitude, 0, 1), -obliquity)[1])
+    assert lot.declination_velocity is not None
+
+
+def test_create_custom_lots():
+    """
+    Tests creating custom lots from house cusps and other lots.
+    """
+    points = create_points_with_attributes(tim_natal)
+    cusps = ([float(cusp) for cusp in range(0, 360, 30)], [0.0] * 12)
+    lots = create_lots(points, [
+        LotFormulaSchema(name="Lot of Debt", formula="Lot of Spirit - Cusp 3", reverse_at_night=False),
+        preset_lot_formulas[Point.lot_of_spirit],
+    ], True, cusps=cusps)
+    lots = {lot.name: lot for lot in lots}
+
+    assert list(lots.keys()) == [Point.lot_of_spirit, "Lot of Debt"]
+    assert lots[Point.lot_of_spirit].longitude == pytest.approx(points[Point.lot_of_spirit].longitude)
+    assert lots["Lot of Debt"].longitude == pytest.approx((points[Point.lot_of_spirit].longitude - 60) % 360)
+
+
+def test_create_custom_lots__night():
+    """
+    Tests that custom lots reverse every term after the first at night.
+    """
+    points = create_points_with_attributes(tim_natal)
+    formula = LotFormulaSchema(name="Lot", formula="Ascendant + Moon - Sun")
+    day_lot = create_lots(points, [formula], True)[0]
+    night_lot = create_lots(points, [formula], False)[0]
+
+    assert day_lot.longitude == pytest.approx(create_lot(points, Point.lot_of_fortune, True).longitude)
+    assert night_lot.longitude == pytest.approx(create_lot(points, Point.lot_of_fortune, False).longitude)
+
+
+def test_compile_lots__cycle():
+    """
+    Tests that lots depending on themselves cannot be compiled.
+    """
+    with pytest.raises(ValueError):
+        compile_lots([
+            LotFormulaSchema(name="A", formula="Ascendant + B - Sun"),
+            LotFormulaSchema(name="B", formula="Ascendant + A - Sun"),
+        ])
+
+
+def test_evaluate_lots__series():
+    """
+    Tests evaluating lots at many times at once.
+    """
+    compiled_lots = compile_lots([LotFormulaSchema(name="Lot", formula="Ascendant + Moon - Sun")])
+    positions = {
+        Point.ascendant: (np.array([10.0, 10.0, 350.0]), np.array([360.0, 360.0, 360.0])),
+        Point.moon: (np.array([40.0, 40.0, 20.0]), np.array([13.0, 13.0, 13.0])),
+        Point.sun: (np.array([20.0, 20.0, 40.0]), np.array([1.0, 1.0, 1.0])),
+    }
+    lot_positions = evaluate_lots(compiled_lots, positions, [True, False, True])
+    longitudes, velocities = lot_positions["Lot"]
+
+    assert longitudes.tolist() == pytest.approx([30, 350, 330])
+    assert velocities.tolist() == pytest.approx([372, 348, 372])
+
+
+def test_create_custom_lots__chart():
+    """
+    Tests that enabled custom lots are added to a chart's points.
+    """
+    settings = EventSettingsSchema(
+        event=tim_natal.event,
+        enabled=[EnabledPointsSchema(lots=[LotFormulaSchema(name="Lot of Home", formula="Ascendant + Cusp 4")])]
+    )
+    points = create_points_with_attributes(settings)
+    lot = points["Lot of Home"]
+
+    assert lot.declination is not None
+    assert lot.points == [Point.ascendant]
+
+
+@pytest.mark.parametrize("lots", [
+    [LotFormulaSchema(name="A", formula="Ascendant + A")],
+    [LotFormulaSchema(name="A", formula="Ascendant + B"), LotFormulaSchema(name="B", formula="Ascendant - A")],
+    [LotFormulaSchema(name="A", formula="Ascendant + Planet X")],
+    [LotFormulaSchema(name="A", formula="Ascendant + Sun"), LotFormulaSchema(name="A", formula="Ascendant - Sun")],
+])
+def test_validate_custom_lots(lots):
+    """
+    Tests that custom lots with cycles, unknown terms, or duplicate names are rejected.
+    """
+    with pytest.raises(ValidationError):
+        EventSettingsSchema(event=tim_natal.event, enabled=[EnabledPointsSchema(lots=lots)])
+
+
+@pytest.mark.parametrize("name, formula", [
+    ("A", "Ascendant+Moon-Sun"),
+    ("A", "Ascendant + Moon -"),
+    (Point.sun.value, "Ascendant + Moon - Sun"),
+    ("Cusp 1", "Ascendant + Moon - Sun"),
+])
+def test_validate_custom_lot_formula(name, formula):
+    """
+    Tests that custom lots with malformed formulas or names used by points are rejected.
+    """
+    with pytest.raises(ValidationError):
+        LotFormulaSchema(name=name, formula=formula)
+
+
+def test_validate_custom_lots__midpoint():
+    """
+    Tests that custom lots can use midpoints, house cusps, and other lots.
+    """
+    EventSettingsSchema(event=tim_natal.event, enabled=[EnabledPointsSchema(lots=[
+        LotFormulaSchema(name="A", formula="Sun-Moon Midpoint + Cusp 10 - B"),
+        LotFormulaSchema(name="B", formula="Lot of Fortune + Mars"),
+    ])])
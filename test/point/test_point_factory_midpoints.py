@@ -1,8 +1,13 @@
 from typing import Optional, Dict
 
-from astro.chart.point.midpoint_factory import create_midpoint
-from astro.schema import PointSchema, MidpointSchema
-from astro.util import Point
+import pytest
+
+from astro import create_chart
+from astro.chart.point.midpoint_factory import create_midpoint, calculate_midpoint_longitudes
+from astro.collection.lot_traits import lot_traits
+from astro.schema import PointSchema, MidpointSchema, SettingsSchema
+from astro.util import Point, AspectType, default_midpoints
+from astro.util.test_events import tim_natal
 
 
 def create_test_midpoint(
@@ -175,3 +180,48 @@ def test_create_declination_velocity_midpoint__valid():
     )
 
     assert midpoint.declination_velocity == -5
+
+
+def test_calculate_midpoint_longitudes():
+    """
+    Tests that midpoint longitudes calculated together match each midpoint calculated alone.
+    """
+    from_longitudes = [10, 350, 100, 0]
+    to_longitudes = [50, 20, 300, 180]
+    midpoint_longitudes = calculate_midpoint_longitudes(from_longitudes, to_longitudes)
+
+    for from_longitude, to_longitude, midpoint_longitude in zip(from_longitudes, to_longitudes, midpoint_longitudes):
+        midpoint = create_test_midpoint({"longitude": from_longitude}, {"longitude": to_longitude})
+
+        assert midpoint_longitude == pytest.approx(midpoint.longitude)
+
+
+def test_lazy_midpoints():
+    """
+    Tests that lazy midpoints only create the midpoints that aspect a point in the same chart.
+    """
+    aspects = [AspectType.conjunction, AspectType.opposition, AspectType.parallel]
+    settings = SettingsSchema(events=[{
+        **tim_natal.dict(),
+        "enabled": [
+            *[{**enabled, "aspects": aspects} for enabled in tim_natal.dict()["enabled"]],
+            {"points": [], "midpoints": default_midpoints, "aspects": aspects},
+        ],
+    }])
+    lazy_settings = settings.copy(update={"lazy_midpoints": True})
+
+    chart = create_chart(settings)
+    lazy_chart = create_chart(lazy_settings)
+    lazy_midpoints = {name for name in lazy_chart.charts[0].points if "Midpoint" in name}
+    aspecting_midpoints = set()
+
+    for relationship in chart.relationships[0].relationships:
+        names = [relationship.from_point, relationship.to_point]
+        midpoints = [name for name in names if "Midpoint" in name]
+        points = [name for name in names if "Midpoint" not in name and name not in lot_traits.lots]
+
+        if midpoints and points and (relationship.ecliptic_aspect.type or relationship.declination_aspect.type):
+            aspecting_midpoints.add(midpoints[0])
+
+    assert 0 < len(lazy_midpoints) < len(default_midpoints)
+    assert lazy_midpoints == aspecting_midpoints
@@ -1,6 +1,10 @@
+import pytest
+import swisseph as swe
+
 from astro import calculate_relationships
 from astro.chart import calculate_precession_correction_degrees
-from astro.schema import EventSchema, EventSettingsSchema
+from astro.chart.point.ephemeris import get_julian_day
+from astro.schema import EventSchema, EventSettingsSchema, SettingsSchema
 from astro.util import AspectType, EventType
 from astro.util.test_events import tim_natal
 from test.utils import create_test_points
@@ -44,6 +48,20 @@ def test_calculate_precession_correction_degrees():
     assert abs(precession_correction - 100.5 / 60 / 60) < 0.01
 
 
+def test_calculate_precession_correction_degrees__ayanamsa():
+    """
+    Tests that the precession correction is the change in the ayanamsa, and is reversed for earlier events.
+    """
+    from_event = EventSchema(utc_date="1997-10-11T15:09:00.000Z")
+    to_event = EventSchema(utc_date="2047-10-11T15:09:00.000Z")
+    precession_correction = calculate_precession_correction_degrees(from_event, to_event)
+    from_day, to_day = get_julian_day(from_event.utc_date), get_julian_day(to_event.utc_date)
+
+    assert precession_correction == pytest.approx(swe.get_ayanamsa_ut(to_day) - swe.get_ayanamsa_ut(from_day))
+    assert precession_correction == pytest.approx(50 * 50.29 / 60 / 60, abs=0.001)
+    assert calculate_precession_correction_degrees(to_event, from_event) == pytest.approx(-precession_correction)
+
+
 def test_calculate_multiple_aspect_sets():
     """
     Tests calculating all aspects between sets of points with different enabled aspects.
@@ -57,9 +75,60 @@ def test_calculate_multiple_aspect_sets():
             event=tim_natal,
             enabled=[{"points": []}, {"aspects": []}]
         )),
-        False
+        False,
+        SettingsSchema(remove_empty_relationships=False)
     )
 
     assert len(aspects) is 1
     assert aspects[0].ecliptic_aspect.type is None
     assert aspects[0].sign_aspect == AspectType.conjunction
+
+
+def test_calculate_relationships__remove_empty():
+    """
+    Tests that relationships without aspects are removed.
+    """
+
+    points = create_test_points(
+        {"longitude": 0},
+        {"longitude": 2},
+        {"longitude": 100},
+        do_init_point=True
+    )
+    points_and_event_type = (points, tim_natal)
+
+    aspects = calculate_relationships(points_and_event_type, points_and_event_type, True)
+    all_aspects = calculate_relationships(
+        points_and_event_type,
+        points_and_event_type,
+        True,
+        SettingsSchema(remove_empty_relationships=False)
+    )
+
+    assert len(aspects) is 1
+    assert aspects[0].get_name() == "Moon To Mercury"
+    assert len(all_aspects) is 3
+
+
+def test_calculate_relationships__min_significance():
+    """
+    Tests that relationships with aspects far from exact are removed.
+    """
+
+    points = create_test_points(
+        {"longitude": 0},
+        {"longitude": 1},
+        {"longitude": 186},
+        do_init_point=True
+    )
+    points_and_event_type = (points, tim_natal)
+
+    aspects = calculate_relationships(
+        points_and_event_type,
+        points_and_event_type,
+        True,
+        SettingsSchema(min_relationship_significance=0.5)
+    )
+
+    assert len(aspects) is 1
+    assert aspects[0].get_name() == "Moon To Mercury"
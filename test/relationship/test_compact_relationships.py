@@ -0,0 +1,46 @@
+from astro import create_chart
+from astro.chart import calculate_relationships, compact_relationships, compact_relationship_columns
+from astro.schema import SettingsSchema
+from astro.util import AspectType
+from astro.util.test_events import tim_natal
+from test.utils import create_test_points
+
+
+def test_compact_relationships():
+    """
+    Tests that relationships are compacted to rows of point indices.
+    """
+
+    points = create_test_points(
+        {"longitude": 0, "declination": 11},
+        {"longitude": 5, "declination": -11},
+        do_init_point=True
+    )
+    points_and_event_type = (points, tim_natal)
+    relationships = calculate_relationships(points_and_event_type, points_and_event_type, True)
+    rows = compact_relationships(relationships, points, points)
+    row = dict(zip(compact_relationship_columns, rows[0]))
+
+    assert len(rows) is 1
+    assert row["fromPoint"] == 0
+    assert row["toPoint"] == 1
+    assert row["eclipticType"] == AspectType.conjunction
+    assert row["eclipticOrb"] == 5
+    assert row["precessionCorrectedType"] is None
+    assert row["declinationType"] == AspectType.contraparallel
+
+
+def test_create_chart__compact_relationships():
+    """
+    Tests that charts output compact relationships in place of relationship objects.
+    """
+
+    chart = create_chart(SettingsSchema(events=[tim_natal], compact_relationships=True))
+    collection = chart.relationships[0]
+    point_names = list(chart.charts[0].points.keys())
+    from_index, to_index = collection.compact_relationships[0][0:2]
+
+    assert collection.relationships == []
+    assert collection.compact_columns == compact_relationship_columns
+    assert len(collection.compact_relationships) > 0
+    assert point_names[from_index] != point_names[to_index]
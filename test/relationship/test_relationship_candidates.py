@@ -0,0 +1,45 @@
+from astro.chart import calculate_relationships, find_relationship_candidates
+from astro.chart.point import create_points_with_attributes
+from astro.schema import SettingsSchema
+from astro.util.test_events import tim_natal, omega_event
+
+
+def test_find_relationship_candidates():
+    """
+    Tests that the candidates of many pairs of charts include every pair of points with an aspect.
+    """
+    all_points_and_events = [
+        (list(create_points_with_attributes(event_settings).values()), event_settings)
+        for event_settings in [tim_natal, omega_event]
+    ]
+    chart_pairs = [(0, 0), (0, 1), (1, 0)]
+    all_candidates = find_relationship_candidates(all_points_and_events, chart_pairs, SettingsSchema())
+
+    for (from_chart, to_chart), candidates in zip(chart_pairs, all_candidates):
+        from_points, to_points = all_points_and_events[from_chart][0], all_points_and_events[to_chart][0]
+        relationships = calculate_relationships(
+            all_points_and_events[from_chart],
+            all_points_and_events[to_chart],
+            False,
+            SettingsSchema(remove_empty_relationships=False)
+        )
+        names = [(point.name, to_point.name) for point in from_points for to_point in to_points]
+        aspecting_names = {
+            (relationship.from_point, relationship.to_point) for relationship in relationships
+            if relationship.ecliptic_aspect.type or relationship.precession_corrected_aspect.type
+            or relationship.declination_aspect.type
+        }
+
+        assert candidates.shape == (len(from_points), len(to_points))
+        assert aspecting_names <= {name for name, is_candidate in zip(names, candidates.ravel()) if is_candidate}
+        assert 0 < candidates.sum() < candidates.size
+
+
+def test_find_relationship_candidates__empty_relationships_kept():
+    """
+    Tests that no candidates are found when relationships without aspects are kept.
+    """
+    points_and_event = (list(create_points_with_attributes(tim_natal).values()), tim_natal)
+
+    assert find_relationship_candidates(
+        [points_and_event], [(0, 0)], SettingsSchema(remove_empty_relationships=False)) is None
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from astro.chart import calculate_angle_series
+from astro.chart.angle_series import find_angle_changes
+from astro.chart.point.ephemeris import get_houses, get_julian_day
+from astro.schema import AngleSeriesSettingsSchema
+from astro.util import HouseSystem, Point, ZodiacSign
+
+
+def create_series_settings(house_system: HouseSystem) -> AngleSeriesSettingsSchema:
+    """
+    Creates settings to calculate angles every minute for four hours around tim's birth.
+
+    :param house_system: The house system to calculate cusps for.
+
+    :return: The angle series settings.
+    """
+    return AngleSeriesSettingsSchema(
+        event={
+            "utc_date": "1997-10-11T13:00:00.000Z",
+            "utc_end_date": "1997-10-11T17:00:00.000Z",
+            "latitude": 40.7422,
+            "longitude": -73.9740,
+        },
+        house_system=house_system
+    )
+
+
+@pytest.mark.parametrize("house_system", [HouseSystem.placidus, HouseSystem.porphyry])
+def test_calculate_angle_series(house_system):
+    """
+    Tests that the angles and cusps at each minute match a full house calculation.
+    """
+    series = calculate_angle_series(create_series_settings(house_system))
+
+    assert len(series.utc_dates) == 241
+
+    for index in [0, 129, 240]:
+        jul_day = get_julian_day(series.utc_dates[index])
+        cusps, angles = get_houses(jul_day, 40.7422, -73.9740, house_system)[:2]
+
+        assert series.ascendant[index] == pytest.approx(angles[0], abs=0.0001)
+        assert series.midheaven[index] == pytest.approx(angles[1], abs=0.0001)
+        assert series.vertex[index] == pytest.approx(angles[3], abs=0.0001)
+        assert series.cusps[index] == pytest.approx(list(cusps), abs=0.0001)
+
+
+def test_calculate_angle_series_changes():
+    """
+    Tests that the times the ascendant enters a new sign are found between polls.
+    """
+    series = calculate_angle_series(create_series_settings(HouseSystem.whole_sign))
+    sign_changes = [change for change in series.changes if change.is_sign_change]
+    ascendant_change = next(change for change in sign_changes if change.name == Point.ascendant)
+
+    assert ascendant_change.sign == ZodiacSign.sagittarius
+    assert ascendant_change.degrees_in_sign == 0
+    assert ascendant_change.utc_date.hour == 14
+    assert ascendant_change.utc_date.minute == 39
+    assert series.utc_dates == sorted(series.utc_dates)
+    assert [change.utc_date for change in series.changes] == sorted(change.utc_date for change in series.changes)
+
+
+def test_find_angle_changes_backward():
+    """
+    Tests that an angle moving backward enters the degree below each boundary, and polar flips are skipped.
+    """
+    jul_days = np.array([0.0, 1.0, 2.0, 3.0])
+    longitudes = np.array([30.5, 29.5, 209.5, 208.5])
+    changes = find_angle_changes(Point.ascendant, datetime(2000, 1, 1, tzinfo=timezone.utc), jul_days, longitudes)
+
+    assert [change.longitude for change in changes] == [29, 208]
+    assert changes[0].is_sign_change
+    assert changes[0].sign == ZodiacSign.aries
+    assert changes[0].utc_date.hour == 12
+    assert not changes[1].is_sign_change
+
+
+@pytest.mark.parametrize("update", [
+    {"event": {"utc_date": "1997-10-11T17:00:00.000Z", "utc_end_date": "1997-10-11T13:00:00", "latitude": 0}},
+    {"event": {"utc_date": "1997-10-11T13:00:00.000Z", "utc_end_date": "1998-10-11T13:00:00.000Z", "latitude": 0}},
+    {"minutes_per_poll": 0.01},
+])
+def test_angle_series_settings__invalid(update):
+    """
+    Tests that time ranges ending before they start, and time ranges with too many polls, are rejected.
+    """
+    with pytest.raises(ValidationError):
+        AngleSeriesSettingsSchema(**{
+            **create_series_settings(HouseSystem.porphyry).dict(),
+            **update,
+        })
@@ -0,0 +1,68 @@
+import pytest
+import swisseph as swe
+
+from astro.chart import calculate_astrocartography
+from astro.chart.point.ephemeris import get_julian_day, get_right_ascension_and_declination
+from astro.collection import point_traits
+from astro.schema import AstrocartographySettingsSchema
+from astro.util import Point
+from astro.util.test_events import tim_natal
+
+
+def test_calculate_astrocartography():
+    """
+    Tests that each point is on the horizon along its Ascendant and Descendant lines,
+    and on the meridian along its Midheaven and IC lines.
+    """
+    lines = calculate_astrocartography(AstrocartographySettingsSchema(
+        event=tim_natal,
+        points=[Point.sun, Point.moon, Point.mars],
+        latitude_step=5,
+    ))
+    jul_day = get_julian_day(tim_natal.event.utc_date)
+
+    assert len(lines.features) == 12
+
+    for line in lines.features:
+        point, angle = line.properties.point, line.properties.angle
+        right_ascension, declination = get_right_ascension_and_declination(jul_day, point_traits.points[point].swe_id)
+
+        for segment in line.geometry.coordinates:
+            for longitude, latitude in segment:
+                # [0] Azimuth from the south, increasing towards the west.
+                # [1] True altitude.
+                azimuth, altitude, _ = swe.azalt(
+                    jul_day, swe.EQU2HOR, (longitude, latitude, 0), 0, 0, (right_ascension, declination, 1))
+
+                if angle == Point.ascendant:
+                    assert altitude == pytest.approx(0, abs=1e-3)
+                    assert azimuth > 180
+                elif angle == Point.descendant:
+                    assert altitude == pytest.approx(0, abs=1e-3)
+                    assert azimuth < 180
+                elif angle == Point.midheaven:
+                    assert altitude == pytest.approx(90 - abs(latitude - declination), abs=1e-3)
+                    assert min(azimuth % 180, 180 - azimuth % 180) == pytest.approx(0, abs=1e-3)
+                else:
+                    assert altitude == pytest.approx(abs(latitude + declination) - 90, abs=1e-3)
+                    assert min(azimuth % 180, 180 - azimuth % 180) == pytest.approx(0, abs=1e-3)
+
+
+def test_calculate_astrocartography__split_lines():
+    """
+    Tests that lines are split where they cross the antimeridian, and stop where the point never rises or sets.
+    """
+    lines = calculate_astrocartography(AstrocartographySettingsSchema(
+        event=tim_natal,
+        points=[Point.moon],
+        angles=[Point.ascendant, Point.descendant],
+        max_latitude=89,
+    ))
+    jul_day = get_julian_day(tim_natal.event.utc_date)
+    declination = get_right_ascension_and_declination(jul_day, point_traits.points[Point.moon].swe_id)[1]
+
+    for line in lines.features:
+        for segment in line.geometry.coordinates:
+            assert len(segment) > 1
+            assert all(abs(to[0] - start[0]) < 180 for start, to in zip(segment, segment[1:]))
+            assert all(abs(latitude) < 90 - abs(declination) for _, latitude in segment)
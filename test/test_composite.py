@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from astro import create_chart
+from astro.chart.point import create_points_with_attributes
+from astro.chart.point.midpoint_factory import calculate_midpoint_longitude
+from astro.schema import SettingsSchema, EventSchema
+from astro.util import EventType, HouseSystem
+from astro.util.test_events import tim_natal
+
+partner_natal = tim_natal.copy(update={"event": EventSchema(
+    name="Partner",
+    type=EventType.natal,
+    utc_date=datetime(1999, 3, 2, 4, 30, tzinfo=timezone.utc),
+    latitude=51.5072,
+    longitude=-0.1276,
+)})
+
+friend_natal = tim_natal.copy(update={"event": EventSchema(
+    name="Friend",
+    type=EventType.natal,
+    utc_date=datetime(2001, 7, 20, 22, 15, tzinfo=timezone.utc),
+    latitude=-33.8688,
+    longitude=151.2093,
+)})
+
+
+def test_create_composite_chart():
+    """
+    Tests that a composite chart is the midpoint of each point of a pair of charts, with whole sign houses.
+    """
+    charts = create_chart(SettingsSchema(
+        events=[tim_natal, partner_natal],
+        calculate_composite_charts=True
+    )).charts
+
+    assert [chart.event.type for chart in charts] == [EventType.natal, EventType.natal, EventType.composite]
+    assert charts[2].derived_from == [0, 1]
+    assert charts[2].secondary_house_system == HouseSystem.whole_sign
+    assert charts[2].points.keys() == charts[0].points.keys()
+
+    for name, point in charts[2].points.items():
+        from_point, to_point = charts[0].points[name], charts[1].points[name]
+
+        assert point.longitude == pytest.approx(calculate_midpoint_longitude(from_point, to_point))
+        assert point.declination == pytest.approx((from_point.declination + to_point.declination) / 2)
+
+
+def test_create_davison_chart():
+    """
+    Tests that a Davison chart is calculated at the midpoint in time and space of a pair of charts.
+    """
+    charts = create_chart(SettingsSchema(
+        events=[tim_natal, partner_natal],
+        calculate_davison_charts=True
+    )).charts
+    davison = charts[2]
+    midpoint_date = tim_natal.event.utc_date + (partner_natal.event.utc_date - tim_natal.event.utc_date) / 2
+
+    assert davison.event.type == EventType.davison
+    assert davison.derived_from == [0, 1]
+    assert davison.event.utc_date == midpoint_date
+    assert davison.event.latitude == pytest.approx((40.7422 + 51.5072) / 2)
+    assert davison.event.longitude == pytest.approx((-73.974 - 0.1276) / 2)
+
+    expected_points = create_points_with_attributes(tim_natal.copy(update={"event": davison.event}))
+
+    for name, point in davison.points.items():
+        assert point.longitude == pytest.approx(expected_points[name].longitude)
+
+
+def test_create_davison_chart__across_antimeridian():
+    """
+    Tests that the Davison location is the midpoint of the shorter arc between longitudes.
+    """
+    charts = create_chart(SettingsSchema(
+        events=[tim_natal.copy(update={"event": tim_natal.event.copy(update={"longitude": 170})}),
+                tim_natal.copy(update={"event": tim_natal.event.copy(update={"longitude": -160})})],
+        calculate_davison_charts=True
+    )).charts
+
+    assert charts[2].event.longitude == pytest.approx(-175)
+
+
+def test_create_derived_charts__group():
+    """
+    Tests that each pair of events in a group has a composite and Davison chart, related to the pair of events.
+    """
+    collection = create_chart(SettingsSchema(
+        events=[tim_natal, partner_natal, friend_natal],
+        calculate_composite_charts=True,
+        calculate_davison_charts=True
+    ))
+    derived_charts = collection.charts[3:]
+
+    assert [chart.event.type for chart in derived_charts] == [EventType.composite, EventType.davison] * 3
+    assert [chart.derived_from for chart in derived_charts] == [[0, 1], [0, 1], [0, 2], [0, 2], [1, 2], [1, 2]]
+    # Each chart is related to itself, each pair of events to each other, and each derived chart to its pair.
+    assert len(collection.relationships) == 9 + 3 + 6 * 2
+    assert {(relationships.from_chart_index, relationships.to_chart_index)
+            for relationships in collection.relationships
+            if relationships.to_chart_index >= 3 and relationships.from_chart_index != relationships.to_chart_index} \
+        == {(source, index) for index, chart in enumerate(derived_charts, 3) for source in chart.derived_from}
@@ -0,0 +1,59 @@
+import pytest
+import swisseph as swe
+
+from astro import create_chart
+from astro.chart.point.ephemeris import get_julian_day, get_position
+from astro.schema import SettingsSchema
+from astro.util import Point, CoordinateMode
+from astro.util.test_events import tim_natal
+
+
+def test_create_topocentric_chart():
+    """
+    Tests that a topocentric chart observes the moon from the event's location.
+    """
+    geocentric = create_chart(SettingsSchema(events=[tim_natal])).charts[0]
+    topocentric = create_chart(SettingsSchema(
+        events=[tim_natal],
+        coordinate_mode=CoordinateMode.topocentric
+    )).charts[0]
+    event = tim_natal.event
+    swe.set_topo(round(event.longitude, 3), round(event.latitude, 3), 0)
+    expected_moon = swe.calc_ut(get_julian_day(event.utc_date), swe.MOON, swe.FLG_SPEED | swe.FLG_TOPOCTR)[0]
+
+    moon_difference = abs(topocentric.points[Point.moon].longitude - geocentric.points[Point.moon].longitude)
+
+    assert 0 < moon_difference < 1
+    assert topocentric.points[Point.moon].longitude == pytest.approx(expected_moon[0])
+    assert topocentric.points[Point.saturn].longitude == pytest.approx(geocentric.points[Point.saturn].longitude,
+                                                                       abs=0.01)
+
+
+def test_create_topocentric_chart__cached_by_rounded_location():
+    """
+    Tests that topocentric positions are cached for nearby locations that round to the same observer.
+    """
+    nearby_event = tim_natal.copy(update={"event": tim_natal.event.copy(update={
+        "latitude": tim_natal.event.latitude + 0.0001
+    })})
+    create_chart(SettingsSchema(events=[tim_natal], coordinate_mode=CoordinateMode.topocentric))
+    hits = get_position.cache_info().hits
+    create_chart(SettingsSchema(events=[nearby_event], coordinate_mode=CoordinateMode.topocentric))
+
+    assert get_position.cache_info().hits > hits
+
+
+def test_create_heliocentric_chart():
+    """
+    Tests that a heliocentric chart observes the planets from the sun, and skips points undefined from the sun.
+    """
+    heliocentric = create_chart(SettingsSchema(
+        events=[tim_natal],
+        coordinate_mode=CoordinateMode.heliocentric
+    )).charts[0]
+    expected_mars = swe.calc_ut(get_julian_day(tim_natal.event.utc_date), swe.MARS, swe.FLG_SPEED | swe.FLG_HELCTR)[0]
+
+    assert heliocentric.points[Point.mars].longitude == pytest.approx(expected_mars[0])
+    assert Point.sun not in heliocentric.points
+    assert Point.north_mode not in heliocentric.points
+    assert Point.south_node not in heliocentric.points
@@ -0,0 +1,37 @@
+import pytest
+import swisseph as swe
+
+from astro.util import ecliptic_to_equatorial, ecliptic_to_declination_velocity
+
+obliquity = 23.44
+
+
+def test_ecliptic_to_equatorial():
+    """
+    Tests that ecliptic coordinates are converted the same as by swiss ephemeris.
+    """
+    longitudes = [0, 45, 135, 270, 359]
+    latitudes = [0, 5, -3, 1, 0]
+    right_ascensions, declinations = ecliptic_to_equatorial(longitudes, obliquity, latitudes)
+
+    for longitude, latitude, right_ascension, declination in \
+            zip(longitudes, latitudes, right_ascensions, declinations):
+        expected = swe.cotrans((longitude, latitude, 1), -obliquity)
+
+        assert right_ascension == pytest.approx(expected[0])
+        assert declination == pytest.approx(expected[1])
+
+
+def test_ecliptic_to_declination_velocity():
+    """
+    Tests that declination velocities match the change in declination over time.
+    """
+    longitudes = [30, 100, 200]
+    velocities = [1, -0.5, 13]
+    declination_velocities = ecliptic_to_declination_velocity(longitudes, velocities, obliquity)
+
+    for longitude, velocity, declination_velocity in zip(longitudes, velocities, declination_velocities):
+        before = ecliptic_to_equatorial([longitude - velocity / 1000], obliquity)[1][0]
+        after = ecliptic_to_equatorial([longitude + velocity / 1000], obliquity)[1][0]
+
+        assert declination_velocity == pytest.approx((after - before) * 500, rel=1e-4)
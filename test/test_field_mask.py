@@ -0,0 +1,84 @@
+from astro import create_chart, apply_field_mask
+from astro.schema import SettingsSchema, EnabledPointsSchema, LotFormulaSchema
+from astro.util import create_field_mask, includes_field, Point, HouseSystem
+from astro.util.test_events import tim_natal
+
+
+def test_create_field_mask():
+    """
+    Tests that dotted field paths are converted into a tree of snake cased fields.
+    """
+    field_mask = create_field_mask([
+        "charts.points.degreesInSign",
+        "charts.points.sign",
+        "relationships.relationships",
+        "relationships",
+    ])
+
+    assert field_mask == {
+        "charts": {"points": {"degrees_in_sign": {}, "sign": {}}},
+        "relationships": {},
+    }
+
+
+def test_includes_field():
+    """
+    Tests that fields are included when they are within or above a requested path.
+    """
+    field_mask = create_field_mask(["charts.points.sign", "relationships"])
+
+    assert includes_field(field_mask, "charts.points") is True
+    assert includes_field(field_mask, "charts.points.sign") is True
+    assert includes_field(field_mask, "charts.points.condition") is False
+    assert includes_field(field_mask, "relationships.relationships.phase") is True
+    assert includes_field({}, "charts.transits") is True
+
+
+def test_apply_field_mask():
+    """
+    Tests that calculations are disabled for fields that are not requested.
+    """
+    settings = apply_field_mask(SettingsSchema(
+        field_mask=["charts.points.sign", "relationships.relationships.eclipticAspect.type"]
+    ))
+
+    assert settings.calculate_condition is False
+    assert settings.calculate_divisions is False
+    assert settings.calculate_relationships is True
+    assert settings.calculate_relationship_phase is False
+    assert settings.calculate_relationship_movement is False
+    assert settings.calculate_secondary_houses is False
+    assert settings.secondary_house_system == HouseSystem.porphyry
+
+
+def test_create_chart__field_mask():
+    """
+    Tests that charts skip calculations that are not requested.
+    """
+    chart = create_chart(SettingsSchema(
+        events=[tim_natal],
+        field_mask=["charts.points.sign"]
+    ))
+    sun = chart.charts[0].points[Point.sun]
+
+    assert sun.sign is not None
+    assert sun.divisions.sign_ruler is None
+    assert chart.relationships[0].relationships == []
+
+
+def test_create_chart__field_mask_longitudes():
+    """
+    Tests that a masked chart returns the same longitudes as an unmasked chart, including lots using house cusps.
+    """
+    event = tim_natal.copy(update={"enabled": [*tim_natal.enabled, EnabledPointsSchema(
+        lots=[LotFormulaSchema(name="Lot of Cusps", formula="Cusp 2 + Moon - Sun")],
+    )]})
+    settings = SettingsSchema(events=[event], secondary_house_system=HouseSystem.placidus)
+    points = create_chart(settings).charts[0].points
+    masked_points = create_chart(settings.copy(update={
+        "field_mask": ["charts.points.longitude"]
+    })).charts[0].points
+
+    assert "Lot of Cusps" in masked_points
+    assert {name: point.longitude for name, point in masked_points.items()} == \
+        {name: point.longitude for name, point in points.items()}
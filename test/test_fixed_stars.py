@@ -0,0 +1,97 @@
+import pytest
+
+from astro.chart import calculate_fixed_stars, parse_fixed_star_catalog, calculate_fixed_star_positions
+from astro.chart.point import create_points_with_attributes
+from astro.schema import FixedStarSettingsSchema
+from astro.util import AspectType
+from astro.util.test_events import tim_natal
+
+catalog_lines = [
+    "# name, nomenclature, equinox, RA, Dec, pm RA, pm Dec, rad vel, parallax, mag, DM zone, DM number",
+    "Aldebaran,alTau,ICRS,04,35,55.23907,+16,30,33.4885,63.45,-188.94,54.398,48.94,0.86,16,629",
+    "Regulus,alLeo,ICRS,10,08,22.31099,+11,58,01.9516,-248.73,5.59,5.9,41.13,1.40,12,2149",
+    "Spica,alVir,ICRS,13,25,11.57937,-11,09,40.7501,-42.35,-30.67,1.0,13.06,0.97,-10,3672",
+    "Sirius,alCMa,ICRS,06,45,08.91728,-16,42,58.0171,-546.01,-1223.07,-5.50,379.21,-1.46,-16,1591",
+    ",alUMi,ICRS,02,31,49.09456,+89,15,50.7923,44.48,-11.85,-17.4,7.54,1.98,88,8",
+    "Old,xxOld,1950,01,00,00.0,+00,00,00.0,0,0,0,0,1.0,0,0",
+]
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = tmp_path / "sefstars.txt"
+    path.write_text("\n".join(catalog_lines))
+
+    return str(path)
+
+
+def test_parse_fixed_star_catalog():
+    """
+    Tests that catalog lines are parsed into degrees, skipping comments and stars without J2000 coordinates.
+    """
+    catalog = parse_fixed_star_catalog(catalog_lines)
+
+    assert catalog["name"].tolist() == ["Aldebaran", "Regulus", "Spica", "Sirius", "alUMi"]
+    assert catalog["right_ascension"][1] == pytest.approx(152.0929625, abs=1e-6)
+    assert catalog["declination"][2] == pytest.approx(-11.1613195, abs=1e-6)
+    assert catalog["magnitude"][3] == -1.46
+
+
+def test_calculate_fixed_star_positions():
+    """
+    Tests that stars are precessed to their apparent positions on the ecliptic of date.
+    """
+    catalog = parse_fixed_star_catalog(catalog_lines)
+    positions_2000 = calculate_fixed_star_positions(catalog, 2451545.0)
+    positions_2100 = calculate_fixed_star_positions(catalog, 2488070.0)
+
+    assert positions_2000["longitude"][:4].tolist() == pytest.approx([69.7902, 149.8290, 203.8362, 104.0852], abs=1e-3)
+    assert positions_2000["declination"][:4].tolist() == pytest.approx([16.5077, 11.9665, -11.1586, -16.7177], abs=1e-3)
+
+    # The equinoxes precess about 1.4 degrees per century.
+    precession = positions_2100["longitude"][:4] - positions_2000["longitude"][:4]
+
+    assert precession.tolist() == pytest.approx([1.397] * 4, abs=0.02)
+
+
+def test_calculate_fixed_stars(catalog_path):
+    """
+    Tests that the contacts found by binary search match checking every star against every point.
+    """
+    conjunction_orb, parallel_orb = 8, 2
+    stars = calculate_fixed_stars(FixedStarSettingsSchema(
+        event=tim_natal,
+        conjunction_orb=conjunction_orb,
+        parallel_orb=parallel_orb,
+    ), catalog_path)
+    points = create_points_with_attributes(tim_natal).values()
+    expected = set()
+
+    for star in stars.stars:
+        for point in points:
+            arc = (star.longitude - point.longitude) % 360
+
+            if min(arc, 360 - arc) <= conjunction_orb:
+                expected.add((star.name, point.name, AspectType.conjunction))
+            if abs(star.declination - point.declination) <= parallel_orb:
+                expected.add((star.name, point.name, AspectType.parallel))
+            if abs(star.declination + point.declination) <= parallel_orb:
+                expected.add((star.name, point.name, AspectType.contraparallel))
+
+    assert [star.name for star in stars.stars] == ["Aldebaran", "alUMi", "Sirius", "Regulus", "Spica"]
+    assert len(expected) > 0
+    assert {(contact.star, contact.point, contact.type) for contact in stars.contacts} == expected
+    assert all(abs(contact.orb) <= max(conjunction_orb, parallel_orb) for contact in stars.contacts)
+
+
+def test_calculate_fixed_stars__filtered(catalog_path):
+    """
+    Tests that stars are filtered by name and magnitude.
+    """
+    stars = calculate_fixed_stars(FixedStarSettingsSchema(
+        event=tim_natal,
+        max_magnitude=1.2,
+        stars=["Regulus", "Spica", "Sirius"],
+    ), catalog_path)
+
+    assert [star.name for star in stars.stars] == ["Sirius", "Spica"]
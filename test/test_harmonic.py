@@ -0,0 +1,110 @@
+import pytest
+from pydantic import ValidationError
+
+from astro import create_chart
+from astro.chart import calculate_harmonic_spectrum, find_harmonic_aspects
+from astro.chart.point import create_points_with_attributes
+from astro.schema import SettingsSchema, HarmonicSpectrumSettingsSchema, EnabledPointsSchema, LotFormulaSchema
+from astro.util import Point, AspectType
+from astro.util.test_events import tim_natal
+
+
+def test_create_harmonic_chart():
+    """
+    Tests that a harmonic chart multiplies the longitude and velocity of each point.
+    """
+    points = create_points_with_attributes(tim_natal)
+    harmonic_event = tim_natal.copy(update={"harmonic": 5})
+    chart = create_chart(SettingsSchema(events=[harmonic_event])).charts[0]
+
+    assert chart.harmonic == 5
+    assert chart.houses_whole_sign[0].sign == chart.points[Point.ascendant].sign
+
+    for name, point in points.items():
+        harmonic_point = chart.points[name]
+
+        assert harmonic_point.longitude == pytest.approx(point.longitude * 5 % 360)
+        assert harmonic_point.declination is None
+
+        if point.longitude_velocity is not None:
+            assert harmonic_point.longitude_velocity == pytest.approx(point.longitude_velocity * 5)
+
+
+def test_find_harmonic_aspects():
+    """
+    Tests finding aspects within many harmonics at once.
+    """
+    harmonic_indices, pair_indices, aspect_indices, orbs = find_harmonic_aspects(
+        [0, 72, 181],
+        [1, 2, 5],
+        [(0, 1), (0, 2), (1, 2)],
+        [0, 180],
+        [2, 2]
+    )
+    aspects = set(zip(harmonic_indices.tolist(), pair_indices.tolist(), aspect_indices.tolist()))
+
+    # In the 1st harmonic, 0 and 181 oppose. In the 2nd, 0 and 181 conjoin.
+    # In the 5th, 0 and 72 conjoin, and 181 is 5 degrees past an opposition to both.
+    assert aspects == {(0, 1, 1), (1, 1, 0), (2, 0, 0)}
+    assert sorted(abs(orb) for orb in orbs.tolist()) == pytest.approx([0, 1, 2])
+
+
+def test_calculate_harmonic_spectrum():
+    """
+    Tests that the spectrum matches the aspects within each harmonic chart.
+    """
+    spectrum = calculate_harmonic_spectrum(HarmonicSpectrumSettingsSchema(
+        event=tim_natal,
+        to_harmonic=12,
+        aspects=[AspectType.conjunction],
+        points=[Point.sun, Point.moon, Point.mercury, Point.venus, Point.mars],
+    ))
+    points = create_points_with_attributes(tim_natal)
+    names = [Point.sun, Point.moon, Point.mercury, Point.venus, Point.mars]
+
+    assert [harmonic.harmonic for harmonic in spectrum.harmonics] == list(range(1, 13))
+
+    for harmonic in spectrum.harmonics:
+        expected = set()
+
+        for from_index, from_name in enumerate(names):
+            for to_name in names[from_index + 1:]:
+                arc = (points[to_name].longitude - points[from_name].longitude) * harmonic.harmonic % 360
+
+                if min(arc, 360 - arc) <= 8:
+                    expected.add(frozenset([from_name, to_name]))
+
+        assert {frozenset([aspect.from_point, aspect.to_point]) for aspect in harmonic.aspects} == expected
+        assert harmonic.strength == pytest.approx(sum(1 - abs(aspect.orb) / 8 for aspect in harmonic.aspects))
+
+
+def test_calculate_harmonic_spectrum__custom_lot():
+    """
+    Tests that custom lots made of two points are included in the spectrum, while midpoints are skipped.
+    """
+    event = tim_natal.copy(update={"enabled": [EnabledPointsSchema(
+        points=[Point.sun, Point.moon, Point.mars],
+        midpoints=[{"from_point": Point.sun, "to_point": Point.moon}],
+        lots=[LotFormulaSchema(name="Lot of Debt", formula="Sun + Moon", reverse_at_night=False)],
+    )]})
+    spectrum = calculate_harmonic_spectrum(HarmonicSpectrumSettingsSchema(event=event, to_harmonic=36))
+    aspect_points = {
+        point for harmonic in spectrum.harmonics for aspect in harmonic.aspects
+        for point in [aspect.from_point, aspect.to_point]
+    }
+
+    assert "Lot of Debt" in aspect_points
+    assert "Sun-Moon Midpoint" not in aspect_points
+
+
+@pytest.mark.parametrize("update", [
+    {"aspects": [AspectType.conjunction, AspectType.parallel]},
+    {"aspects": [AspectType.aversion]},
+    {"from_harmonic": 10, "to_harmonic": 5},
+])
+def test_harmonic_spectrum_settings__invalid(update):
+    """
+    Tests that declination aspects, aversions, and backwards ranges of harmonics are rejected.
+    """
+    with pytest.raises(ValidationError):
+        HarmonicSpectrumSettingsSchema(event=tim_natal, **update)
@@ -1,9 +1,13 @@
-from astro import SettingsSchema
+import swisseph as swe
+
+from astro import SettingsSchema, create_chart
 from astro.chart.point import create_points_with_attributes
 from astro.chart import calculate_whole_sign_house_cusps, calculate_whole_sign_house_of_point, \
     calculate_house_rulers, calculate_whole_sign_houses, calculate_secondary_houses, \
-    calculate_secondary_house_cusps, calculate_secondary_house_of_point
-from astro.util import ZodiacSign, Point, HouseSystem
+    calculate_secondary_house_cusps, calculate_secondary_house_of_point, calculate_house_comparison, \
+    find_houses_of_longitudes, get_rulers_by_sign
+from astro.chart.point.ephemeris import get_house_cusps_for_systems, get_houses, house_system_to_id
+from astro.util import ZodiacSign, Point, HouseSystem, RulershipType
 from astro.util.test_events import tim_natal
 
 
@@ -149,3 +153,127 @@ def test_calculate_secondary_house_rulers():
 
     assert mercury.houses_secondary.ruled_houses == [7, 10]
     assert jupiter.houses_secondary.ruled_houses == [1, 4]
+
+
+def test_calculate_modern_house_rulers():
+    """
+    Tests that each house lists every ruler of its sign, and each ruler lists every house it rules.
+    """
+    settings = SettingsSchema(rulership_system=[RulershipType.traditional, RulershipType.modern])
+    points = create_points_with_attributes(tim_natal)
+    houses = calculate_whole_sign_house_cusps(points[Point.ascendant])[0]
+
+    calculate_house_rulers(points, houses, False, settings)
+
+    assert houses[11].sign == ZodiacSign.scorpio
+    assert houses[11].rulers == [Point.mars, Point.pluto]
+    assert points[Point.mars].houses_secondary.ruled_houses == [5, 12]
+    assert points[Point.pluto].houses_secondary.ruled_houses == [12]
+    assert get_rulers_by_sign((RulershipType.traditional,))[ZodiacSign.scorpio] == [Point.mars]
+
+
+def test_calculate_house_rulers__recalculated():
+    """
+    Tests that calculating primary house rulers again replaces the rulers, without listing any ruler
+    or house twice, and without setting the secondary ruled houses.
+    """
+    points = create_points_with_attributes(tim_natal)
+    houses = calculate_whole_sign_house_cusps(points[Point.ascendant])[0]
+
+    calculate_house_rulers(points, houses, True)
+    calculate_house_rulers(points, houses, True)
+
+    assert houses[0].rulers == [Point.jupiter]
+    assert points[Point.jupiter].houses_whole_sign.ruled_houses == [1, 4]
+    assert points[Point.jupiter].houses_secondary.ruled_houses == []
+    assert points[Point.saturn].houses_whole_sign.ruled_houses == [2, 3]
+    assert points[Point.saturn].houses_secondary.ruled_houses == []
+
+
+def test_get_house_cusps_for_systems():
+    """
+    Tests that house cusps derived from the angles match the cusps calculated by swiss ephemeris.
+    """
+    create_points_with_attributes(tim_natal)
+    event = tim_natal.event
+    house_systems = [HouseSystem.whole_sign, HouseSystem.equal, HouseSystem.porphyry, HouseSystem.placidus]
+    system_cusps = get_house_cusps_for_systems(event.julian_day, event.latitude, event.longitude, house_systems)
+
+    for house_system in house_systems:
+        expected_cusps = swe.houses(
+            event.julian_day, event.latitude, event.longitude, house_system_to_id[house_system])[0]
+
+        for cusp, expected_cusp in zip(system_cusps[house_system], expected_cusps):
+            assert abs((cusp - expected_cusp + 180) % 360 - 180) < 0.0000001
+
+
+def test_calculate_houses_shares_angles():
+    """
+    Tests that the secondary house cusps reuse the house calculation made for the angles.
+    """
+    get_houses.cache_clear()
+    points = create_points_with_attributes(tim_natal, SettingsSchema(secondary_house_system=HouseSystem.placidus))
+    calculate_secondary_houses(points, tim_natal.event, SettingsSchema(secondary_house_system=HouseSystem.placidus))
+
+    assert get_houses.cache_info().misses == 1
+
+
+def test_calculate_house_comparison_shares_angles():
+    """
+    Tests that compared house systems derived from the angles reuse the house calculation made for the angles.
+    """
+    settings = SettingsSchema(
+        secondary_house_system=HouseSystem.placidus,
+        compare_house_systems=[HouseSystem.whole_sign, HouseSystem.equal, HouseSystem.porphyry]
+    )
+    get_houses.cache_clear()
+    points = create_points_with_attributes(tim_natal, settings)
+    calculate_house_comparison(points, tim_natal.event, settings)
+
+    assert get_houses.cache_info().misses == 1
+
+
+def test_calculate_house_comparison():
+    """
+    Tests that the houses of multiple house systems are calculated without changing the points' houses.
+    """
+    points = create_points_with_attributes(tim_natal)
+    houses_comparison = calculate_house_comparison(
+        points,
+        tim_natal.event,
+        SettingsSchema(compare_house_systems=[HouseSystem.porphyry, HouseSystem.whole_sign])
+    )
+
+    assert houses_comparison[HouseSystem.porphyry][0].points == [Point.ascendant, Point.mars]
+    assert houses_comparison[HouseSystem.whole_sign][0].points == \
+        [Point.ascendant, Point.venus, Point.mars, Point.pluto]
+    assert points[Point.venus].houses_secondary.house is None
+
+
+def test_calculate_house_comparison__polar_placidus():
+    """
+    Tests that compared and secondary Placidus houses fall back to Porphyry within the polar circles.
+    """
+    polar_natal = tim_natal.copy(deep=True)
+    polar_natal.event.latitude = 75
+    placidus, porphyry = [
+        create_chart(SettingsSchema(
+            events=[polar_natal],
+            secondary_house_system=house_system,
+            compare_house_systems=[house_system],
+        )).charts[0]
+        for house_system in [HouseSystem.placidus, HouseSystem.porphyry]
+    ]
+
+    assert placidus.houses_comparison[HouseSystem.placidus] == porphyry.houses_comparison[HouseSystem.porphyry]
+    assert placidus.houses_secondary == porphyry.houses_secondary
+
+
+def test_find_houses_of_longitudes():
+    """
+    Tests that the houses of many longitudes are found at once, including houses that wrap past 0 degrees.
+    """
+    cusps = [350, 20, 50, 80, 110, 140, 170, 200, 230, 260, 290, 320]
+    house_indices = find_houses_of_longitudes([350, 359.9, 0, 19.9, 20, 200, 349.9], cusps)
+
+    assert house_indices.tolist() == [0, 0, 0, 0, 1, 7, 11]
@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from astro import create_chart
+from astro.chart import calculate_lunations, get_elongation, phase_angles
+from astro.schema import LunationSettingsSchema, SettingsSchema
+from astro.util import PhaseType, EclipseType, Ayanamsa, zodiac_sign_order, wrap_degrees
+from astro.util.test_events import tim_natal
+
+
+def test_calculate_lunations():
+    """
+    Tests finding the exact lunations and eclipses of 2024.
+    """
+    page = calculate_lunations(LunationSettingsSchema(
+        start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        page_size=20,
+    ))
+
+    assert [lunation.phase for lunation in page.lunations[:4]] == \
+        [PhaseType.last_quarter, PhaseType.new, PhaseType.first_quarter, PhaseType.full]
+    assert page.lunations[1].utc_date.strftime("%Y-%m-%d %H:%M") == "2024-01-11 11:57"
+
+    for lunation in page.lunations:
+        orb = wrap_degrees(get_elongation(lunation.julian_day)[0] - phase_angles[lunation.phase])
+
+        assert orb == pytest.approx(0, abs=1e-5)
+
+    eclipses = [(lunation.utc_date.date().isoformat(), lunation.eclipse) for lunation in page.lunations
+                if lunation.eclipse]
+
+    assert eclipses == [("2024-03-25", EclipseType.penumbral), ("2024-04-08", EclipseType.total)]
+
+
+def test_calculate_lunations__pages():
+    """
+    Tests that consecutive pages continue where the last page ended.
+    """
+    settings = LunationSettingsSchema(
+        start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        page_size=6,
+        phases=[PhaseType.new, PhaseType.full],
+    )
+    all_lunations = calculate_lunations(settings.copy(update={"page_size": 12})).lunations
+    first_page = calculate_lunations(settings)
+    second_page = calculate_lunations(settings.copy(update={"start_date": first_page.next_start_date}))
+
+    assert [lunation.julian_day for lunation in first_page.lunations + second_page.lunations] == \
+        pytest.approx([lunation.julian_day for lunation in all_lunations])
+
+
+def test_calculate_lunations__eclipses_only():
+    """
+    Tests finding only eclipses.
+    """
+    page = calculate_lunations(LunationSettingsSchema(
+        start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        page_size=4,
+        eclipses_only=True,
+    ))
+
+    assert [lunation.eclipse for lunation in page.lunations] == \
+        [EclipseType.penumbral, EclipseType.total, EclipseType.partial, EclipseType.annular]
+
+
+def test_calculate_prenatal_lunation():
+    """
+    Tests that a chart is annotated with the last new or full moon before it.
+    """
+    chart = create_chart(SettingsSchema(events=[tim_natal], calculate_prenatal_lunation=True)).charts[0]
+    lunation = chart.prenatal_lunation
+
+    assert lunation.phase in (PhaseType.new, PhaseType.full)
+    assert 0 < tim_natal.event.julian_day - lunation.julian_day < 15
+    assert wrap_degrees(get_elongation(lunation.julian_day)[0] - phase_angles[lunation.phase]) == \
+        pytest.approx(0, abs=1e-5)
+
+
+def test_calculate_prenatal_lunation__sidereal():
+    """
+    Tests that the prenatal lunation of a sidereal chart is in the chart's sidereal zodiac.
+    """
+    tropical, sidereal = [
+        create_chart(SettingsSchema(
+            events=[tim_natal],
+            calculate_prenatal_lunation=True,
+            sidereal_ayanamsa=ayanamsa
+        )).charts[0].prenatal_lunation
+        for ayanamsa in [None, Ayanamsa.lahiri]
+    ]
+
+    assert sidereal.julian_day == tropical.julian_day
+    assert 23 < wrap_degrees(tropical.longitude - sidereal.longitude) < 24
+    assert sidereal.sign == zodiac_sign_order[int(sidereal.longitude // 30)]
+
+
+def test_calculate_prenatal_lunation__harmonic():
+    """
+    Tests that the prenatal lunation of a harmonic chart is found from its event, not its multiplied points.
+    """
+    charts = create_chart(SettingsSchema(
+        events=[tim_natal, tim_natal.copy(update={"harmonic": 5})],
+        calculate_prenatal_lunation=True
+    )).charts
+
+    assert charts[1].prenatal_lunation == charts[0].prenatal_lunation
+
+
+def test_calculate_prenatal_lunation__solar_arc():
+    """
+    Tests that a solar arc chart, whose points all move at the same speed, has a prenatal lunation.
+    """
+    solar_arc_to = tim_natal.event.copy(update={"utc_date": datetime(2027, 10, 11, tzinfo=timezone.utc)})
+    solar_arc = create_chart(SettingsSchema(
+        events=[tim_natal.copy(update={"solar_arc_to": solar_arc_to})],
+        calculate_prenatal_lunation=True
+    )).charts[1]
+
+    assert 0 < solar_arc.event.julian_day - solar_arc.prenatal_lunation.julian_day < 15
+
+
+def test_calculate_lunations__eclipses_without_new_or_full_moons():
+    """
+    Tests that only eclipses cannot be found without the new or full moon phases.
+    """
+    with pytest.raises(ValidationError):
+        LunationSettingsSchema(
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            phases=[PhaseType.first_quarter, PhaseType.last_quarter],
+            eclipses_only=True,
+        )
@@ -0,0 +1,86 @@
+import pytest
+
+from astro.chart import calculate_midpoint_trees, find_within_orb
+from astro.chart.point import create_points_with_attributes
+from astro.chart.point.midpoint_factory import calculate_midpoint_longitude
+from astro.schema import MidpointTreeSettingsSchema, EnabledPointsSchema, LotFormulaSchema
+from astro.util import Point
+from astro.util.test_events import tim_natal
+
+
+def test_calculate_midpoint_trees():
+    """
+    Tests that the midpoints found within orb on a dial match checking every pair of points.
+    """
+    dial_degrees, orb = 45, 1
+    trees = calculate_midpoint_trees(MidpointTreeSettingsSchema(
+        event=tim_natal,
+        dial_degrees=dial_degrees,
+        orb=orb,
+        points=[Point.sun, Point.moon]
+    ))
+    points = list(create_points_with_attributes(tim_natal).values())
+
+    assert [tree.name for tree in trees.trees] == [Point.sun, Point.moon]
+
+    for tree in trees.trees:
+        expected = set()
+
+        for from_index, from_point in enumerate(points):
+            for to_point in points[from_index + 1:]:
+                if tree.name in [from_point.name, to_point.name]:
+                    continue
+
+                arc = (calculate_midpoint_longitude(from_point, to_point) - tree.dial_longitude) % dial_degrees
+
+                if min(arc, dial_degrees - arc) <= orb:
+                    expected.add(f"{from_point.name}-{to_point.name} Midpoint")
+
+        midpoints = {entry.name for entry in tree.entries if len(entry.points) == 2}
+
+        assert midpoints == expected
+        assert all(abs(entry.orb) <= orb for entry in tree.entries)
+
+
+def test_calculate_midpoint_trees__custom_lot():
+    """
+    Tests that custom lots made of two points have trees and midpoints, while enabled midpoints are skipped.
+    """
+    event = tim_natal.copy(update={"enabled": [EnabledPointsSchema(
+        points=[Point.sun, Point.moon, Point.mars],
+        midpoints=[{"from_point": Point.sun, "to_point": Point.moon}],
+        lots=[LotFormulaSchema(name="Lot of Debt", formula="Sun + Moon", reverse_at_night=False)],
+    )]})
+    trees = {tree.name: tree for tree in calculate_midpoint_trees(MidpointTreeSettingsSchema(event=event, orb=45)).trees}
+
+    assert trees.keys() == {Point.sun, Point.moon, Point.mars, "Lot of Debt"}
+    assert "Mars-Lot of Debt Midpoint" in [entry.name for entry in trees[Point.sun].entries]
+
+
+def test_calculate_midpoint_trees__custom_lot_root():
+    """
+    Tests that a tree can be requested for a custom lot by name.
+    """
+    event = tim_natal.copy(update={"enabled": [EnabledPointsSchema(
+        points=[Point.sun, Point.moon, Point.mars],
+        lots=[LotFormulaSchema(name="Lot of Debt", formula="Sun + Moon", reverse_at_night=False)],
+    )]})
+    trees = calculate_midpoint_trees(MidpointTreeSettingsSchema(
+        event=event,
+        orb=45,
+        points=[Point.mars, "Lot of Debt"]
+    )).trees
+
+    assert [tree.name for tree in trees] == [Point.mars, "Lot of Debt"]
+    assert {Point.sun, Point.moon} in [set(entry.points) for entry in trees[1].entries]
+
+
+def test_find_within_orb__wraps_dial():
+    """
+    Tests that positions on the other end of the dial are found within orb.
+    """
+    dial_index = ([0.5, 10, 44.2], [("A", [Point.sun]), ("B", [Point.moon]), ("C", [Point.mars])])
+    entries = find_within_orb(dial_index, 44.8, 1, 45)
+
+    assert [entry.name for entry in entries] == ["C", "A"]
+    assert entries[1].orb == pytest.approx(0.7)
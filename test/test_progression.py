@@ -0,0 +1,140 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from astro import create_chart
+from astro.chart import calculate_progression_timeline, get_progressed_julian_day, tropical_year_days
+from astro.chart.point import create_points_with_attributes
+from astro.chart.point.ephemeris import get_julian_day, get_longitude_and_velocity
+from astro.collection import point_traits
+from astro.schema import SettingsSchema, EventSchema, ProgressionTimelineSettingsSchema, EnabledPointsSchema, \
+    LotFormulaSchema
+from astro.util import Point, EventType, AspectType, Ayanamsa
+from astro.util.test_events import tim_natal
+
+target_event = EventSchema(
+    utc_date=datetime(2027, 10, 11, 15, 9, tzinfo=timezone.utc),
+    latitude=tim_natal.event.latitude,
+    longitude=tim_natal.event.longitude,
+)
+
+
+def test_get_progressed_julian_day():
+    """
+    Tests that each year of life progresses by one day.
+    """
+    assert get_progressed_julian_day(2450000, 2450000 + tropical_year_days * 30) == pytest.approx(2450030)
+
+
+def test_create_progressed_chart():
+    """
+    Tests that a progressed chart is calculated for the day for a year progressed date after the natal chart.
+    """
+    charts = create_chart(SettingsSchema(events=[tim_natal.copy(update={"progress_to": target_event})])).charts
+
+    assert [chart.event.type for chart in charts] == [EventType.natal, EventType.progressed]
+    assert (charts[1].event.utc_date - charts[0].event.utc_date).total_seconds() / 86400 == pytest.approx(30, abs=0.01)
+
+    sun_id = point_traits.points[Point.sun].swe_id
+    progressed_sun = get_longitude_and_velocity(charts[1].event.julian_day, sun_id)[0]
+
+    assert charts[1].points[Point.sun].longitude == pytest.approx(progressed_sun)
+
+
+def test_create_solar_arc_chart():
+    """
+    Tests that every natal point is directed by the arc of the progressed sun.
+    """
+    collection = create_chart(SettingsSchema(events=[tim_natal.copy(update={"solar_arc_to": target_event})]))
+    natal, solar_arc = collection.charts
+    arc = solar_arc.points[Point.sun].longitude - natal.points[Point.sun].longitude
+
+    assert solar_arc.event.type == EventType.solar_arc
+    assert 28 < arc < 32
+    assert len(collection.relationships) == 3
+
+    for name, point in natal.points.items():
+        assert solar_arc.points[name].longitude == pytest.approx((point.longitude + arc) % 360)
+
+
+def test_create_solar_arc_chart__sidereal():
+    """
+    Tests that a sidereal solar arc sun is at the sidereal progressed sun.
+    """
+    charts = create_chart(SettingsSchema(
+        events=[tim_natal.copy(update={"progress_to": target_event, "solar_arc_to": target_event})],
+        sidereal_ayanamsa=Ayanamsa.lahiri
+    )).charts
+    progressed, solar_arc = [
+        next(chart for chart in charts if chart.event.type == event_type)
+        for event_type in [EventType.progressed, EventType.solar_arc]
+    ]
+
+    assert solar_arc.points[Point.sun].longitude == pytest.approx(progressed.points[Point.sun].longitude)
+
+
+def test_calculate_progression_timeline():
+    """
+    Tests that progressed aspects are found on the dates they are exact.
+    """
+    natal_points = create_points_with_attributes(tim_natal)
+    timeline = calculate_progression_timeline(ProgressionTimelineSettingsSchema(
+        event=tim_natal,
+        start_date=datetime(1997, 10, 12, tzinfo=timezone.utc),
+        end_date=datetime(2047, 10, 12, tzinfo=timezone.utc),
+        points=[Point.sun, Point.moon],
+        aspects=[AspectType.conjunction, AspectType.square],
+    ))
+    natal_day = tim_natal.event.julian_day
+
+    assert len(timeline.aspects) > 0
+    assert any(aspect.progressed_point == Point.moon for aspect in timeline.aspects)
+    assert timeline.aspects == sorted(timeline.aspects, key=lambda aspect: aspect.utc_date)
+
+    for aspect in timeline.aspects:
+        progressed_day = get_progressed_julian_day(natal_day, get_julian_day(aspect.utc_date))
+        swe_id = point_traits.points[aspect.progressed_point].swe_id
+        longitude = get_longitude_and_velocity(progressed_day, swe_id)[0]
+        arc = abs((longitude - natal_points[aspect.natal_point].longitude + 180) % 360 - 180)
+        degrees = 0 if aspect.type == AspectType.conjunction else 90
+
+        # Dates are only precise to the minute of the progressed day, which is about 6 hours of life.
+        assert arc == pytest.approx(degrees, abs=0.01)
+
+
+def test_calculate_progression_timeline__custom_lot():
+    """
+    Tests that progressed aspects are found to natal custom lots.
+    """
+    event = tim_natal.copy(update={"enabled": [EnabledPointsSchema(
+        points=[Point.sun, Point.moon, Point.ascendant],
+        lots=[LotFormulaSchema(name="Lot of Debt", formula="Ascendant + Sun - Moon")],
+    )]})
+    timeline = calculate_progression_timeline(ProgressionTimelineSettingsSchema(
+        event=event,
+        start_date=datetime(1997, 10, 12, tzinfo=timezone.utc),
+        end_date=datetime(2047, 10, 12, tzinfo=timezone.utc),
+        points=[Point.moon],
+        aspects=[AspectType.conjunction],
+    ))
+
+    assert "Lot of Debt" in [aspect.natal_point for aspect in timeline.aspects]
+
+
+@pytest.mark.parametrize("update", [
+    {"aspects": [AspectType.conjunction, AspectType.contraparallel]},
+    {"aspects": [AspectType.aversion]},
+    {"start_date": datetime(2030, 1, 1, tzinfo=timezone.utc)},
+])
+def test_progression_timeline_settings__invalid(update):
+    """
+    Tests that declination aspects, aversions, and backwards ranges of dates are rejected.
+    """
+    with pytest.raises(ValidationError):
+        ProgressionTimelineSettingsSchema(**{
+            "event": tim_natal,
+            "start_date": datetime(2020, 1, 1, tzinfo=timezone.utc),
+            "end_date": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            **update,
+        })
@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from astro.chart import calculate_relocations, find_parans, calculate_angle_longitudes
+from astro.chart.point import create_points_with_attributes
+from astro.chart.point.ephemeris import get_houses, get_julian_day
+from astro.collection import point_traits
+from astro.schema import RelocationSettingsSchema
+from astro.util import HouseSystem, Point
+from astro.util.test_events import tim_natal
+
+latitudes = [40.7128, -33.8688, 64.1466, 1.5, -54.8]
+longitudes = [-74.006, 151.2093, -21.9426, 179.5, -68.3]
+
+
+@pytest.mark.parametrize("house_system", [HouseSystem.whole_sign, HouseSystem.porphyry, HouseSystem.placidus])
+def test_calculate_relocations(house_system):
+    """
+    Tests that the relocated angles and houses match calculating a chart at each location.
+    """
+    relocations = calculate_relocations(RelocationSettingsSchema(
+        event=tim_natal,
+        latitudes=latitudes,
+        longitudes=longitudes,
+        house_system=house_system,
+        calculate_parans=False,
+    ))
+    jul_day = get_julian_day(tim_natal.event.utc_date)
+
+    for index, (latitude, longitude) in enumerate(zip(latitudes, longitudes)):
+        # [0] Cusps: tuple of 12 float for cusps.
+        # [1] Asc MC: tuple of 8 float for additional points.
+        cusps, angles = get_houses(jul_day, latitude, longitude, house_system)[:2]
+
+        assert relocations.ascendant[index] == pytest.approx(angles[0], abs=1e-6)
+        assert relocations.midheaven[index] == pytest.approx(angles[1], abs=1e-6)
+        assert relocations.vertex[index] == pytest.approx(angles[3], abs=1e-6)
+        assert relocations.cusps[index] == pytest.approx(list(cusps), abs=1e-6)
+
+
+def test_calculate_relocations__angular_points():
+    """
+    Tests that the angular points and point houses match checking each point at each location.
+    """
+    orb = 5
+    relocations = calculate_relocations(RelocationSettingsSchema(
+        event=tim_natal,
+        latitudes=latitudes,
+        longitudes=longitudes,
+        angular_orb=orb,
+        calculate_parans=False,
+    ))
+    points = [point for point in create_points_with_attributes(tim_natal).values() if point.name in point_traits.points]
+
+    for index in range(len(latitudes)):
+        angles = {
+            Point.ascendant: relocations.ascendant[index],
+            Point.midheaven: relocations.midheaven[index],
+            Point.descendant: (relocations.ascendant[index] + 180) % 360,
+            Point.inner_heaven: (relocations.midheaven[index] + 180) % 360,
+        }
+        expected = {
+            (point.name, angle) for point in points for angle, longitude in angles.items()
+            if abs((point.longitude - longitude + 180) % 360 - 180) <= orb
+        }
+        cusps = relocations.cusps[index]
+
+        assert {(angular.point, angular.angle) for angular in relocations.angular_points[index]} == expected
+
+        for point in points:
+            house = relocations.point_houses[point.name][index]
+
+            assert (point.longitude - cusps[house - 1]) % 360 < (cusps[house % 12] - cusps[house - 1]) % 360
+
+
+def test_find_parans():
+    """
+    Tests that parans are found where both bodies are on their angles at the same time.
+    """
+    right_ascensions, declinations = np.array([100, 160, 220]), np.array([20, -10, 5])
+    parans = find_parans(["A", "B", "C"], right_ascensions, declinations, 70)
+
+    assert len(parans) > 0
+    assert all(paran.latitude == sorted(paran.latitude for paran in parans)[index]
+               for index, paran in enumerate(parans))
+
+    for paran in parans:
+        angle_longitudes = calculate_angle_longitudes(right_ascensions, declinations, [paran.latitude], 0)
+        from_longitude = angle_longitudes[paran.from_angle][["A", "B", "C"].index(paran.from_point), 0]
+        to_longitude = angle_longitudes[paran.to_angle][["A", "B", "C"].index(paran.to_point), 0]
+
+        assert (from_longitude - to_longitude + 180) % 360 - 180 == pytest.approx(0, abs=0.01)
+
+    # A sets when B culminates where A's semi-diurnal arc is 60 degrees: tan(latitude) = -cos(60) / tan(20).
+    expected_latitude = np.degrees(np.arctan(-np.cos(np.radians(60)) / np.tan(np.radians(20))))
+    paran = next(
+        paran for paran in parans
+        if (paran.from_point, paran.from_angle, paran.to_point, paran.to_angle) ==
+        ("A", Point.descendant, "B", Point.midheaven)
+    )
+
+    assert paran.latitude == pytest.approx(expected_latitude, abs=0.01)
+
+
+def test_calculate_relocations__paran_stars(tmp_path):
+    """
+    Tests that fixed stars are included in parans.
+    """
+    catalog_path = tmp_path / "sefstars.txt"
+    catalog_path.write_text("Regulus,alLeo,ICRS,10,08,22.31099,+11,58,01.9516,-248.73,5.59,5.9,41.13,1.40,12,2149")
+    relocations = calculate_relocations(RelocationSettingsSchema(
+        event=tim_natal,
+        paran_stars=["Regulus"],
+    ), str(catalog_path))
+
+    assert any("Regulus" in [paran.from_point, paran.to_point] for paran in relocations.parans)
+
+
+@pytest.mark.parametrize("latitudes, longitudes", [([0, 1], [0]), ([90.5], [0]), ([-120], [0])])
+def test_calculate_relocations__invalid_locations(latitudes, longitudes):
+    """
+    Tests that each location must have a latitude and longitude, with a latitude between the poles.
+    """
+    with pytest.raises(ValidationError):
+        RelocationSettingsSchema(event=tim_natal, latitudes=latitudes, longitudes=longitudes)
+
+
+def test_calculate_relocations__polar_placidus():
+    """
+    Tests that Placidus cusps fall back to Porphyry within the polar circles, without failing other locations.
+    """
+    relocations = calculate_relocations(RelocationSettingsSchema(
+        event=tim_natal,
+        latitudes=[40.7128, 78.2232],
+        longitudes=[-74.006, 15.6267],
+        house_system=HouseSystem.placidus,
+        calculate_parans=False,
+    ))
+    porphyry = calculate_relocations(RelocationSettingsSchema(
+        event=tim_natal,
+        latitudes=[78.2232],
+        longitudes=[15.6267],
+        house_system=HouseSystem.porphyry,
+        calculate_parans=False,
+    ))
+
+    # [0] Cusps: tuple of 12 float for cusps.
+    # [1] Asc MC: tuple of 8 float for additional points.
+    cusps, angles = get_houses(get_julian_day(tim_natal.event.utc_date), 78.2232, 15.6267, HouseSystem.porphyry)[:2]
+
+    assert relocations.cusps[1] == pytest.approx(porphyry.cusps[0], abs=1e-6)
+    assert relocations.cusps[1] == pytest.approx(list(cusps), abs=1e-6)
+    assert relocations.ascendant[1] == pytest.approx(angles[0], abs=1e-6)
@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from astro import create_returns, create_chart
+from astro.chart import find_return_julian_days
+from astro.chart.point.ephemeris import get_julian_day, get_longitude_and_velocity
+from astro.collection import point_traits
+from astro.schema import ReturnSettingsSchema, SettingsSchema
+from astro.util import Point, ReturnType, EventType, Ayanamsa
+from astro.util.test_events import tim_natal
+
+
+def test_create_solar_returns():
+    """
+    Tests finding a century of solar returns in one call.
+    """
+    returns = create_returns(ReturnSettingsSchema(
+        event=tim_natal,
+        start_date=datetime(1998, 1, 1, tzinfo=timezone.utc),
+        count=100,
+        include_charts=False,
+    ))
+    sun_id = point_traits.points[Point.sun].swe_id
+
+    assert len(returns.returns) == 100
+    assert [solar_return.utc_date.year for solar_return in returns.returns] == list(range(1998, 2098))
+
+    for solar_return in returns.returns:
+        longitude = get_longitude_and_velocity(solar_return.julian_day, sun_id)[0]
+
+        assert solar_return.utc_date.month == 10
+        assert longitude == pytest.approx(returns.natal_longitude, abs=1e-6)
+
+
+def test_create_lunar_return_charts():
+    """
+    Tests that the chart at each lunar return has the moon at its natal longitude.
+    """
+    returns = create_returns(ReturnSettingsSchema(
+        event=tim_natal,
+        type=ReturnType.lunar_return,
+        start_date=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        count=3,
+    ))
+
+    for lunar_return in returns.returns:
+        chart = lunar_return.chart.charts[0]
+
+        assert chart.event.type == EventType.lunar_return
+        assert chart.points[Point.moon].longitude == pytest.approx(returns.natal_longitude, abs=0.001)
+
+    assert 25 < (returns.returns[1].julian_day - returns.returns[0].julian_day) < 30
+
+
+def test_create_sidereal_solar_return_charts():
+    """
+    Tests that sidereal solar returns are to the natal sidereal sun, accounting for precession since birth.
+    """
+    settings = SettingsSchema(sidereal_ayanamsa=Ayanamsa.lahiri)
+    natal_chart = create_chart(settings.copy(update={"events": [tim_natal]})).charts[0]
+    returns = create_returns(ReturnSettingsSchema(
+        event=tim_natal,
+        start_date=datetime(2037, 1, 1, tzinfo=timezone.utc),
+        count=1,
+        settings=settings,
+    ))
+
+    assert returns.natal_longitude == pytest.approx(natal_chart.points[Point.sun].longitude)
+    assert returns.returns[0].chart.charts[0].points[Point.sun].longitude == \
+        pytest.approx(returns.natal_longitude, abs=0.001)
+
+
+def test_find_return_julian_days__after_start():
+    """
+    Tests that the first return is found after the start, even when the start is just after a return.
+    """
+    sun_id = point_traits.points[Point.sun].swe_id
+    start_day = get_julian_day(datetime(2000, 1, 1))
+    longitude = get_longitude_and_velocity(start_day - 0.01, sun_id)[0]
+    days = find_return_julian_days(sun_id, longitude, start_day, 365.242189, 2)
+
+    assert days[0] > start_day
+    assert days[0] - start_day == pytest.approx(365.25, abs=0.1)
@@ -0,0 +1,63 @@
+import json
+from array import array
+
+import msgpack
+from pydantic.json import pydantic_encoder
+
+from astro import create_chart
+from astro.schema import SettingsSchema, PointSchema
+from astro.serialize import serialize_schema, serialize_columns
+from astro.util import Point, create_field_mask
+from astro.util.test_events import tim_natal
+
+
+def test_serialize_schema__aliases():
+    """
+    Tests that schemas are serialized with camel cased aliases and enum values.
+    """
+    point = PointSchema(name=Point.sun, points=[Point.sun], longitude=10, degrees_in_sign=10)
+    serialized = json.loads(serialize_schema({Point.sun: point}))
+
+    assert serialized["Sun"]["name"] == "Sun"
+    assert serialized["Sun"]["degreesInSign"] == 10
+    assert serialized["Sun"]["housesWholeSign"]["ruledHouses"] == []
+
+
+def test_serialize_schema__field_mask():
+    """
+    Tests that schemas are trimmed to the fields in a field mask.
+    """
+    point = PointSchema(name=Point.sun, points=[Point.sun], longitude=10, degrees_in_sign=10)
+    field_mask = create_field_mask(["degreesInSign", "housesWholeSign.house"])
+    serialized = json.loads(serialize_schema({Point.sun: point}, field_mask))
+
+    assert serialized == {"Sun": {"degreesInSign": 10, "housesWholeSign": {"house": None}}}
+
+
+def test_serialize_schema__chart():
+    """
+    Tests that a full chart serializes to the same JSON as pydantic's encoder.
+    """
+    chart = create_chart(SettingsSchema(events=[tim_natal]))
+    expected = json.loads(json.dumps(chart.dict(by_alias=True), default=pydantic_encoder))
+
+    assert json.loads(serialize_schema(chart)) == expected
+
+
+def test_serialize_columns():
+    """
+    Tests that charts are serialized to typed columns.
+    """
+    chart = create_chart(SettingsSchema(events=[tim_natal]))
+    serialized = msgpack.unpackb(serialize_columns(chart))
+    points = serialized["charts"][0]["points"]
+    relationships = serialized["relationships"][0]
+    longitudes = array("d", points["longitude"])
+    signs = array("b", points["sign"])
+    ecliptic_types = array("b", relationships["eclipticType"])
+    sun_index = points["name"].index(Point.sun)
+
+    assert longitudes[sun_index] == chart.charts[0].points[Point.sun].longitude
+    assert serialized["signs"][signs[sun_index]] == chart.charts[0].points[Point.sun].sign
+    assert serialized["aspectTypes"][ecliptic_types[0]] == chart.relationships[0].relationships[0].ecliptic_aspect.type
+    assert len(array("h", relationships["fromPoint"])) == len(chart.relationships[0].relationships)
@@ -0,0 +1,102 @@
+import pytest
+import swisseph as swe
+
+from astro import create_chart
+from astro.chart.point.ephemeris import get_julian_day
+from astro.collection import point_traits
+from astro.schema import SettingsSchema, EnabledPointsSchema, LotFormulaSchema
+from astro.util import Point, Ayanamsa, HouseSystem
+from astro.util.test_events import tim_natal
+
+
+def test_create_sidereal_chart():
+    """
+    Tests that a sidereal chart offsets every point and house cusp by the ayanamsa.
+    """
+    tropical = create_chart(SettingsSchema(events=[tim_natal])).charts[0]
+    sidereal = create_chart(SettingsSchema(events=[tim_natal], sidereal_ayanamsa=Ayanamsa.lahiri)).charts[0]
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    ayanamsa = swe.get_ayanamsa_ex_ut(get_julian_day(tim_natal.event.utc_date), 0)[1]
+
+    assert 23 < ayanamsa < 24
+
+    for name, point in tropical.points.items():
+        assert sidereal.points[name].longitude == pytest.approx((point.longitude - ayanamsa) % 360)
+        assert sidereal.points[name].declination == pytest.approx(point.declination)
+
+    for tropical_house, sidereal_house in zip(tropical.houses_secondary, sidereal.houses_secondary):
+        assert sidereal_house.from_longitude == pytest.approx((tropical_house.from_longitude - ayanamsa) % 360)
+
+    assert sidereal.houses_whole_sign[0].sign == sidereal.points[Point.ascendant].sign
+
+
+def test_create_sidereal_chart__matches_swisseph():
+    """
+    Tests that sidereal points match the sidereal positions calculated by swiss ephemeris, including nutation.
+    """
+    sidereal = create_chart(SettingsSchema(events=[tim_natal], sidereal_ayanamsa=Ayanamsa.lahiri)).charts[0]
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+
+    for point in [Point.sun, Point.moon, Point.mercury, Point.saturn]:
+        swe_id = point_traits.points[point].swe_id
+        longitude = swe.calc_ut(tim_natal.event.julian_day, swe_id, swe.FLG_SWIEPH | swe.FLG_SIDEREAL)[0][0]
+
+        assert sidereal.points[point].longitude == pytest.approx(longitude, abs=1e-8)
+
+
+def test_create_sidereal_chart__no_precession_correction():
+    """
+    Tests that relationships between sidereal charts have no precession correction.
+    """
+    later_event = tim_natal.copy(update={"event": tim_natal.event.copy(update={
+        "utc_date": tim_natal.event.utc_date.replace(year=2030)
+    })})
+    collection = create_chart(SettingsSchema(
+        events=[tim_natal, later_event],
+        sidereal_ayanamsa=Ayanamsa.fagan_bradley
+    ))
+    relationships = collection.relationships[2].relationships
+
+    assert len(relationships) > 0
+    assert all(relationship.precession_correction == 0 for relationship in relationships)
+
+
+def test_create_sidereal_chart__custom_lots():
+    """
+    Tests that sidereal custom lots are evaluated from the sidereal points and house cusps.
+    """
+    event = tim_natal.copy(update={"enabled": [EnabledPointsSchema(
+        points=[Point.ascendant, Point.sun, Point.moon],
+        lots=[
+            LotFormulaSchema(name="Lot of Debt", formula="Sun + Moon", reverse_at_night=False),
+            LotFormulaSchema(name="Lot of Cusps", formula="Sun - Cusp 3", reverse_at_night=False),
+        ],
+    )]})
+    sidereal = create_chart(SettingsSchema(
+        events=[event],
+        sidereal_ayanamsa=Ayanamsa.lahiri,
+        secondary_house_system=HouseSystem.whole_sign
+    )).charts[0]
+    points = sidereal.points
+
+    assert points["Lot of Debt"].longitude == \
+        pytest.approx((points[Point.sun].longitude + points[Point.moon].longitude) % 360)
+    assert points["Lot of Cusps"].longitude == \
+        pytest.approx((points[Point.sun].longitude - sidereal.houses_whole_sign[2].from_longitude) % 360)
+
+
+def test_create_sidereal_chart__compared_whole_sign_houses():
+    """
+    Tests that compared whole sign houses fall on the sign boundaries of the sidereal zodiac.
+    """
+    sidereal = create_chart(SettingsSchema(
+        events=[tim_natal],
+        sidereal_ayanamsa=Ayanamsa.lahiri,
+        secondary_house_system=HouseSystem.placidus,
+        compare_house_systems=[HouseSystem.whole_sign]
+    )).charts[0]
+    compared_houses = sidereal.houses_comparison[HouseSystem.whole_sign]
+
+    assert [house.from_longitude for house in compared_houses] == \
+        [house.from_longitude for house in sidereal.houses_whole_sign]
+    assert [house.sign for house in compared_houses] == [house.sign for house in sidereal.houses_whole_sign]
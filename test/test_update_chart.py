@@ -0,0 +1,120 @@
+from datetime import timedelta
+
+import pytest
+
+from astro import create_chart
+from astro.schema import SettingsSchema, EventSettingsSchema
+from astro.util import Point, Ayanamsa
+from astro.util.test_events import tim_natal
+
+
+def create_shifted_settings(minutes: float = 0, **kwargs) -> SettingsSchema:
+    """
+    Creates settings for tim's natal chart, with the birth time shifted by some minutes.
+
+    :param minutes: The minutes to shift the birth time by.
+    :param kwargs: Any other settings.
+
+    :return: The settings for the shifted chart.
+    """
+    event_settings = tim_natal.copy(deep=True)
+    event = event_settings.event
+    event.local_date = event.local_date + timedelta(minutes=minutes)
+    event.utc_date = event.utc_date + timedelta(minutes=minutes)
+
+    return SettingsSchema(events=[EventSettingsSchema(**event_settings.dict())], **kwargs)
+
+
+def test_update_chart_reuses_slow_points():
+    """
+    Tests that bodies moving less than the tolerance are reused, while the moon and angles are recalculated.
+    """
+    previous = create_chart(create_shifted_settings())
+    updated = create_chart(create_shifted_settings(4), previous)
+    previous_points, updated_points = previous.charts[0].points, updated.charts[0].points
+
+    assert updated_points[Point.sun].longitude == previous_points[Point.sun].longitude
+    assert updated_points[Point.saturn].longitude == previous_points[Point.saturn].longitude
+    assert updated_points[Point.moon].longitude != previous_points[Point.moon].longitude
+    assert updated_points[Point.ascendant].longitude != previous_points[Point.ascendant].longitude
+
+
+def test_update_chart_reuses_unchanged_relationships():
+    """
+    Tests that relationships between unchanged points are reused, and the rest are recalculated.
+    """
+    previous = create_chart(create_shifted_settings())
+    updated = create_chart(create_shifted_settings(4), previous)
+
+    def find_relationship(charts, from_point, to_point):
+        for relationship in charts.relationships[0].relationships:
+            if relationship.from_point == from_point and relationship.to_point == to_point:
+                return relationship
+
+    assert find_relationship(updated, Point.sun, Point.mercury) \
+        is find_relationship(previous, Point.sun, Point.mercury)
+    assert find_relationship(updated, Point.moon, Point.sun) \
+        is not find_relationship(previous, Point.moon, Point.sun)
+
+
+def test_update_chart_without_tolerance():
+    """
+    Tests that an update with no tolerance matches a fully recalculated chart.
+    """
+    previous = create_chart(create_shifted_settings(incremental_tolerance=0))
+    updated = create_chart(create_shifted_settings(4, incremental_tolerance=0), previous)
+    recalculated = create_chart(create_shifted_settings(4, incremental_tolerance=0))
+
+    for name, point in recalculated.charts[0].points.items():
+        assert updated.charts[0].points[name].longitude == point.longitude
+
+    assert updated.relationships[0].relationships == recalculated.relationships[0].relationships
+
+
+def test_update_chart__sidereal():
+    """
+    Tests that reused sidereal points are not shifted by the ayanamsa twice.
+    """
+    previous = create_chart(create_shifted_settings(sidereal_ayanamsa=Ayanamsa.lahiri))
+    updated = create_chart(create_shifted_settings(4, sidereal_ayanamsa=Ayanamsa.lahiri), previous)
+    recalculated = create_chart(create_shifted_settings(4, sidereal_ayanamsa=Ayanamsa.lahiri))
+
+    for name, point in recalculated.charts[0].points.items():
+        assert updated.charts[0].points[name].longitude == pytest.approx(point.longitude, abs=1 / 60)
+
+
+def test_update_chart__chained():
+    """
+    Tests that chained updates stay within the tolerance of a fully recalculated chart,
+    since reused positions are compared to when they were calculated.
+    """
+    tolerance = 1 / 60
+    updated = create_chart(create_shifted_settings(incremental_tolerance=tolerance))
+
+    for step in range(1, 31):
+        updated = create_chart(create_shifted_settings(step * 10, incremental_tolerance=tolerance), updated)
+
+    recalculated = create_chart(create_shifted_settings(300, incremental_tolerance=tolerance))
+
+    for name, point in recalculated.charts[0].points.items():
+        assert updated.charts[0].points[name].longitude == pytest.approx(point.longitude, abs=tolerance)
+
+
+def test_update_chart__changed_orbs():
+    """
+    Tests that relationships are recalculated rather than reused when only the orbs change.
+    """
+    previous = create_chart(create_shifted_settings())
+    settings = create_shifted_settings()
+
+    for enabled in settings.events[0].enabled:
+        enabled.orbs = enabled.orbs.copy(update={
+            name: orb / 2 for name, orb in enabled.orbs.dict().items()
+        })
+
+    updated = create_chart(settings, previous)
+    recalculated = create_chart(settings)
+
+    assert updated.relationship_settings_hash != previous.relationship_settings_hash
+    assert updated.relationships[0].relationships == recalculated.relationships[0].relationships
+    assert updated.relationships[0].relationships != previous.relationships[0].relationships